@@ -74,6 +74,26 @@ class BrowserConfig:
         light_mode (bool): Disables certain background features for performance gains. Default: False.
         extra_args (list): Additional command-line arguments passed to the browser.
                            Default: [].
+        page_pool_size (int): Number of warm, reusable pages kept per browser context. 0 disables pooling
+                              and every crawl opens and closes its own page. Default: 0.
+        page_max_uses (int): Number of crawls a pooled page serves before it is closed and replaced.
+                             Default: 50.
+        browser_shards (int): Number of browser processes to launch. Contexts and pages are placed on the least
+                              loaded shard and a crashed shard is restarted. Ignored with use_managed_browser. Default: 1.
+        max_contexts (int): Maximum number of browser contexts kept open across all shards. When a new config
+                            needs a context, the least recently used idle contexts are closed first. 0 means unbounded.
+                            Default: 32.
+        context_idle_ttl (float): Seconds a context may sit without open pages before it is closed. 0 disables
+                                  idle eviction. Default: 1800.
+        context_max_pages (int): Number of pages a context serves before it is retired and replaced by a fresh one,
+                                 which bounds memory leaked by long-lived contexts. 0 disables the budget. Default: 0.
+        subresource_cache (bool): If True, scripts, styles, fonts and images are served from an on-disk cache shared
+                                  by all contexts, shards and browser restarts, following Cache-Control. Default: False.
+        subresource_cache_dir (str or None): Directory of the subresource cache. Default: None (~/.crawl4ai/subresource_cache).
+        subresource_cache_size (int): Maximum size in bytes of the subresource cache; least recently used entries
+                                      are removed first. Default: 512 MB.
+        lazy_start (bool): If True, the browser is launched by the first crawl that needs it rather than by start(). raw: and
+                           file:// URLs without a screenshot never launch it. Default: True.
     """
 
     def __init__(
@@ -110,6 +130,16 @@ class BrowserConfig:
         text_mode: bool = False,
         light_mode: bool = False,
         extra_args: list = None,
+        page_pool_size: int = 0,
+        page_max_uses: int = 50,
+        browser_shards: int = 1,
+        max_contexts: int = 32,
+        context_idle_ttl: float = 1800,
+        context_max_pages: int = 0,
+        subresource_cache: bool = False,
+        subresource_cache_dir: str = None,
+        subresource_cache_size: int = 512 * 1024 * 1024,
+        lazy_start: bool = True,
         debugging_port: int = 9222,
         host: str = "localhost",
     ):
@@ -141,6 +171,16 @@ class BrowserConfig:
         self.text_mode = text_mode
         self.light_mode = light_mode
         self.extra_args = extra_args if extra_args is not None else []
+        self.page_pool_size = page_pool_size
+        self.page_max_uses = page_max_uses
+        self.browser_shards = browser_shards
+        self.max_contexts = max_contexts
+        self.context_idle_ttl = context_idle_ttl
+        self.context_max_pages = context_max_pages
+        self.subresource_cache = subresource_cache
+        self.subresource_cache_dir = subresource_cache_dir
+        self.subresource_cache_size = subresource_cache_size
+        self.lazy_start = lazy_start
         self.sleep_on_close = sleep_on_close
         self.verbose = verbose
         self.debugging_port = debugging_port
@@ -192,6 +232,16 @@ class BrowserConfig:
             text_mode=kwargs.get("text_mode", False),
             light_mode=kwargs.get("light_mode", False),
             extra_args=kwargs.get("extra_args", []),
+            page_pool_size=kwargs.get("page_pool_size", 0),
+            page_max_uses=kwargs.get("page_max_uses", 50),
+            browser_shards=kwargs.get("browser_shards", 1),
+            max_contexts=kwargs.get("max_contexts", 32),
+            context_idle_ttl=kwargs.get("context_idle_ttl", 1800),
+            context_max_pages=kwargs.get("context_max_pages", 0),
+            subresource_cache=kwargs.get("subresource_cache", False),
+            subresource_cache_dir=kwargs.get("subresource_cache_dir", None),
+            subresource_cache_size=kwargs.get("subresource_cache_size", 512 * 1024 * 1024),
+            lazy_start=kwargs.get("lazy_start", True),
         )
 
     def to_dict(self):
@@ -221,6 +271,16 @@ class BrowserConfig:
             "text_mode": self.text_mode,
             "light_mode": self.light_mode,
             "extra_args": self.extra_args,
+            "page_pool_size": self.page_pool_size,
+            "page_max_uses": self.page_max_uses,
+            "browser_shards": self.browser_shards,
+            "max_contexts": self.max_contexts,
+            "context_idle_ttl": self.context_idle_ttl,
+            "context_max_pages": self.context_max_pages,
+            "subresource_cache": self.subresource_cache,
+            "subresource_cache_dir": self.subresource_cache_dir,
+            "subresource_cache_size": self.subresource_cache_size,
+            "lazy_start": self.lazy_start,
             "sleep_on_close": self.sleep_on_close,
             "verbose": self.verbose,
             "debugging_port": self.debugging_port,
@@ -311,6 +371,14 @@ class CrawlerRunConfig:
                                 Default: False.
         delay_before_return_html (float): Delay in seconds before retrieving final HTML.
                                           Default: 0.1.
+        wait_for_network_quiet (bool): If True, wait until the page has no requests in flight and no DOM mutations for
+                                       network_quiet_window instead of sleeping delay_before_return_html and
+                                       screenshot_wait_for. Default: False.
+        network_quiet_window (float): Seconds the page must stay quiet for the wait to end. Default: 0.5.
+        network_quiet_timeout (float): Upper bound in seconds for the quiet wait. Domains that settled quickly before get a
+                                       shorter limit derived from their learned settle time. Default: 10.0.
+        network_quiet_max_inflight (int): Number of requests allowed in flight while still counting as quiet, for pages
+                                          that keep long-polling connections open. Default: 0.
         mean_delay (float): Mean base delay between requests when calling arun_many.
                             Default: 0.1.
         max_range (float): Max random additional delay range for requests in arun_many.
@@ -329,6 +397,14 @@ class CrawlerRunConfig:
                                Default: False.
         scroll_delay (float): Delay in seconds between scroll steps if scan_full_page is True.
                               Default: 0.2.
+        scan_mode (str): How scan_full_page scrolls. "in_page" runs the scroll loop inside the page and
+                         moves on as soon as lazy content settles, waiting at most scroll_delay per step;
+                         "stepwise" scrolls one viewport per round trip and always sleeps scroll_delay.
+                         Default: "in_page".
+        scan_time_budget (float or None): Maximum seconds spent scanning the page when scan_full_page
+                                          is True and scan_mode is "in_page". None for no limit, so
+                                          the scan reaches the bottom of the page like the "stepwise"
+                                          scan, which is never cut short. Default: None.
         process_iframes (bool): If True, attempts to process and inline iframe content.
                                 Default: False.
         remove_overlay_elements (bool): If True, remove overlays/popups before extracting HTML.
@@ -349,6 +425,12 @@ class CrawlerRunConfig:
                                              Default: None.
         screenshot_height_threshold (int): Threshold for page height to decide screenshot strategy.
                                            Default: SCREENSHOT_HEIGHT_TRESHOLD (from config, e.g. 20000).
+        screenshot_format (str): Image format of screenshots: "png", "jpeg" ("jpg" is accepted) or "webp".
+                                 Default: "png".
+        screenshot_quality (int): Quality (1-100) for jpeg and webp screenshots. Default: 80.
+        screenshot_dir (str or None): If set, screenshots are written to this directory under a name derived from
+                                      their SHA-256 and the path is returned as screenshot_path instead of base64 data.
+                                      Default: None.
         pdf (bool): Whether to generate a PDF of the page.
                     Default: False.
         image_description_min_word_threshold (int): Minimum words for image description extraction.
@@ -357,6 +439,10 @@ class CrawlerRunConfig:
                                      Default: IMAGE_SCORE_THRESHOLD (e.g., 3).
         exclude_external_images (bool): If True, exclude all external images from processing.
                                          Default: False.
+        probe_images (bool): If True, fetch the size and content type of each image with a HEAD request
+                             after scraping and set media file_size and content_type. Requests are
+                             cached and shared by all crawls of the crawler.
+                             Default: False.
 
         # Link and Domain Handling Parameters
         exclude_social_media_domains (list of str): List of domains to exclude for social media links.
@@ -367,6 +453,11 @@ class CrawlerRunConfig:
                                            Default: False.
         exclude_domains (list of str): List of specific domains to exclude from results.
                                        Default: [].
+        blocked_resource_types (list of str): Playwright resource types whose requests are aborted,
+                                              e.g. ["image", "font", "media"]. Default: [].
+        blocked_domains (list of str): Hosts whose requests are aborted, subdomains included.
+                                       TRACKER_DOMAINS (from config) lists common analytics, ad and
+                                       web font hosts. Default: [].
 
         # Debugging and Logging Parameters
         verbose (bool): Enable verbose logging.
@@ -423,6 +514,10 @@ class CrawlerRunConfig:
         wait_for: str = None,
         wait_for_images: bool = False,
         delay_before_return_html: float = 0.1,
+        wait_for_network_quiet: bool = False,
+        network_quiet_window: float = 0.5,
+        network_quiet_timeout: float = 10.0,
+        network_quiet_max_inflight: int = 0,
         mean_delay: float = 0.1,
         max_range: float = 0.3,
         semaphore_count: int = 5,
@@ -432,6 +527,8 @@ class CrawlerRunConfig:
         ignore_body_visibility: bool = True,
         scan_full_page: bool = False,
         scroll_delay: float = 0.2,
+        scan_mode: str = "in_page",
+        scan_time_budget: Optional[float] = None,
         process_iframes: bool = False,
         remove_overlay_elements: bool = False,
         simulate_user: bool = False,
@@ -442,15 +539,21 @@ class CrawlerRunConfig:
         screenshot: bool = False,
         screenshot_wait_for: float = None,
         screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD,
+        screenshot_format: str = "png",
+        screenshot_quality: int = 80,
+        screenshot_dir: str = None,
         pdf: bool = False,
         image_description_min_word_threshold: int = IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
         image_score_threshold: int = IMAGE_SCORE_THRESHOLD,
         exclude_external_images: bool = False,
+        probe_images: bool = False,
         # Link and Domain Handling Parameters
         exclude_social_media_domains: list = None,
         exclude_external_links: bool = False,
         exclude_social_media_links: bool = False,
         exclude_domains: list = None,
+        blocked_resource_types: list = None,
+        blocked_domains: list = None,
         # Debugging and Logging Parameters
         verbose: bool = True,
         log_console: bool = False,
@@ -499,6 +602,10 @@ class CrawlerRunConfig:
         self.wait_for = wait_for
         self.wait_for_images = wait_for_images
         self.delay_before_return_html = delay_before_return_html
+        self.wait_for_network_quiet = wait_for_network_quiet
+        self.network_quiet_window = network_quiet_window
+        self.network_quiet_timeout = network_quiet_timeout
+        self.network_quiet_max_inflight = network_quiet_max_inflight
         self.mean_delay = mean_delay
         self.max_range = max_range
         self.semaphore_count = semaphore_count
@@ -509,6 +616,8 @@ class CrawlerRunConfig:
         self.ignore_body_visibility = ignore_body_visibility
         self.scan_full_page = scan_full_page
         self.scroll_delay = scroll_delay
+        self.scan_mode = scan_mode
+        self.scan_time_budget = scan_time_budget
         self.process_iframes = process_iframes
         self.remove_overlay_elements = remove_overlay_elements
         self.simulate_user = simulate_user
@@ -520,10 +629,14 @@ class CrawlerRunConfig:
         self.screenshot = screenshot
         self.screenshot_wait_for = screenshot_wait_for
         self.screenshot_height_threshold = screenshot_height_threshold
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.screenshot_dir = screenshot_dir
         self.pdf = pdf
         self.image_description_min_word_threshold = image_description_min_word_threshold
         self.image_score_threshold = image_score_threshold
         self.exclude_external_images = exclude_external_images
+        self.probe_images = probe_images
 
         # Link and Domain Handling Parameters
         self.exclude_social_media_domains = (
@@ -532,6 +645,8 @@ class CrawlerRunConfig:
         self.exclude_external_links = exclude_external_links
         self.exclude_social_media_links = exclude_social_media_links
         self.exclude_domains = exclude_domains or []
+        self.blocked_resource_types = blocked_resource_types or []
+        self.blocked_domains = blocked_domains or []
 
         # Debugging and Logging Parameters
         self.verbose = verbose
@@ -566,6 +681,15 @@ class CrawlerRunConfig:
         if self.chunking_strategy is None:
             self.chunking_strategy = RegexChunking()
 
+        # Validate the screenshot format, accepting "jpg" for "jpeg"
+        self.screenshot_format = str(self.screenshot_format).lower()
+        if self.screenshot_format == "jpg":
+            self.screenshot_format = "jpeg"
+        if self.screenshot_format not in ("png", "jpeg", "webp"):
+            raise ValueError(
+                f"screenshot_format must be 'png', 'jpeg' or 'webp', got {screenshot_format!r}"
+            )
+
     @staticmethod
     def from_kwargs(kwargs: dict) -> "CrawlerRunConfig":
         return CrawlerRunConfig(
@@ -601,6 +725,10 @@ class CrawlerRunConfig:
             wait_for=kwargs.get("wait_for"),
             wait_for_images=kwargs.get("wait_for_images", False),
             delay_before_return_html=kwargs.get("delay_before_return_html", 0.1),
+            wait_for_network_quiet=kwargs.get("wait_for_network_quiet", False),
+            network_quiet_window=kwargs.get("network_quiet_window", 0.5),
+            network_quiet_timeout=kwargs.get("network_quiet_timeout", 10.0),
+            network_quiet_max_inflight=kwargs.get("network_quiet_max_inflight", 0),
             mean_delay=kwargs.get("mean_delay", 0.1),
             max_range=kwargs.get("max_range", 0.3),
             semaphore_count=kwargs.get("semaphore_count", 5),
@@ -610,6 +738,8 @@ class CrawlerRunConfig:
             ignore_body_visibility=kwargs.get("ignore_body_visibility", True),
             scan_full_page=kwargs.get("scan_full_page", False),
             scroll_delay=kwargs.get("scroll_delay", 0.2),
+            scan_mode=kwargs.get("scan_mode", "in_page"),
+            scan_time_budget=kwargs.get("scan_time_budget"),
             process_iframes=kwargs.get("process_iframes", False),
             remove_overlay_elements=kwargs.get("remove_overlay_elements", False),
             simulate_user=kwargs.get("simulate_user", False),
@@ -622,6 +752,9 @@ class CrawlerRunConfig:
             screenshot_height_threshold=kwargs.get(
                 "screenshot_height_threshold", SCREENSHOT_HEIGHT_TRESHOLD
             ),
+            screenshot_format=kwargs.get("screenshot_format", "png"),
+            screenshot_quality=kwargs.get("screenshot_quality", 80),
+            screenshot_dir=kwargs.get("screenshot_dir", None),
             pdf=kwargs.get("pdf", False),
             image_description_min_word_threshold=kwargs.get(
                 "image_description_min_word_threshold",
@@ -631,6 +764,7 @@ class CrawlerRunConfig:
                 "image_score_threshold", IMAGE_SCORE_THRESHOLD
             ),
             exclude_external_images=kwargs.get("exclude_external_images", False),
+            probe_images=kwargs.get("probe_images", False),
             # Link and Domain Handling Parameters
             exclude_social_media_domains=kwargs.get(
                 "exclude_social_media_domains", SOCIAL_MEDIA_DOMAINS
@@ -638,6 +772,8 @@ class CrawlerRunConfig:
             exclude_external_links=kwargs.get("exclude_external_links", False),
             exclude_social_media_links=kwargs.get("exclude_social_media_links", False),
             exclude_domains=kwargs.get("exclude_domains", []),
+            blocked_resource_types=kwargs.get("blocked_resource_types", []),
+            blocked_domains=kwargs.get("blocked_domains", []),
             # Debugging and Logging Parameters
             verbose=kwargs.get("verbose", True),
             log_console=kwargs.get("log_console", False),
@@ -681,6 +817,10 @@ class CrawlerRunConfig:
             "wait_for": self.wait_for,
             "wait_for_images": self.wait_for_images,
             "delay_before_return_html": self.delay_before_return_html,
+            "wait_for_network_quiet": self.wait_for_network_quiet,
+            "network_quiet_window": self.network_quiet_window,
+            "network_quiet_timeout": self.network_quiet_timeout,
+            "network_quiet_max_inflight": self.network_quiet_max_inflight,
             "mean_delay": self.mean_delay,
             "max_range": self.max_range,
             "semaphore_count": self.semaphore_count,
@@ -689,6 +829,8 @@ class CrawlerRunConfig:
             "ignore_body_visibility": self.ignore_body_visibility,
             "scan_full_page": self.scan_full_page,
             "scroll_delay": self.scroll_delay,
+            "scan_mode": self.scan_mode,
+            "scan_time_budget": self.scan_time_budget,
             "process_iframes": self.process_iframes,
             "remove_overlay_elements": self.remove_overlay_elements,
             "simulate_user": self.simulate_user,
@@ -698,14 +840,20 @@ class CrawlerRunConfig:
             "screenshot": self.screenshot,
             "screenshot_wait_for": self.screenshot_wait_for,
             "screenshot_height_threshold": self.screenshot_height_threshold,
+            "screenshot_format": self.screenshot_format,
+            "screenshot_quality": self.screenshot_quality,
+            "screenshot_dir": self.screenshot_dir,
             "pdf": self.pdf,
             "image_description_min_word_threshold": self.image_description_min_word_threshold,
             "image_score_threshold": self.image_score_threshold,
             "exclude_external_images": self.exclude_external_images,
+            "probe_images": self.probe_images,
             "exclude_social_media_domains": self.exclude_social_media_domains,
             "exclude_external_links": self.exclude_external_links,
             "exclude_social_media_links": self.exclude_social_media_links,
             "exclude_domains": self.exclude_domains,
+            "blocked_resource_types": self.blocked_resource_types,
+            "blocked_domains": self.blocked_domains,
             "verbose": self.verbose,
             "log_console": self.log_console,
             "stream": self.stream,
@@ -1,20 +1,25 @@
 import asyncio
 import base64
+import re
 import time
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Any, List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 import os
 import sys
 import shutil
 import tempfile
 import subprocess
+import aiohttp
+from urllib.parse import urlparse
 from playwright.async_api import Page, Error, BrowserContext
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 import hashlib
 import uuid
-from crawl4ai.js_snippet import load_js_script
+from crawl4ai.js_snippet import load_js_script, load_post_load_script
 from crawl4ai.crawlers.async_crawlers.models import CrawlResponse, AsyncCrawlResponse
 from .crawlers.async_crawlers.utils import get_error_context
 from .crawlers.async_crawlers.user_agent_generator import UserAgentGenerator
@@ -22,7 +27,8 @@ from .crawlers.async_crawlers.config import SCREENSHOT_HEIGHT_TRESHOLD, DOWNLOAD
 from .crawlers.async_crawlers.async_configs import BrowserConfig, CrawlerRunConfig
 from .crawlers.async_crawlers.async_logger import AsyncLogger
 from playwright_stealth import StealthConfig
-from .crawlers.async_crawlers.ssl_certificate import SSLCertificate
+from .ssl_certificate import SSLCertificateCache
+from .subresource_cache import SubresourceCache
 from .crawlers.async_crawlers.utils import get_home_folder, get_chromium_path
 from .crawlers.async_crawlers.user_agent_generator import ValidUAGenerator, OnlineUAGenerator
 
@@ -302,6 +308,296 @@ class ManagedBrowser:
                 )
 
 
+# File extensions never fetched in text mode
+TEXT_MODE_BLOCKED_EXTENSIONS = {
+    # Images
+    "jpg",
+    "jpeg",
+    "png",
+    "gif",
+    "webp",
+    "svg",
+    "ico",
+    "bmp",
+    "tiff",
+    "psd",
+    # Fonts
+    "woff",
+    "woff2",
+    "ttf",
+    "otf",
+    "eot",
+    # Styles
+    # 'css', 'less', 'scss', 'sass',
+    # Media
+    "mp4",
+    "webm",
+    "ogg",
+    "avi",
+    "mov",
+    "wmv",
+    "flv",
+    "m4v",
+    "mp3",
+    "wav",
+    "aac",
+    "m4a",
+    "opus",
+    "flac",
+    # Documents
+    "pdf",
+    "doc",
+    "docx",
+    "xls",
+    "xlsx",
+    "ppt",
+    "pptx",
+    # Archives
+    "zip",
+    "rar",
+    "7z",
+    "tar",
+    "gz",
+    # Scripts and data
+    "xml",
+    "swf",
+    "wasm",
+}
+
+# Resource types never fetched in text mode
+TEXT_MODE_BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+class RequestBlocker:
+    """
+    A single context-level route handler that aborts requests by resource type, by domain and,
+    in text mode, by file extension. Other requests fall through to any other route handlers.
+
+    Attributes:
+        resource_types (set): Playwright resource types to block, e.g. "image", "font", "media"
+        domains (set): Hosts to block; subdomains are blocked too
+        extensions (set): File extensions to block, without the dot
+    """
+
+    def __init__(self, resource_types=None, domains=None, extensions=None):
+        self.resource_types = set(resource_types or [])
+        self.domains = {d.lower().lstrip(".") for d in domains or []}
+        self.extensions = set(extensions or [])
+
+    @classmethod
+    def from_config(
+        cls, browser_config: BrowserConfig, crawlerRunConfig: CrawlerRunConfig = None
+    ) -> Optional["RequestBlocker"]:
+        """Build the blocker for a context, or return None if nothing is blocked."""
+        resource_types = set(getattr(crawlerRunConfig, "blocked_resource_types", None) or [])
+        domains = getattr(crawlerRunConfig, "blocked_domains", None) or []
+        extensions = set()
+        if browser_config.text_mode:
+            resource_types |= TEXT_MODE_BLOCKED_RESOURCE_TYPES
+            extensions = TEXT_MODE_BLOCKED_EXTENSIONS
+        if not (resource_types or domains or extensions):
+            return None
+        return cls(resource_types, domains, extensions)
+
+    def _blocked_host(self, host: str) -> bool:
+        # Check the host and each parent domain, e.g. a.b.com, b.com, com
+        labels = host.lower().split(".")
+        return any(".".join(labels[i:]) in self.domains for i in range(len(labels)))
+
+    @staticmethod
+    def _is_main_frame_navigation(request) -> bool:
+        # The crawled page itself is never blocked by domain, its iframes are
+        try:
+            return request.is_navigation_request() and request.frame.parent_frame is None
+        except Error:
+            return False
+
+    def should_block(self, request) -> bool:
+        """Return True if the request is blocked by resource type, domain or extension."""
+        if request.resource_type in self.resource_types:
+            return True
+        if not (self.domains or self.extensions):
+            return False
+        parsed = urlparse(request.url)
+        if (
+            self.domains
+            and parsed.hostname
+            and self._blocked_host(parsed.hostname)
+            and not self._is_main_frame_navigation(request)
+        ):
+            return True
+        if self.extensions:
+            extension = os.path.splitext(parsed.path)[1][1:].lower()
+            return extension in self.extensions
+        return False
+
+    async def handle(self, route):
+        """Route handler for context.route("**/*", ...)."""
+        if self.should_block(route.request):
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+
+
+class PagePool:
+    """
+    A bounded pool of warm pages for a single browser context.
+
+    Pages are checked out with acquire() and handed back with release(). Returned pages are
+    reset (navigated to about:blank, viewport and extra headers restored) and kept idle for
+    the next crawl, unless the pool is full, the page is closed, or it reached max_uses.
+
+    Attributes:
+        context (BrowserContext): The context pages are created from.
+        max_size (int): Maximum number of idle pages kept in the pool.
+        max_uses (int): Number of crawls after which a page is recycled instead of reused.
+        viewport (dict): Viewport restored on every reset.
+        idle (List[Page]): Pages ready to be checked out.
+        in_use (Dict[Page, int]): Checked out pages and their use count.
+        stats (Dict[str, int]): Counters for created, reused, recycled and discarded pages.
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        max_size: int,
+        max_uses: int = 50,
+        viewport: dict = None,
+        logger=None,
+    ):
+        self.context = context
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.viewport = viewport
+        self.logger = logger
+        self.idle: List[Page] = []
+        self.in_use: Dict[Page, int] = {}
+        self._uses: Dict[Page, int] = {}
+        self._lock = asyncio.Lock()
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "discarded": 0}
+
+    async def warm(self, count: int = None):
+        """Pre-create pages so the first crawls do not pay for page creation."""
+        count = self.max_size if count is None else min(count, self.max_size)
+        missing = count - len(self.idle)
+        if missing <= 0:
+            return
+        pages = await asyncio.gather(
+            *[self.context.new_page() for _ in range(missing)], return_exceptions=True
+        )
+        async with self._lock:
+            for page in pages:
+                if isinstance(page, Exception):
+                    continue
+                self.stats["created"] += 1
+                self._uses[page] = 0
+                self.idle.append(page)
+
+    async def acquire(self) -> Page:
+        """Check out an idle page, or create a new one if the pool is empty."""
+        async with self._lock:
+            while self.idle:
+                page = self.idle.pop()
+                if page.is_closed():
+                    self._uses.pop(page, None)
+                    self.stats["discarded"] += 1
+                    continue
+                self.stats["reused"] += 1
+                self.in_use[page] = self._uses.get(page, 0)
+                return page
+
+        page = await self.context.new_page()
+        async with self._lock:
+            self.stats["created"] += 1
+            self._uses[page] = 0
+            self.in_use[page] = 0
+        return page
+
+    async def release(self, page: Page):
+        """Return a page to the pool, resetting it or closing it when it cannot be reused."""
+        async with self._lock:
+            uses = self.in_use.pop(page, 0) + 1
+            self._uses[page] = uses
+            recycle = uses >= self.max_uses
+            keep = not recycle and len(self.idle) < self.max_size
+
+        if page.is_closed():
+            async with self._lock:
+                self._uses.pop(page, None)
+                self.stats["discarded"] += 1
+            return
+
+        if keep:
+            try:
+                await self._reset(page)
+                async with self._lock:
+                    if len(self.idle) < self.max_size:
+                        self.idle.append(page)
+                        return
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(
+                        message="Failed to reset pooled page: {error}",
+                        tag="POOL",
+                        params={"error": str(e)},
+                    )
+
+        async with self._lock:
+            self._uses.pop(page, None)
+            self.stats["recycled" if recycle else "discarded"] += 1
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def _reset(self, page: Page):
+        """Bring a used page back to a neutral state."""
+        await page.goto("about:blank")
+        await page.set_extra_http_headers({})
+        if self.viewport and page.viewport_size != self.viewport:
+            await page.set_viewport_size(self.viewport)
+
+    def owns(self, page: Page) -> bool:
+        return page in self.in_use
+
+    def metrics(self) -> Dict[str, int]:
+        """Return current pool size and lifetime counters."""
+        return {
+            "idle": len(self.idle),
+            "in_use": len(self.in_use),
+            "max_size": self.max_size,
+            **self.stats,
+        }
+
+    async def close(self):
+        """Close every page owned by the pool."""
+        async with self._lock:
+            pages = self.idle + list(self.in_use.keys())
+            self.idle = []
+            self.in_use = {}
+            self._uses = {}
+        for page in pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+
+
+@dataclass
+class ContextUsage:
+    """Bookkeeping for one entry of BrowserManager.contexts_by_config."""
+
+    key: str
+    context: BrowserContext
+    pool: Optional[PagePool] = None
+    shard: int = 0
+    created_at: float = 0.0
+    last_used: float = 0.0
+    pages_served: int = 0
+    active: int = 0
+    retired: bool = False
+
+
 class BrowserManager:
     """
     Manages the browser instance and context.
@@ -315,6 +611,11 @@ class BrowserManager:
         playwright (Playwright): The Playwright instance
         sessions (dict): Dictionary to store session information
         session_ttl (int): Session timeout in seconds
+        contexts_by_config (OrderedDict): Contexts keyed by config signature, least recently used first
+        page_pools (dict): Warm page pools keyed by config signature, when page_pool_size > 0
+        browsers (List[Browser]): Browser shards when browser_shards > 1; browsers[0] is also `browser`
+        shard_load (List[int]): Number of open pages per browser shard
+        subresource_cache (SubresourceCache): Disk cache shared by all contexts, when subresource_cache is on
     """
 
     def __init__(self, browser_config: BrowserConfig, logger=None):
@@ -338,9 +639,33 @@ class BrowserManager:
         self.sessions = {}
         self.session_ttl = 1800  # 30 minutes
 
-        # Keep track of contexts by a "config signature," so each unique config reuses a single context
-        self.contexts_by_config = {}
-        self._contexts_lock = asyncio.Lock() 
+        # Keep track of contexts by a "config signature," so each unique config reuses a single context.
+        # Ordered by last use so idle contexts can be evicted LRU-first (see _evict_contexts).
+        self.contexts_by_config: "OrderedDict[str, BrowserContext]" = OrderedDict()
+        self._contexts_lock = asyncio.Lock()
+        self.context_usage: Dict[str, ContextUsage] = {}
+        self._page_contexts: Dict[Page, ContextUsage] = {}
+        self._retired_contexts: List[ContextUsage] = []
+        self.context_stats = {"created": 0, "evicted": 0, "retired": 0}
+
+        # Warm page pools, one per entry in contexts_by_config
+        self.page_pools: Dict[str, PagePool] = {}
+
+        # Scripts, styles, fonts and images cached on disk, shared by every context and restart
+        self.subresource_cache = None
+        if self.config.subresource_cache:
+            self.subresource_cache = SubresourceCache(
+                cache_dir=self.config.subresource_cache_dir,
+                max_size=self.config.subresource_cache_size,
+                logger=self.logger,
+            )
+
+        # Browser shards. Contexts and pages are placed on the least loaded shard.
+        self.browsers = []
+        self.shard_load: List[int] = []
+        self._page_shards: Dict[Page, int] = {}
+        self._restart_tasks: Dict[int, asyncio.Task] = {}
+        self._closing = False
 
         # Initialize ManagedBrowser if needed
         if self.config.use_managed_browser:
@@ -392,18 +717,130 @@ class BrowserManager:
                 # )
             await self.setup_context(self.default_context)
         else:
-            browser_args = self._build_browser_args()
-
-            # Launch appropriate browser type
-            if self.config.browser_type == "firefox":
-                self.browser = await self.playwright.firefox.launch(**browser_args)
-            elif self.config.browser_type == "webkit":
-                self.browser = await self.playwright.webkit.launch(**browser_args)
-            else:
-                self.browser = await self.playwright.chromium.launch(**browser_args)
+            # Launch one browser per shard
+            num_shards = max(1, self.config.browser_shards)
+            self.browsers = list(
+                await asyncio.gather(
+                    *[self._launch_browser(shard) for shard in range(num_shards)]
+                )
+            )
+            self.shard_load = [0] * num_shards
+            self.browser = self.browsers[0]
 
             self.default_context = self.browser
 
+    async def _launch_browser(self, shard: int):
+        """
+        Launch a browser for the given shard and watch it for crashes.
+
+        Args:
+            shard (int): Index of the shard the browser belongs to
+
+        Returns:
+            Browser: The launched browser
+        """
+        browser_args = self._build_browser_args()
+
+        # Launch appropriate browser type
+        if self.config.browser_type == "firefox":
+            browser = await self.playwright.firefox.launch(**browser_args)
+        elif self.config.browser_type == "webkit":
+            browser = await self.playwright.webkit.launch(**browser_args)
+        else:
+            browser = await self.playwright.chromium.launch(**browser_args)
+
+        browser.on("disconnected", lambda _: self._on_browser_disconnected(shard))
+        return browser
+
+    def _on_browser_disconnected(self, shard: int):
+        """Schedule a restart of a shard whose browser went away unexpectedly."""
+        if self._closing or shard in self._restart_tasks:
+            return
+        if self.logger:
+            self.logger.warning(
+                message="Browser shard {shard} disconnected, restarting it",
+                tag="BROWSER",
+                params={"shard": shard},
+            )
+        self._restart_tasks[shard] = asyncio.create_task(self._restart_shard(shard))
+
+    async def _restart_shard(self, shard: int):
+        """
+        Replace a crashed browser shard. Contexts, pools and sessions that lived on it are
+        dropped; crawls in flight on that shard fail individually while other shards keep going.
+
+        Args:
+            shard (int): Index of the shard to restart
+        """
+        try:
+            async with self._contexts_lock:
+                # Keys only carry the shard with several browsers, so match on the usage
+                for key in [
+                    key for key, usage in self.context_usage.items() if usage.shard == shard
+                ]:
+                    self.contexts_by_config.pop(key, None)
+                    self.page_pools.pop(key, None)
+                    del self.context_usage[key]
+                self._retired_contexts = [
+                    u for u in self._retired_contexts if u.shard != shard
+                ]
+                for page in [p for p, s in self._page_shards.items() if s == shard]:
+                    del self._page_shards[page]
+                    self._page_contexts.pop(page, None)
+                for sid in [
+                    sid
+                    for sid, (_, page, _) in self.sessions.items()
+                    if page.is_closed()
+                ]:
+                    del self.sessions[sid]
+                self.shard_load[shard] = 0
+
+            browser = await self._launch_browser(shard)
+            self.browsers[shard] = browser
+            if shard == 0:
+                self.browser = browser
+                self.default_context = browser
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    message="Failed to restart browser shard {shard}: {error}",
+                    tag="BROWSER",
+                    params={"shard": shard, "error": str(e)},
+                )
+        finally:
+            self._restart_tasks.pop(shard, None)
+
+    async def _pick_shard(self) -> int:
+        """
+        Return the index of the least loaded healthy shard, waiting for a restart if every
+        shard is currently down.
+        """
+        while True:
+            healthy = [
+                shard
+                for shard, browser in enumerate(self.browsers)
+                if shard not in self._restart_tasks and browser.is_connected()
+            ]
+            if healthy:
+                return min(healthy, key=lambda shard: self.shard_load[shard])
+            for shard, browser in enumerate(self.browsers):
+                if not browser.is_connected():
+                    self._on_browser_disconnected(shard)
+            if not self._restart_tasks:
+                raise RuntimeError("No browser shard available")
+            await asyncio.wait(
+                list(self._restart_tasks.values()), return_when=asyncio.FIRST_COMPLETED
+            )
+
+    def _shard_suffix(self, shard: int) -> str:
+        return f"#shard{shard}"
+
+    def _context_key(self, config_signature: str, shard: int) -> str:
+        """Key into contexts_by_config; unchanged from the plain signature with a single browser."""
+        if len(self.browsers) <= 1:
+            return config_signature
+        return config_signature + self._shard_suffix(shard)
+
     def _build_browser_args(self) -> dict:
         """Build browser launch arguments from config."""
         args = [
@@ -557,10 +994,17 @@ class BrowserManager:
             ):
                 await context.add_init_script(load_js_script("navigator_overrider"))        
 
-    async def create_browser_context(self, crawlerRunConfig: CrawlerRunConfig = None):
+    async def create_browser_context(
+        self, crawlerRunConfig: CrawlerRunConfig = None, browser=None
+    ):
         """
         Creates and returns a new browser context with configured settings.
-        Applies text-only mode settings if text_mode is enabled in config.
+        Applies text-only mode settings if text_mode is enabled in config, and installs a
+        RequestBlocker for text mode and the run's blocked_resource_types and blocked_domains.
+
+        Args:
+            crawlerRunConfig (CrawlerRunConfig): Run configuration, used for per-run proxy settings
+            browser (Browser): Browser to create the context in. Defaults to the primary browser.
 
         Returns:
             Context: Browser context object with the specified configurations
@@ -573,61 +1017,6 @@ class BrowserManager:
         }
         proxy_settings = {"server": self.config.proxy} if self.config.proxy else None
 
-        blocked_extensions = [
-            # Images
-            "jpg",
-            "jpeg",
-            "png",
-            "gif",
-            "webp",
-            "svg",
-            "ico",
-            "bmp",
-            "tiff",
-            "psd",
-            # Fonts
-            "woff",
-            "woff2",
-            "ttf",
-            "otf",
-            "eot",
-            # Styles
-            # 'css', 'less', 'scss', 'sass',
-            # Media
-            "mp4",
-            "webm",
-            "ogg",
-            "avi",
-            "mov",
-            "wmv",
-            "flv",
-            "m4v",
-            "mp3",
-            "wav",
-            "aac",
-            "m4a",
-            "opus",
-            "flac",
-            # Documents
-            "pdf",
-            "doc",
-            "docx",
-            "xls",
-            "xlsx",
-            "ppt",
-            "pptx",
-            # Archives
-            "zip",
-            "rar",
-            "7z",
-            "tar",
-            "gz",
-            # Scripts and data
-            "xml",
-            "swf",
-            "wasm",
-        ]
-
         # Common context settings
         context_settings = {
             "user_agent": user_agent,
@@ -662,13 +1051,17 @@ class BrowserManager:
             context_settings.update(text_mode_settings)
 
         # Create and return the context with all settings
-        context = await self.browser.new_context(**context_settings)
+        context = await (browser or self.browser).new_context(**context_settings)
 
-        # Apply text mode settings if enabled
-        if self.config.text_mode:
-            # Create and apply route patterns for each extension
-            for ext in blocked_extensions:
-                await context.route(f"**/*.{ext}", lambda route: route.abort())
+        # Handlers run in reverse order of registration: the blocker sees requests first and
+        # passes the ones it keeps on to the subresource cache.
+        if self.subresource_cache:
+            await context.route("**/*", self.subresource_cache.handle)
+
+        # One route handler for text mode and the per-run resource type and domain blocklists
+        blocker = RequestBlocker.from_config(self.config, crawlerRunConfig)
+        if blocker:
+            await context.route("**/*", blocker.handle)
         return context
 
     def _make_config_signature(self, crawlerRunConfig: CrawlerRunConfig) -> str:
@@ -730,17 +1123,21 @@ class BrowserManager:
             # Otherwise, check if we have an existing context for this config
             config_signature = self._make_config_signature(crawlerRunConfig)
 
-            async with self._contexts_lock:
-                if config_signature in self.contexts_by_config:
-                    context = self.contexts_by_config[config_signature]
-                else:
-                    # Create and setup a new context
-                    context = await self.create_browser_context(crawlerRunConfig)
-                    await self.setup_context(context, crawlerRunConfig)
-                    self.contexts_by_config[config_signature] = context
+            # Place the page on the least loaded shard, retrying elsewhere if that shard crashed
+            for attempt in range(len(self.browsers)):
+                shard = await self._pick_shard()
+                try:
+                    page, context = await self._get_page_on_shard(
+                        crawlerRunConfig, config_signature, shard
+                    )
+                    break
+                except Error:
+                    if self.browsers[shard].is_connected() or attempt == len(self.browsers) - 1:
+                        raise
+                    self._on_browser_disconnected(shard)
 
-            # Create a new page from the chosen context
-            page = await context.new_page()
+            self._page_shards[page] = shard
+            self.shard_load[shard] += 1
 
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
@@ -748,6 +1145,232 @@ class BrowserManager:
 
         return page, context
 
+    async def _get_page_on_shard(
+        self, crawlerRunConfig: CrawlerRunConfig, config_signature: str, shard: int
+    ):
+        """
+        Get a page from the context for this config on the given shard, creating the
+        context (and its page pool) first if needed.
+
+        Returns:
+            (page, context): The Page and its BrowserContext
+        """
+        context_key = self._context_key(config_signature, shard)
+
+        async with self._contexts_lock:
+            usage = self.context_usage.get(context_key)
+            if usage:
+                self.contexts_by_config.move_to_end(context_key)
+                await self._evict_contexts()
+            else:
+                # Make room before creating and setting up a new context
+                await self._evict_contexts(reserve=1)
+                context = await self.create_browser_context(
+                    crawlerRunConfig, browser=self.browsers[shard]
+                )
+                await self.setup_context(context, crawlerRunConfig)
+                pool = None
+                if self.config.page_pool_size > 0:
+                    pool = PagePool(
+                        context,
+                        max_size=self.config.page_pool_size,
+                        max_uses=self.config.page_max_uses,
+                        viewport={
+                            "width": self.config.viewport_width,
+                            "height": self.config.viewport_height,
+                        },
+                        logger=self.logger,
+                    )
+                    await pool.warm()
+                    self.page_pools[context_key] = pool
+                self.contexts_by_config[context_key] = context
+                usage = ContextUsage(
+                    key=context_key,
+                    context=context,
+                    pool=pool,
+                    shard=shard,
+                    created_at=time.time(),
+                )
+                self.context_usage[context_key] = usage
+                self.context_stats["created"] += 1
+
+            usage.active += 1
+            usage.pages_served += 1
+            usage.last_used = time.time()
+
+            # A context that used up its page budget takes no new pages; it is closed
+            # once the pages it already handed out are released.
+            if 0 < self.config.context_max_pages <= usage.pages_served:
+                del self.contexts_by_config[context_key]
+                self.page_pools.pop(context_key, None)
+                del self.context_usage[context_key]
+                usage.retired = True
+                self._retired_contexts.append(usage)
+                self.context_stats["retired"] += 1
+
+        try:
+            # Session pages live outside the pool since they are kept across crawls
+            if usage.pool and not crawlerRunConfig.session_id:
+                page = await usage.pool.acquire()
+            else:
+                page = await usage.context.new_page()
+        except Exception:
+            await self._release_context_slot(usage)
+            raise
+        self._page_contexts[page] = usage
+        return page, usage.context
+
+    async def _evict_contexts(self, reserve: int = 0):
+        """
+        Close idle contexts. Must be called with _contexts_lock held.
+
+        How it works:
+        1. Only contexts with no pages checked out are candidates.
+        2. Candidates unused for longer than context_idle_ttl are closed.
+        3. Least recently used candidates are closed until at most max_contexts - reserve remain.
+
+        Contexts with pages in use are never closed, so the count may briefly exceed max_contexts.
+
+        Args:
+            reserve (int): Number of slots to free for contexts about to be created.
+        """
+        now = time.time()
+        idle = [key for key in self.contexts_by_config if self.context_usage[key].active == 0]
+        ttl = self.config.context_idle_ttl
+        victims = [key for key in idle if ttl > 0 and now - self.context_usage[key].last_used > ttl]
+
+        if self.config.max_contexts > 0:
+            excess = len(self.contexts_by_config) - len(victims) - (self.config.max_contexts - reserve)
+            for key in idle:
+                if excess <= 0:
+                    break
+                if key not in victims:
+                    victims.append(key)
+                    excess -= 1
+
+        for key in victims:
+            del self.contexts_by_config[key]
+            self.page_pools.pop(key, None)
+            await self._close_context(self.context_usage.pop(key))
+            self.context_stats["evicted"] += 1
+
+    async def _release_context_slot(self, usage: ContextUsage):
+        """Mark one page of a context as released and close the context if it was retired and is now unused."""
+        usage.active = max(0, usage.active - 1)
+        usage.last_used = time.time()
+        if usage.retired and usage.active == 0 and usage in self._retired_contexts:
+            self._retired_contexts.remove(usage)
+            await self._close_context(usage)
+
+    async def _close_context(self, usage: ContextUsage):
+        """Close a context together with its page pool."""
+        try:
+            if usage.pool:
+                await usage.pool.close()
+            await usage.context.close()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    message="Error closing context: {error}",
+                    tag="ERROR",
+                    params={"error": str(e)},
+                )
+
+    def get_context_stats(self) -> Dict[str, int]:
+        """
+        Return context cache metrics.
+
+        Returns:
+            dict: Open, in-use and retired context counts plus created/evicted/retired counters.
+        """
+        return {
+            "open": len(self.contexts_by_config),
+            "in_use": sum(1 for u in self.context_usage.values() if u.active),
+            "retiring": len(self._retired_contexts),
+            **{f"total_{k}": v for k, v in self.context_stats.items()},
+        }
+
+    async def get_context_memory(self) -> Dict[str, float]:
+        """
+        Return the JS heap in use, in MB, of each open context that has a page.
+
+        Cross-site pages of a context can run in separate renderers, so the heap is read with
+        CDP Performance.getMetrics on every page, all pages at once, and summed per V8 isolate:
+        pages that share an isolate (Runtime.getIsolateId) are counted once. Pages whose browser
+        does not speak CDP are skipped.
+
+        Returns:
+            dict: JSHeapUsedSize in MB keyed by context key
+        """
+        reads = [
+            (key, self._get_page_heap(usage.context, page))
+            for key, usage in list(self.context_usage.items())
+            for page in list(usage.context.pages)
+        ]
+        heaps = await asyncio.gather(*(read for _, read in reads))
+        isolates: Dict[str, Dict[Any, float]] = {}
+        for (key, _), heap in zip(reads, heaps):
+            if heap is not None:
+                isolate, used = heap
+                isolates.setdefault(key, {})[isolate] = used
+        return {key: sum(used.values()) / (1024 * 1024) for key, used in isolates.items()}
+
+    async def _get_page_heap(
+        self, context: BrowserContext, page: Page
+    ) -> Optional[Tuple[Any, float]]:
+        """Return the V8 isolate of a page and its JSHeapUsedSize in bytes, None without CDP."""
+        try:
+            cdp = await context.new_cdp_session(page)
+            try:
+                await cdp.send("Performance.enable")
+                metrics = await cdp.send("Performance.getMetrics")
+                try:
+                    isolate = (await cdp.send("Runtime.getIsolateId"))["id"]
+                except Error:
+                    isolate = id(page)
+            finally:
+                await cdp.detach()
+        except Error:
+            return None
+        for metric in metrics.get("metrics", []):
+            if metric["name"] == "JSHeapUsedSize":
+                return isolate, metric["value"]
+        return None
+
+    def _untrack_page(self, page: Page):
+        """Remove a page from its shard's load count."""
+        shard = self._page_shards.pop(page, None)
+        if shard is not None and shard < len(self.shard_load):
+            self.shard_load[shard] = max(0, self.shard_load[shard] - 1)
+
+    async def release_page(self, page: Page):
+        """
+        Hand back a page obtained from get_page once a non-session crawl is done.
+        Pooled pages are reset and returned to their pool, other pages are closed.
+
+        Args:
+            page (Page): The page to release.
+        """
+        self._untrack_page(page)
+        usage = self._page_contexts.pop(page, None)
+        if usage and usage.pool and usage.pool.owns(page):
+            await usage.pool.release(page)
+        else:
+            await page.close()
+        if usage:
+            await self._release_context_slot(usage)
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return warm page pool metrics keyed by config signature.
+
+        Returns:
+            dict: For each pool, idle and in-use page counts plus created/reused/recycled/discarded counters.
+        """
+        return {
+            signature: pool.metrics() for signature, pool in self.page_pools.items()
+        }
+
     async def kill_session(self, session_id: str):
         """
         Kill a browser session and clean up resources.
@@ -757,8 +1380,13 @@ class BrowserManager:
         """
         if session_id in self.sessions:
             context, page, _ = self.sessions[session_id]
+            self._untrack_page(page)
+            usage = self._page_contexts.pop(page, None)
             await page.close()
-            if not self.config.use_managed_browser:
+            if usage:
+                # Shared contexts are closed by LRU eviction, not with the session
+                await self._release_context_slot(usage)
+            elif not self.config.use_managed_browser:
                 await context.close()
             del self.sessions[session_id]
 
@@ -775,6 +1403,7 @@ class BrowserManager:
 
     async def close(self):
         """Close all browser resources and clean up."""
+        self._closing = True
         if self.config.sleep_on_close:
             await asyncio.sleep(0.5)
 
@@ -782,17 +1411,31 @@ class BrowserManager:
         for session_id in session_ids:
             await self.kill_session(session_id)
 
-        # Now close all contexts we created. This reclaims memory from ephemeral contexts.
-        for ctx in self.contexts_by_config.values():
+        # Now close all contexts we created, with their page pools. This reclaims memory from ephemeral contexts.
+        for usage in list(self.context_usage.values()) + self._retired_contexts:
+            await self._close_context(usage)
+        self.contexts_by_config.clear()
+        self.context_usage.clear()
+        self.page_pools.clear()
+        self._retired_contexts.clear()
+        self._page_contexts.clear()
+
+        for task in list(self._restart_tasks.values()):
+            task.cancel()
+        self._restart_tasks.clear()
+
+        for browser in self.browsers[1:]:
             try:
-                await ctx.close()
+                await browser.close()
             except Exception as e:
                 self.logger.error(
-                    message="Error closing context: {error}",
+                    message="Error closing browser shard: {error}",
                     tag="ERROR",
                     params={"error": str(e)}
                 )
-        self.contexts_by_config.clear()
+        self.browsers = []
+        self.shard_load = []
+        self._page_shards.clear()
 
         if self.browser:
             await self.browser.close()
@@ -808,6 +1451,194 @@ class BrowserManager:
             self.playwright = None
 
 
+class NetworkQuietWaiter:
+    """
+    Waits until a page is quiet: at most max_inflight requests in flight and no DOM mutations
+    for a given window.
+
+    Requests are tracked through page events, so the listeners must be attached before
+    navigation. DOM mutations are watched in the page with dom_quiet.js.
+
+    Attributes:
+        page (Page): The page being watched
+        max_inflight (int): Requests allowed in flight while still counting as quiet
+        listeners (List[tuple]): (event, handler) pairs to register with page.on
+    """
+
+    # Long-lived connections that never finish
+    IGNORED_RESOURCE_TYPES = {"websocket", "eventsource"}
+
+    def __init__(self, page: Page, max_inflight: int = 0):
+        self.page = page
+        self.max_inflight = max_inflight
+        self._inflight = set()
+        self._last_activity = time.monotonic()
+        self.listeners = [
+            ("request", self._on_request),
+            ("requestfinished", self._on_request_done),
+            ("requestfailed", self._on_request_done),
+        ]
+
+    def _on_request(self, request):
+        if request.resource_type in self.IGNORED_RESOURCE_TYPES:
+            return
+        self._inflight.add(request)
+        self._last_activity = time.monotonic()
+
+    def _on_request_done(self, request):
+        if request in self._inflight:
+            self._inflight.discard(request)
+            self._last_activity = time.monotonic()
+
+    def network_quiet_for(self) -> float:
+        """Seconds the network has been quiet, 0 if too many requests are in flight."""
+        if len(self._inflight) > self.max_inflight:
+            return 0.0
+        return time.monotonic() - self._last_activity
+
+    async def wait(self, quiet_window: float, timeout: float) -> bool:
+        """
+        Wait for the page to be quiet for quiet_window seconds.
+
+        How it works:
+        1. Poll the request counters until the network has been quiet for quiet_window.
+        2. Wait in the page until the DOM has gone quiet_window without a mutation.
+        3. If requests started meanwhile, go back to 1.
+
+        Args:
+            quiet_window (float): Seconds the page must stay quiet
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            bool: True if the page went quiet, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            quiet_for = self.network_quiet_for()
+            if quiet_for < quiet_window:
+                await asyncio.sleep(min(max(quiet_window - quiet_for, 0.05), remaining))
+                continue
+
+            dom_quiet = await self.page.evaluate(
+                load_js_script("dom_quiet"),
+                {"quietWindow": quiet_window * 1000, "timeout": remaining * 1000},
+            )
+            if not dom_quiet:
+                return False
+            if self.network_quiet_for() >= quiet_window:
+                return True
+
+
+class DomainSettleTimes:
+    """
+    Learned settle time per domain, an exponentially weighted average of how long pages on
+    that domain took to go quiet. It sizes the next quiet wait on the same domain so pages
+    that never go quiet (beacons, polling) give up early where that is normal.
+
+    Attributes:
+        alpha (float): Weight of the newest observation
+        headroom (float): Multiple of the learned settle time allowed before giving up
+        max_domains (int): Domains remembered; the oldest entries are dropped first
+    """
+
+    def __init__(self, alpha: float = 0.3, headroom: float = 3.0, max_domains: int = 10000):
+        self.alpha = alpha
+        self.headroom = headroom
+        self.max_domains = max_domains
+        self._settle_times: Dict[str, float] = {}
+
+    def get(self, url: str) -> Optional[float]:
+        """Return the learned settle time in seconds for the domain of url, if any."""
+        return self._settle_times.get(urlparse(url).netloc)
+
+    def timeout_for(self, url: str, quiet_window: float, max_timeout: float) -> float:
+        """Return how long to wait for the page at url to go quiet."""
+        learned = self.get(url)
+        if learned is None:
+            return max_timeout
+        return min(max_timeout, max(learned * self.headroom, quiet_window * 2))
+
+    def record(self, url: str, seconds: float):
+        """Fold an observed settle time for the domain of url into its average."""
+        domain = urlparse(url).netloc
+        previous = self._settle_times.pop(domain, None)
+        self._settle_times[domain] = (
+            seconds
+            if previous is None
+            else self.alpha * seconds + (1 - self.alpha) * previous
+        )
+        if len(self._settle_times) > self.max_domains:
+            del self._settle_times[next(iter(self._settle_times))]
+
+
+# Tallest page Chromium captures in one Page.captureScreenshot call; taller pages are stitched
+CDP_SCREENSHOT_MAX_HEIGHT = 16384
+
+SCREENSHOT_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+
+def encode_image(img: Image.Image, image_format: str = "png", quality: int = 80) -> bytes:
+    """Encode a PIL image as png, jpeg or webp."""
+    buffered = BytesIO()
+    if image_format == "png":
+        img.save(buffered, format="PNG")
+    else:
+        img.convert("RGB").save(buffered, format=image_format.upper(), quality=quality)
+    return buffered.getvalue()
+
+
+def stitch_screenshots(segments: List[bytes], image_format: str = "png", quality: int = 80) -> bytes:
+    """
+    Stack screenshot segments top to bottom and encode the result. CPU heavy for tall pages,
+    so it is run in a worker thread.
+    """
+    images = [Image.open(BytesIO(segment)).convert("RGB") for segment in segments]
+    stitched = Image.new("RGB", (images[0].width, sum(img.height for img in images)))
+    offset = 0
+    for img in images:
+        stitched.paste(img, (0, offset))
+        offset += img.height
+    return encode_image(stitched, image_format, quality)
+
+
+def error_screenshot(error_message: str, image_format: str = "png", quality: int = 80) -> bytes:
+    """
+    Render an error message as a black image, returned in place of a failed screenshot. It is
+    encoded in the format requested for the screenshot, so it matches the file extension.
+    """
+    img = Image.new("RGB", (800, 600), color="black")
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+    draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
+    return encode_image(img, image_format, quality)
+
+
+def write_content_addressed(data: bytes, directory: str, extension: str) -> str:
+    """
+    Write data to directory/<sha256>.<extension>, unless that file already exists.
+
+    Returns:
+        str: Path of the file
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{hashlib.sha256(data).hexdigest()}.{extension}")
+    if not os.path.exists(path):
+        # Write to a temporary name first so readers never see a partial file
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return path
+
+
+def b64encode_str(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
 class AsyncCrawlerStrategy(ABC):
     """
     Abstract base class for crawler strategies.
@@ -859,11 +1690,25 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                                           If None, will be created from kwargs for backwards compatibility.
             logger: Logger instance for recording events and errors.
             **kwargs: Additional arguments for backwards compatibility and extending functionality.
+                      ssl_certificate_cache (SSLCertificateCache) shares certificate lookups
+                      between strategies.
         """
         # Initialize browser config, either from provided object or kwargs
         self.browser_config = browser_config or BrowserConfig.from_kwargs(kwargs)
         self.logger = logger
 
+        # Certificates are fetched once per host rather than once per URL
+        self.ssl_certificate_cache = (
+            kwargs.get("ssl_certificate_cache") or SSLCertificateCache()
+        )
+
+        # How long pages of each domain took to go quiet, see wait_for_network_quiet
+        self.settle_times = kwargs.get("settle_times") or DomainSettleTimes()
+
+        # Screenshot stitching and encoding run here, off the event loop
+        self.screenshot_workers = kwargs.get("screenshot_workers", 2)
+        self._screenshot_executor = None
+
         # Initialize session management
         self._downloaded_files = []
 
@@ -884,6 +1729,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             browser_config=self.browser_config, logger=self.logger
         )
 
+        # With lazy_start the browser is launched by the first crawl that needs it
+        self._browser_started = False
+        self._browser_lock = asyncio.Lock()
+
     async def __aenter__(self):
         await self.start()
         return self
@@ -893,20 +1742,39 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
     async def start(self):
         """
-        Start the browser and initialize the browser manager.
+        Start the browser and initialize the browser manager. With browser_config.lazy_start
+        this is deferred to the first crawl that needs a browser.
         """
-        await self.browser_manager.start()
-        await self.execute_hook(
-            "on_browser_created",
-            self.browser_manager.browser,
-            context=self.browser_manager.default_context,
-        )
+        if not self.browser_config.lazy_start:
+            await self.ensure_browser()
+
+    async def ensure_browser(self):
+        """
+        Launch the browser if it is not running yet. Concurrent callers wait for the same launch.
+        """
+        if self._browser_started:
+            return
+        async with self._browser_lock:
+            if self._browser_started:
+                return
+            await self.browser_manager.start()
+            self._browser_started = True
+            await self.execute_hook(
+                "on_browser_created",
+                self.browser_manager.browser,
+                context=self.browser_manager.default_context,
+            )
 
     async def close(self):
         """
         Close the browser and clean up resources.
         """
-        await self.browser_manager.close()
+        if self._browser_started:
+            await self.browser_manager.close()
+            self._browser_started = False
+        if self._screenshot_executor:
+            self._screenshot_executor.shutdown(wait=False)
+            self._screenshot_executor = None
 
     async def kill_session(self, session_id: str):
         """
@@ -1180,7 +2048,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         Returns:
             str: The session ID.
         """
-        await self.start()
+        await self.ensure_browser()
 
         session_id = kwargs.get("session_id") or str(uuid.uuid4())
 
@@ -1211,6 +2079,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         response_headers = {}
         status_code = 200  # Default for local/raw HTML
         screenshot_data = None
+        screenshot_path = None
 
         if url.startswith(("http://", "https://")):
             return await self._crawl_web(url, config)
@@ -1222,34 +2091,71 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 raise FileNotFoundError(f"Local file not found: {local_file_path}")
             with open(local_file_path, "r", encoding="utf-8") as f:
                 html = f.read()
-            if config.screenshot:
-                screenshot_data = await self._generate_screenshot_from_html(html)
-            return AsyncCrawlResponse(
-                html=html,
-                response_headers=response_headers,
-                status_code=status_code,
-                screenshot=screenshot_data,
-                get_delayed_content=None,
-            )
 
         elif url.startswith("raw:") or url.startswith("raw://"):
             # Process raw HTML content
-            raw_html = url[4:] if url[:4] == "raw:" else url[7:]
-            html = raw_html
-            if config.screenshot:
-                screenshot_data = await self._generate_screenshot_from_html(html)
-            return AsyncCrawlResponse(
-                html=html,
-                response_headers=response_headers,
-                status_code=status_code,
-                screenshot=screenshot_data,
-                get_delayed_content=None,
-            )
+            html = url[4:] if url[:4] == "raw:" else url[7:]
+
         else:
             raise ValueError(
                 "URL must start with 'http://', 'https://', 'file://', or 'raw:'"
             )
 
+        # Only a screenshot needs the browser for local content
+        if config.screenshot:
+            screenshot_data, screenshot_path = await self._generate_screenshot_from_html(
+                html, config
+            )
+        return AsyncCrawlResponse(
+            html=html,
+            response_headers=response_headers,
+            status_code=status_code,
+            screenshot=screenshot_data,
+            screenshot_path=screenshot_path,
+            get_delayed_content=None,
+        )
+
+    async def _generate_screenshot_from_html(
+        self, html: str, config: CrawlerRunConfig
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Render local HTML in a page and screenshot it, launching the browser if needed.
+
+        Args:
+            html (str): The HTML to render
+            config (CrawlerRunConfig): Configuration with the screenshot options
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: The base64 screenshot, or the file path if
+            config.screenshot_dir is set
+        """
+        await self.ensure_browser()
+        page, _ = await self.browser_manager.get_page(crawlerRunConfig=config)
+        try:
+            await page.set_content(html, wait_until="load", timeout=config.page_timeout)
+            screenshot_bytes = await self.capture_screenshot(
+                page,
+                screenshot_format=config.screenshot_format,
+                screenshot_quality=config.screenshot_quality,
+                screenshot_height_threshold=config.screenshot_height_threshold,
+            )
+        finally:
+            if not config.session_id:
+                await self.browser_manager.release_page(page)
+
+        if config.screenshot_dir:
+            screenshot_path = await self._run_in_screenshot_worker(
+                write_content_addressed,
+                screenshot_bytes,
+                config.screenshot_dir,
+                SCREENSHOT_EXTENSIONS.get(config.screenshot_format, "png"),
+            )
+            return None, screenshot_path
+        screenshot_data = await self._run_in_screenshot_worker(
+            b64encode_str, screenshot_bytes
+        )
+        return screenshot_data, None
+
     async def _crawl_web(
         self, url: str, config: CrawlerRunConfig
     ) -> AsyncCrawlResponse:
@@ -1263,6 +2169,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         Returns:
             AsyncCrawlResponse: The response containing HTML, headers, status code, and optional data
         """
+        await self.ensure_browser()
+
         config.url = url
         response_headers = {}
         status_code = None
@@ -1295,6 +2203,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # Call hook after page creation
         await self.execute_hook("on_page_context_created", page, context=context, config=config)
 
+        # Listeners registered on the page, removed again before the page is released
+        page_listeners = []
+
         # Set up console logging if requested
         if config.log_console:
 
@@ -1314,23 +2225,79 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                         params={"msg": msg.text},
                     )
 
-            page.on("console", log_consol)
-            page.on("pageerror", lambda e: log_consol(e, "error"))
+            page_listeners.append(("console", log_consol))
+            page_listeners.append(("pageerror", lambda e: log_consol(e, "error")))
 
-        try:
-            # Get SSL certificate information if requested and URL is HTTPS
-            ssl_cert = None
-            if config.fetch_ssl_certificate:
-                ssl_cert = SSLCertificate.from_url(url)
+        # Count transferred and blocked requests for this crawl
+        network_stats = {
+            "requests": 0,
+            "transferred_bytes": 0,
+            "blocked_requests": 0,
+            "blocked_by_type": {},
+        }
+        blocker = RequestBlocker.from_config(self.browser_config, config)
+
+        def count_response(response):
+            network_stats["requests"] += 1
+
+        # Measured sizes, unlike Content-Length, cover chunked and compressed responses.
+        # They are read asynchronously and collected before the crawl returns.
+        size_tasks = set()
+
+        async def add_transferred_size(request):
+            try:
+                sizes = await request.sizes()
+            except Error:
+                return
+            network_stats["transferred_bytes"] += max(
+                0, sizes["responseHeadersSize"]
+            ) + max(0, sizes["responseBodySize"])
+
+        def count_finished_request(request):
+            task = asyncio.ensure_future(add_transferred_size(request))
+            size_tasks.add(task)
+            task.add_done_callback(size_tasks.discard)
+
+        def count_failed_request(request):
+            if blocker and blocker.should_block(request):
+                network_stats["blocked_requests"] += 1
+                by_type = network_stats["blocked_by_type"]
+                by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+
+        page_listeners.append(("response", count_response))
+        page_listeners.append(("requestfinished", count_finished_request))
+        page_listeners.append(("requestfailed", count_failed_request))
+
+        # Track requests from navigation on, for waits that end once the page is quiet
+        quiet_waiter = None
+        if config.wait_for_network_quiet:
+            quiet_waiter = NetworkQuietWaiter(page, config.network_quiet_max_inflight)
+            page_listeners.extend(quiet_waiter.listeners)
+
+        for event, listener in page_listeners:
+            page.on(event, listener)
+
+        # CDP sessions whose emulation overrides last for this crawl only
+        cdp_sessions = []
+
+        # Fetch the SSL certificate concurrently with navigation, collected before returning
+        ssl_cert_task = None
+        if config.fetch_ssl_certificate:
+            ssl_cert_task = asyncio.ensure_future(self.ssl_certificate_cache.get(url))
+
+        try:
 
             # Set up download handling
             if self.browser_config.accept_downloads:
-                page.on(
-                    "download",
-                    lambda download: asyncio.create_task(
-                        self._handle_download(download)
-                    ),
+                page_listeners.append(
+                    (
+                        "download",
+                        lambda download: asyncio.create_task(
+                            self._handle_download(download)
+                        ),
+                    )
                 )
+                page.on(*page_listeners[-1])
 
             # Handle page navigation and content loading
             if not config.js_only:
@@ -1369,33 +2336,29 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 status_code = 200
                 response_headers = {}
 
-            # Wait for body element and visibility
+            # Wait for a visible body, images and page dimensions in a single evaluation
+            load_images = not self.browser_config.text_mode and (
+                config.wait_for_images or config.adjust_viewport_to_content
+            )
+            ready_steps = {
+                "waitForBody": 30000,
+                "waitForImages": 1000 if load_images else 0,
+                "dimensions": config.adjust_viewport_to_content,
+            }
             try:
-                await page.wait_for_selector("body", state="attached", timeout=30000)
-
-                # Use the new check_visibility function with csp_compliant_wait
-                is_visible = await self.csp_compliant_wait(
-                    page,
-                    """() => {
-                        const element = document.body;
-                        if (!element) return false;
-                        const style = window.getComputedStyle(element);
-                        const isVisible = style.display !== 'none' && 
-                                        style.visibility !== 'hidden' && 
-                                        style.opacity !== '0';
-                        return isVisible;
-                    }""",
-                    timeout=30000,
-                )
-
-                if not is_visible and not config.ignore_body_visibility:
-                    visibility_info = await self.check_visibility(page)
-                    raise Error(f"Body element is hidden: {visibility_info}")
-
+                ready = await self.run_post_load_steps(page, **ready_steps)
             except Error:
-                visibility_info = await self.check_visibility(page)
+                # A client-side redirect destroys the execution context; retry once it settles
+                try:
+                    await page.wait_for_load_state("domcontentloaded")
+                    ready = await self.run_post_load_steps(page, **ready_steps)
+                except Error as e:
+                    ready = {"bodyVisible": False, "visibility": str(e)}
+
+            if not ready.get("bodyVisible"):
+                visibility_info = ready.get("visibility")
 
-                if self.config.verbose:
+                if self.browser_config.verbose:
                     self.logger.debug(
                         message="Body visibility info: {info}",
                         tag="DEBUG",
@@ -1405,72 +2368,16 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 if not config.ignore_body_visibility:
                     raise Error(f"Body element is hidden: {visibility_info}")
 
-            # try:
-            #     await page.wait_for_selector("body", state="attached", timeout=30000)
-
-            #     await page.wait_for_function(
-            #         """
-            #         () => {
-            #             const body = document.body;
-            #             const style = window.getComputedStyle(body);
-            #             return style.display !== 'none' &&
-            #                 style.visibility !== 'hidden' &&
-            #                 style.opacity !== '0';
-            #         }
-            #     """,
-            #         timeout=30000,
-            #     )
-            # except Error as e:
-            #     visibility_info = await page.evaluate(
-            #         """
-            #         () => {
-            #             const body = document.body;
-            #             const style = window.getComputedStyle(body);
-            #             return {
-            #                 display: style.display,
-            #                 visibility: style.visibility,
-            #                 opacity: style.opacity,
-            #                 hasContent: body.innerHTML.length,
-            #                 classList: Array.from(body.classList)
-            #             }
-            #         }
-            #     """
-            #     )
-
-            #     if self.config.verbose:
-            #         self.logger.debug(
-            #             message="Body visibility info: {info}",
-            #             tag="DEBUG",
-            #             params={"info": visibility_info},
-            #         )
-
-            #     if not config.ignore_body_visibility:
-            #         raise Error(f"Body element is hidden: {visibility_info}")
-
-            # Handle content loading and viewport adjustment
-            if not self.browser_config.text_mode and (
-                config.wait_for_images or config.adjust_viewport_to_content
-            ):
-                await page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(0.1)
-
-                # Check for image loading with improved error handling
-                images_loaded = await self.csp_compliant_wait(
-                    page,
-                    "() => Array.from(document.getElementsByTagName('img')).every(img => img.complete)",
-                    timeout=1000,
+            if load_images and not ready.get("imagesLoaded") and self.logger:
+                self.logger.warning(
+                    message="Some images failed to load within timeout",
+                    tag="SCRAPE",
                 )
 
-                if not images_loaded and self.logger:
-                    self.logger.warning(
-                        message="Some images failed to load within timeout",
-                        tag="SCRAPE",
-                    )
-
             # Adjust viewport if needed
             if not self.browser_config.text_mode and config.adjust_viewport_to_content:
                 try:
-                    dimensions = await self.get_page_dimensions(page)
+                    dimensions = ready.get("dimensions") or await self.get_page_dimensions(page)
                     page_height = dimensions["height"]
                     page_width = dimensions["width"]
                     # page_width = await page.evaluate(
@@ -1488,6 +2395,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
                     scale = min(target_width / page_width, target_height / page_height)
                     cdp = await page.context.new_cdp_session(page)
+                    cdp_sessions.append(cdp)
                     await cdp.send(
                         "Emulation.setDeviceMetricsOverride",
                         {
@@ -1507,7 +2415,12 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Handle full page scanning
             if config.scan_full_page:
-                await self._handle_full_page_scan(page, config.scroll_delay)
+                await self._handle_full_page_scan(
+                    page,
+                    config.scroll_delay,
+                    scan_mode=config.scan_mode,
+                    time_budget=config.scan_time_budget,
+                )
 
             # Execute JavaScript if provided
             # if config.js_code:
@@ -1551,37 +2464,40 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 except Exception as e:
                     raise RuntimeError(f"Wait condition failed: {str(e)}")
 
-            # Update image dimensions if needed
-            if not self.browser_config.text_mode:
-                update_image_dimensions_js = load_js_script("update_image_dimensions")
-                try:
-                    try:
-                        await page.wait_for_load_state("domcontentloaded", timeout=5)
-                    except PlaywrightTimeoutError:
-                        pass
-                    await page.evaluate(update_image_dimensions_js)
-                except Exception as e:
-                    self.logger.error(
-                        message="Error updating image dimensions: {error}",
-                        tag="ERROR",
-                        params={"error": str(e)},
-                    )
-
             # Process iframes if needed
             if config.process_iframes:
                 page = await self.process_iframes(page)
 
             # Pre-content retrieval hooks and delay
             await self.execute_hook("before_retrieve_html", page, context=context, config=config)
-            if config.delay_before_return_html:
+            if quiet_waiter:
+                await self.wait_for_network_quiet(quiet_waiter, url, config)
+            elif config.delay_before_return_html:
                 await asyncio.sleep(config.delay_before_return_html)
 
-            # Handle overlay removal
-            if config.remove_overlay_elements:
-                await self.remove_overlay_elements(page)
+            # Update image dimensions, remove overlays and get the final HTML in one evaluation
+            try:
+                final = await self.run_post_load_steps(
+                    page,
+                    updateImageDimensions=not self.browser_config.text_mode,
+                    removeOverlays=config.remove_overlay_elements,
+                    content=True,
+                )
+                for error in final["errors"]:
+                    self.logger.error(
+                        message="Error in post-load step: {error}",
+                        tag="ERROR",
+                        params={"error": error},
+                    )
+                html = final["html"]
+            except Error as e:
+                self.logger.warning(
+                    message="Post-load steps failed, reading content directly: {error}",
+                    tag="SCRAPE",
+                    params={"error": str(e)},
+                )
+                html = await page.content()
 
-            # Get final HTML content
-            html = await page.content()
             await self.execute_hook(
                 "before_return_html", page=page, html=html, context=context, config=config
             )
@@ -1594,14 +2510,31 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             if config.pdf:
                 pdf_data = await self.export_pdf(page)
 
+            screenshot_path = None
             if config.screenshot:
-                if config.screenshot_wait_for:
+                if quiet_waiter:
+                    await self.wait_for_network_quiet(quiet_waiter, url, config, learn=False)
+                elif config.screenshot_wait_for:
                     await asyncio.sleep(config.screenshot_wait_for)
-                screenshot_data = await self.take_screenshot(
-                    page, screenshot_height_threshold=config.screenshot_height_threshold
+                screenshot_bytes = await self.capture_screenshot(
+                    page,
+                    screenshot_format=config.screenshot_format,
+                    screenshot_quality=config.screenshot_quality,
+                    screenshot_height_threshold=config.screenshot_height_threshold,
                 )
+                if config.screenshot_dir:
+                    screenshot_path = await self._run_in_screenshot_worker(
+                        write_content_addressed,
+                        screenshot_bytes,
+                        config.screenshot_dir,
+                        SCREENSHOT_EXTENSIONS.get(config.screenshot_format, "png"),
+                    )
+                else:
+                    screenshot_data = await self._run_in_screenshot_worker(
+                        b64encode_str, screenshot_bytes
+                    )
 
-            if screenshot_data or pdf_data:
+            if screenshot_data or screenshot_path or pdf_data:
                 self.logger.info(
                     message="Exporting PDF and taking screenshot took {duration:.2f}s",
                     tag="EXPORT",
@@ -1610,6 +2543,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Define delayed content getter
             async def get_delayed_content(delay: float = 5.0) -> str:
+                # Without a session the page went back to the pool when the crawl returned
+                # and may show another crawl's DOM by now, so return what was captured
+                if not config.session_id:
+                    return html
                 self.logger.info(
                     message="Waiting for {delay} seconds before retrieving content for {url}",
                     tag="INFO",
@@ -1618,12 +2555,17 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 await asyncio.sleep(delay)
                 return await page.content()
 
+            ssl_cert = await ssl_cert_task if ssl_cert_task else None
+            if size_tasks:
+                await asyncio.wait(list(size_tasks), timeout=5)
+
             # Return complete response
             return AsyncCrawlResponse(
                 html=html,
                 response_headers=response_headers,
                 status_code=status_code,
                 screenshot=screenshot_data,
+                screenshot_path=screenshot_path,
                 pdf_data=pdf_data,
                 get_delayed_content=get_delayed_content,
                 ssl_certificate=ssl_cert,
@@ -1631,33 +2573,114 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                     self._downloaded_files if self._downloaded_files else None
                 ),
                 redirected_url=redirected_url,
+                network_stats=network_stats,
             )
 
         except Exception as e:
             raise e
 
         finally:
-            # If no session_id is given we should close the page
+            if ssl_cert_task and not ssl_cert_task.done():
+                ssl_cert_task.cancel()
+            for task in list(size_tasks):
+                task.cancel()
+
+            # Session pages are reused, so listeners of this crawl must not outlive it
+            for event, listener in page_listeners:
+                page.remove_listener(event, listener)
+            for cdp in cdp_sessions:
+                try:
+                    await cdp.send("Emulation.clearDeviceMetricsOverride")
+                    await cdp.detach()
+                except Error:
+                    pass
+
+            # If no session_id is given we should release the page (back to the pool, or closed)
             if not config.session_id:
-                await page.close()
+                await self.browser_manager.release_page(page)
+
+    async def wait_for_network_quiet(
+        self,
+        waiter: NetworkQuietWaiter,
+        url: str,
+        config: CrawlerRunConfig,
+        learn: bool = True,
+    ) -> bool:
+        """
+        Wait until the page is quiet, bounded by the settle time learned for the domain of url.
 
-    async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1):
+        Args:
+            waiter (NetworkQuietWaiter): Waiter attached to the page before navigation
+            url (str): The crawled URL, used to look up and update the learned settle time
+            config (CrawlerRunConfig): Supplies network_quiet_window and network_quiet_timeout
+            learn (bool): Whether to record how long this wait took for the domain
+
+        Returns:
+            bool: True if the page went quiet, False on timeout or error
+        """
+        timeout = self.settle_times.timeout_for(
+            url, config.network_quiet_window, config.network_quiet_timeout
+        )
+        start = time.monotonic()
+        try:
+            quiet = await waiter.wait(config.network_quiet_window, timeout)
+        except Error as e:
+            self.logger.warning(
+                message="Waiting for network quiet failed: {error}",
+                tag="WAIT",
+                params={"error": str(e)},
+            )
+            return False
+
+        if learn:
+            self.settle_times.record(url, time.monotonic() - start)
+        if not quiet:
+            self.logger.debug(
+                message="Page did not go quiet within {timeout:.2f}s: {url}",
+                tag="WAIT",
+                params={"timeout": timeout, "url": url},
+            )
+        return quiet
+
+    async def _handle_full_page_scan(
+        self,
+        page: Page,
+        scroll_delay: float = 0.1,
+        scan_mode: str = "stepwise",
+        time_budget: Optional[float] = None,
+    ):
         """
         Helper method to handle full page scanning.
 
         How it works:
-        1. Get the viewport height.
-        2. Scroll to the bottom of the page.
-        3. Get the total height of the page.
-        4. Scroll back to the top of the page.
-        5. Scroll to the bottom of the page again.
-        6. Continue scrolling until the bottom of the page is reached.
+        1. With scan_mode "in_page", run the whole scroll loop inside the page (see _scan_in_page),
+           bounded by time_budget. If that fails, fall back to the stepwise scan below.
+        2. Get the viewport height.
+        3. Scroll to the bottom of the page.
+        4. Get the total height of the page.
+        5. Scroll back to the top of the page.
+        6. Scroll to the bottom of the page again.
+        7. Continue scrolling until the bottom of the page is reached.
 
         Args:
             page (Page): The Playwright page object
             scroll_delay (float): The delay between page scrolls
+            scan_mode (str): "in_page" or "stepwise"
+            time_budget (Optional[float]): Maximum seconds the in-page scan may take, None for no
+                limit. The stepwise scan always reaches the bottom of the page.
 
         """
+        if scan_mode == "in_page":
+            try:
+                await self._scan_in_page(page, scroll_delay, time_budget)
+                return
+            except Error as e:
+                self.logger.warning(
+                    message="In-page scan failed, scrolling stepwise: {error}",
+                    tag="PAGE_SCAN",
+                    params={"error": str(e)},
+                )
+
         try:
             viewport_height = page.viewport_size.get(
                 "height", self.browser_config.viewport_height
@@ -1699,6 +2722,45 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             await self.safe_scroll(page, 0, total_height)
 
+    async def _scan_in_page(
+        self,
+        page: Page,
+        scroll_delay: float = 0.1,
+        time_budget: Optional[float] = None,
+        settle_time: float = 0.1,
+    ) -> Dict[str, Any]:
+        """
+        Scroll through the page with a single evaluation of lazy_load_scroller.js.
+
+        Each step waits until lazy content settles instead of a fixed delay: no DOM mutations
+        (MutationObserver) for settle_time and no image that scrolled into view
+        (IntersectionObserver) still loading, capped at scroll_delay per step.
+
+        Args:
+            page (Page): The Playwright page object
+            scroll_delay (float): Maximum wait per scroll step in seconds
+            time_budget (Optional[float]): Maximum seconds for the whole scan, None or 0 for no limit
+            settle_time (float): Quiet period in seconds after which a step counts as settled
+
+        Returns:
+            Dict[str, Any]: steps, height, pendingImages, timedOut and elapsed (ms) of the scan
+        """
+        result = await page.evaluate(
+            load_js_script("lazy_load_scroller"),
+            {
+                "scrollDelay": scroll_delay * 1000,
+                "timeBudget": (time_budget or 0) * 1000,
+                "settleTime": settle_time * 1000,
+            },
+        )
+        if result["timedOut"]:
+            self.logger.warning(
+                message="Full page scan stopped after {budget}s time budget",
+                tag="PAGE_SCAN",
+                params={"budget": time_budget},
+            )
+        return result
+
     async def _handle_download(self, download):
         """
         Handle file downloads.
@@ -1795,26 +2857,165 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         pdf_data = await page.pdf(print_background=True)
         return pdf_data
 
+    async def _run_in_screenshot_worker(self, fn, *args):
+        """Run a screenshot assembly or encoding function in the screenshot worker pool."""
+        if self._screenshot_executor is None:
+            self._screenshot_executor = ThreadPoolExecutor(
+                max_workers=self.screenshot_workers, thread_name_prefix="screenshot"
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._screenshot_executor, fn, *args
+        )
+
     async def take_screenshot(self, page, **kwargs) -> str:
         """
         Take a screenshot of the current page.
 
         Args:
             page (Page): The Playwright page object
-            kwargs: Additional keyword arguments
+            kwargs: Additional keyword arguments, passed to capture_screenshot
 
         Returns:
             str: The base64-encoded screenshot data
         """
-        need_scroll = await self.page_need_scroll(page)
+        screenshot = await self.capture_screenshot(page, **kwargs)
+        return await self._run_in_screenshot_worker(b64encode_str, screenshot)
 
-        if not need_scroll:
-            # Page is short enough, just take a screenshot
-            return await self.take_screenshot_naive(page)
-        else:
-            # Page is too long, try to take a full-page screenshot
-            return await self.take_screenshot_scroller(page, **kwargs)
-            # return await self.take_screenshot_from_pdf(await self.export_pdf(page))
+    async def capture_screenshot(
+        self,
+        page: Page,
+        screenshot_format: str = "png",
+        screenshot_quality: int = 80,
+        screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD,
+        **kwargs,
+    ) -> bytes:
+        """
+        Capture the whole page as an encoded image.
+
+        How it works:
+        1. If the page fits the viewport, take a plain screenshot.
+        2. On Chromium, capture beyond the viewport with CDP, which needs no stitching.
+        3. Otherwise scroll through the page and stitch the segments in a worker thread.
+
+        Args:
+            page (Page): The Playwright page object
+            screenshot_format (str): "png", "jpeg" or "webp"
+            screenshot_quality (int): Quality for jpeg and webp
+            screenshot_height_threshold (int): Maximum viewport height used when stitching
+
+        Returns:
+            bytes: The encoded image, or an error image if capturing failed
+        """
+        try:
+            if not await self.page_need_scroll(page):
+                if screenshot_format == "webp":
+                    # Playwright cannot encode webp itself
+                    segment = await page.screenshot(full_page=False)
+                    return await self._run_in_screenshot_worker(
+                        stitch_screenshots, [segment], screenshot_format, screenshot_quality
+                    )
+                return await page.screenshot(
+                    full_page=False,
+                    type=screenshot_format,
+                    quality=screenshot_quality if screenshot_format == "jpeg" else None,
+                )
+
+            if self.browser_config.browser_type == "chromium":
+                screenshot = await self._capture_beyond_viewport(
+                    page, screenshot_format, screenshot_quality
+                )
+                if screenshot:
+                    return screenshot
+
+            segments = await self._capture_segments(page, screenshot_height_threshold)
+            return await self._run_in_screenshot_worker(
+                stitch_screenshots, segments, screenshot_format, screenshot_quality
+            )
+        except Exception as e:
+            error_message = f"Failed to take screenshot: {str(e)}"
+            self.logger.error(
+                message="Screenshot failed: {error}",
+                tag="ERROR",
+                params={"error": error_message},
+            )
+            return await self._run_in_screenshot_worker(
+                error_screenshot, error_message, screenshot_format, screenshot_quality
+            )
+
+    async def _capture_beyond_viewport(
+        self, page: Page, screenshot_format: str, screenshot_quality: int
+    ) -> Optional[bytes]:
+        """
+        Capture the full page with Page.captureScreenshot and captureBeyondViewport, letting
+        Chromium render and encode it in one pass.
+
+        Returns:
+            Optional[bytes]: The encoded image, or None if the page is too tall or CDP failed
+        """
+        dimensions = await self.get_page_dimensions(page)
+        if dimensions["height"] > CDP_SCREENSHOT_MAX_HEIGHT:
+            return None
+
+        params = {
+            "format": screenshot_format,
+            "captureBeyondViewport": True,
+            "clip": {
+                "x": 0,
+                "y": 0,
+                "width": dimensions["width"],
+                "height": dimensions["height"],
+                "scale": 1,
+            },
+        }
+        if screenshot_format != "png":
+            params["quality"] = screenshot_quality
+
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            try:
+                result = await cdp.send("Page.captureScreenshot", params)
+            finally:
+                await cdp.detach()
+        except Error as e:
+            self.logger.warning(
+                message="Beyond-viewport screenshot failed, stitching instead: {error}",
+                tag="SCREENSHOT",
+                params={"error": str(e)},
+            )
+            return None
+        return await self._run_in_screenshot_worker(base64.b64decode, result["data"])
+
+    async def _capture_segments(
+        self, page: Page, screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD
+    ) -> List[bytes]:
+        """
+        Set a large viewport and screenshot the page one viewport at a time.
+
+        Returns:
+            List[bytes]: PNG segments from top to bottom
+        """
+        original_viewport = page.viewport_size
+        dimensions = await self.get_page_dimensions(page)
+        page_width = dimensions["width"]
+        page_height = dimensions["height"]
+
+        # Set a large viewport
+        large_viewport_height = min(page_height, screenshot_height_threshold)
+        await page.set_viewport_size({"width": page_width, "height": large_viewport_height})
+
+        try:
+            segments = []
+            viewport_height = page.viewport_size["height"]
+            num_segments = (page_height // viewport_height) + 1
+            for i in range(num_segments):
+                y_offset = i * viewport_height
+                await page.evaluate(f"window.scrollTo(0, {y_offset})")
+                await asyncio.sleep(0.01)  # wait for render
+                segments.append(await page.screenshot(full_page=False))
+            return segments
+        finally:
+            if original_viewport:
+                await page.set_viewport_size(original_viewport)
 
     async def take_screenshot_from_pdf(self, pdf_data: bytes) -> str:
         """
@@ -1857,8 +3058,6 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         Attempt to set a large viewport and take a full-page screenshot.
         If still too large, segment the page as before.
 
-        Requires pdf2image and poppler.
-
         Args:
             page (Page): The Playwright page object
             kwargs: Additional keyword arguments
@@ -1867,50 +3066,16 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             str: The base64-encoded screenshot data
         """
         try:
-            # Get page height
-            dimensions = await self.get_page_dimensions(page)
-            page_width = dimensions["width"]
-            page_height = dimensions["height"]
-            # page_height = await page.evaluate("document.documentElement.scrollHeight")
-            # page_width = await page.evaluate("document.documentElement.scrollWidth")
-
-            # Set a large viewport
-            large_viewport_height = min(
-                page_height,
+            segments = await self._capture_segments(
+                page,
                 kwargs.get("screenshot_height_threshold", SCREENSHOT_HEIGHT_TRESHOLD),
             )
-            await page.set_viewport_size(
-                {"width": page_width, "height": large_viewport_height}
+            screenshot = await self._run_in_screenshot_worker(
+                stitch_screenshots,
+                segments,
+                kwargs.get("screenshot_format", "png"),
+                kwargs.get("screenshot_quality", 80),
             )
-
-            # Page still too long, segment approach
-            segments = []
-            viewport_size = page.viewport_size
-            viewport_height = viewport_size["height"]
-
-            num_segments = (page_height // viewport_height) + 1
-            for i in range(num_segments):
-                y_offset = i * viewport_height
-                await page.evaluate(f"window.scrollTo(0, {y_offset})")
-                await asyncio.sleep(0.01)  # wait for render
-                seg_shot = await page.screenshot(full_page=False)
-                img = Image.open(BytesIO(seg_shot)).convert("RGB")
-                segments.append(img)
-
-            total_height = sum(img.height for img in segments)
-            stitched = Image.new("RGB", (segments[0].width, total_height))
-            offset = 0
-            for img in segments:
-                # stitched.paste(img, (0, offset))
-                stitched.paste(img.convert("RGB"), (0, offset))
-                offset += img.height
-
-            buffered = BytesIO()
-            stitched = stitched.convert("RGB")
-            stitched.save(buffered, format="BMP", quality=85)
-            encoded = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-            return encoded
         except Exception as e:
             error_message = f"Failed to take large viewport screenshot: {str(e)}"
             self.logger.error(
@@ -1919,15 +3084,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 params={"error": error_message},
             )
             # return error image
-            img = Image.new("RGB", (800, 600), color="black")
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
-            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
-        finally:
-            await page.close()
+            screenshot = await self._run_in_screenshot_worker(
+                error_screenshot,
+                error_message,
+                kwargs.get("screenshot_format", "png"),
+                kwargs.get("screenshot_quality", 80),
+            )
+        return await self._run_in_screenshot_worker(b64encode_str, screenshot)
 
     async def take_screenshot_naive(self, page: Page) -> str:
         """
@@ -1942,7 +3105,6 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         try:
             # The page is already loaded, just take the screenshot
             screenshot = await page.screenshot(full_page=False)
-            return base64.b64encode(screenshot).decode("utf-8")
         except Exception as e:
             error_message = f"Failed to take screenshot: {str(e)}"
             self.logger.error(
@@ -1952,16 +3114,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             )
 
             # Generate an error image
-            img = Image.new("RGB", (800, 600), color="black")
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
-            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
-
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
-        finally:
-            await page.close()
+            screenshot = await self._run_in_screenshot_worker(error_screenshot, error_message)
+        return await self._run_in_screenshot_worker(b64encode_str, screenshot)
 
     async def export_storage_state(self, path: str = None) -> dict:
         """
@@ -2318,6 +3472,27 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             )
             return {"success": False, "error": str(e)}
 
+    async def run_post_load_steps(self, page: Page, **steps) -> Dict[str, Any]:
+        """
+        Run several post-load steps with a single page evaluation instead of one round trip each.
+
+        Args:
+            page (Page): The Playwright page object
+            **steps: Steps to enable, all off by default:
+                waitForBody (int): Wait up to this many ms for a visible body; sets bodyVisible
+                                   and, when hidden, visibility.
+                waitForImages (int): Wait up to this many ms for images to complete; sets imagesLoaded.
+                dimensions (bool): Set dimensions to the page scroll width and height.
+                needScroll (bool): Set needScroll if the page is taller than the viewport.
+                updateImageDimensions (bool): Run update_image_dimensions.js.
+                removeOverlays (bool): Run remove_overlay_elements.js.
+                content (bool): Set html to the serialized page, like page.content().
+
+        Returns:
+            Dict[str, Any]: The results of the enabled steps, plus a list of step errors under "errors".
+        """
+        return await page.evaluate(load_post_load_script(), steps)
+
     async def get_page_dimensions(self, page: Page):
         """
         Get the dimensions of the page.
@@ -2365,3 +3540,332 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 params={"error": str(e)},
             )
             return True  # Default to scrolling if check fails
+
+
+# Markers that indicate a page is an empty client-side rendered shell
+SPA_ROOT_MARKERS = [
+    re.compile(
+        r'<div[^>]+id=["\'](?:root|app|__next|__nuxt|svelte|ember-app)["\'][^>]*>\s*</div>',
+        re.IGNORECASE,
+    ),
+    re.compile(r"<app-root[^>]*>\s*</app-root>", re.IGNORECASE),
+    re.compile(
+        r"<noscript[^>]*>[^<]*(?:enable|requires?)\s+javascript", re.IGNORECASE
+    ),
+]
+
+# Config options that can only be honoured by a real browser
+BROWSER_ONLY_OPTIONS = [
+    "js_code",
+    "wait_for",
+    "screenshot",
+    "pdf",
+    "scan_full_page",
+    "process_iframes",
+    "simulate_user",
+    "magic",
+    "remove_overlay_elements",
+    "adjust_viewport_to_content",
+    "session_id",
+]
+
+
+class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
+    """
+    Crawler strategy that fetches pages over a pooled HTTP client instead of a browser.
+
+    Static pages are returned straight from the HTTP response. The Playwright strategy is
+    only started (lazily) when a page looks like it needs JavaScript rendering, or when the
+    run config asks for something only a browser can do (screenshots, js_code, sessions...).
+
+    Attributes:
+        browser_config (BrowserConfig): Browser settings, used for headers, user agent and proxy,
+                                        and to build the fallback strategy.
+        logger (AsyncLogger): Logger instance for recording events and errors.
+        fallback_strategy (AsyncPlaywrightCrawlerStrategy): Strategy used for pages that need rendering.
+        max_connections (int): Total size of the connection pool.
+        max_connections_per_host (int): Per-host limit of the connection pool.
+        min_text_length (int): Minimum visible body text length below which a page is
+                               considered to need rendering.
+        stats (Dict[str, int]): Counters of pages served over HTTP vs. by the fallback.
+
+        Methods:
+            start(): Open the pooled HTTP session.
+            close(): Close the HTTP session and the fallback strategy if it was started.
+            crawl(url, config): Crawl a URL, falling back to the browser when needed.
+            needs_rendering(html): Heuristic deciding if the HTML needs a browser to render.
+    """
+
+    def __init__(
+        self,
+        browser_config: BrowserConfig = None,
+        logger: AsyncLogger = None,
+        fallback_strategy: Optional[AsyncCrawlerStrategy] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        min_text_length: int = 200,
+        **kwargs,
+    ):
+        """
+        Initialize the AsyncHTTPCrawlerStrategy.
+
+        Args:
+            browser_config (BrowserConfig): Configuration object containing browser settings.
+                                          If None, will be created from kwargs.
+            logger: Logger instance for recording events and errors.
+            fallback_strategy: Strategy used when rendering is needed. If None, an
+                               AsyncPlaywrightCrawlerStrategy is created on first use.
+            max_connections (int): Total size of the connection pool. Default: 100.
+            max_connections_per_host (int): Per-host limit of the connection pool. Default: 10.
+            min_text_length (int): Visible text length threshold for the rendering heuristic. Default: 200.
+            **kwargs: Additional arguments for backwards compatibility.
+        """
+        self.browser_config = browser_config or BrowserConfig.from_kwargs(kwargs)
+        self.logger = logger
+        self.fallback_strategy = fallback_strategy
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.min_text_length = min_text_length
+        self.session = None
+        self._fallback_started = False
+        self._fallback_lock = asyncio.Lock()
+        self.stats = {"http": 0, "fallback": 0}
+        self.ssl_certificate_cache = (
+            kwargs.get("ssl_certificate_cache") or SSLCertificateCache()
+        )
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        """
+        Open the pooled HTTP session. The browser is not started here.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                ttl_dns_cache=300,
+                ssl=False if self.browser_config.ignore_https_errors else None,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._build_headers(),
+            )
+
+    async def close(self):
+        """
+        Close the HTTP session and the fallback browser if it was started.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.fallback_strategy is not None and self._fallback_started:
+            await self.fallback_strategy.close()
+            self._fallback_started = False
+
+    def set_hook(self, hook_type: str, hook: Callable):
+        """
+        Set a hook on the fallback Playwright strategy. Hooks only run for pages that
+        are rendered by the browser.
+
+        Args:
+            hook_type (str): The type of the hook.
+            hook (Callable): The hook function to set.
+        """
+        self._get_fallback().set_hook(hook_type, hook)
+
+    def update_user_agent(self, user_agent: str):
+        """
+        Update the user agent for both the HTTP session and the fallback browser.
+
+        Args:
+            user_agent (str): The new user agent string.
+        """
+        self.browser_config.user_agent = user_agent
+        if self.session is not None:
+            self.session.headers["User-Agent"] = user_agent
+
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the default request headers from the browser config."""
+        headers = {
+            "User-Agent": self.browser_config.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+        headers.update(self.browser_config.headers or {})
+        return headers
+
+    def _get_fallback(self) -> AsyncCrawlerStrategy:
+        """Return the fallback strategy, creating it if needed (without starting it)."""
+        if self.fallback_strategy is None:
+            self.fallback_strategy = AsyncPlaywrightCrawlerStrategy(
+                browser_config=self.browser_config,
+                logger=self.logger,
+                ssl_certificate_cache=self.ssl_certificate_cache,
+            )
+        return self.fallback_strategy
+
+    async def _crawl_with_fallback(
+        self, url: str, config: CrawlerRunConfig, reason: str
+    ) -> AsyncCrawlResponse:
+        """Start the fallback strategy on first use and delegate the crawl to it."""
+        fallback = self._get_fallback()
+        async with self._fallback_lock:
+            if not self._fallback_started:
+                await fallback.start()
+                self._fallback_started = True
+
+        self.stats["fallback"] += 1
+        if self.logger:
+            self.logger.debug(
+                message="Rendering {url} in browser: {reason}",
+                tag="FETCH",
+                params={"url": url, "reason": reason},
+            )
+        return await fallback.crawl(url, config=config)
+
+    def _requires_browser(self, config: CrawlerRunConfig) -> Optional[str]:
+        """Return the name of the first browser-only option enabled in config, if any."""
+        for option in BROWSER_ONLY_OPTIONS:
+            if getattr(config, option, None):
+                return option
+        return None
+
+    def needs_rendering(self, html: str) -> bool:
+        """
+        Heuristic deciding whether the HTML needs a browser to render its content.
+
+        How it works:
+        1. Empty responses need rendering.
+        2. Known SPA root markers (empty #root/#app/#__next, <app-root>, "enable JavaScript"
+           noscript notices) need rendering.
+        3. Pages whose visible body text is shorter than min_text_length need rendering.
+
+        Args:
+            html (str): The HTML returned by the server.
+
+        Returns:
+            bool: True if the page should be rendered by the browser.
+        """
+        if not html or not html.strip():
+            return True
+
+        if any(marker.search(html) for marker in SPA_ROOT_MARKERS):
+            return True
+
+        body_match = re.search(r"<body[^>]*>(.*)</body>", html, re.IGNORECASE | re.DOTALL)
+        body = body_match.group(1) if body_match else html
+        body = re.sub(
+            r"<(script|style|noscript|template)[^>]*>.*?</\1>",
+            " ",
+            body,
+            flags=re.IGNORECASE | re.DOTALL,
+        )
+        text = re.sub(r"<[^>]+>", " ", body)
+        text = re.sub(r"\s+", " ", text).strip()
+        return len(text) < self.min_text_length
+
+    def _get_proxy(self, config: CrawlerRunConfig) -> Optional[str]:
+        """Resolve the proxy URL for this crawl, run config taking precedence."""
+        proxy_config = config.proxy_config or self.browser_config.proxy_config
+        if proxy_config and proxy_config.get("server"):
+            server = proxy_config["server"]
+            if proxy_config.get("username"):
+                scheme, _, host = server.partition("://")
+                server = f"{scheme}://{proxy_config['username']}:{proxy_config.get('password', '')}@{host}"
+            return server
+        return self.browser_config.proxy
+
+    async def crawl(
+        self, url: str, config: CrawlerRunConfig = None, **kwargs
+    ) -> AsyncCrawlResponse:
+        """
+        Crawls a URL over HTTP, falling back to the Playwright strategy when needed.
+
+        Args:
+            url (str): The URL to crawl. Supported prefixes:
+                - 'http://' or 'https://': Web URL to crawl.
+                - 'file://': Local file path to process.
+                - 'raw:' or 'raw://': Raw HTML content to process.
+            config (CrawlerRunConfig): Configuration object controlling the crawl behavior.
+
+        Returns:
+            AsyncCrawlResponse: The response containing HTML, headers and status code.
+        """
+        config = config or CrawlerRunConfig.from_kwargs(kwargs)
+
+        if url.startswith(("file://", "raw:")):
+            if config.screenshot:
+                return await self._crawl_with_fallback(url, config, "screenshot")
+            if url.startswith("file://"):
+                local_file_path = url[7:]
+                if not os.path.exists(local_file_path):
+                    raise FileNotFoundError(f"Local file not found: {local_file_path}")
+                with open(local_file_path, "r", encoding="utf-8") as f:
+                    html = f.read()
+            else:
+                html = url[6:] if url.startswith("raw://") else url[4:]
+            return AsyncCrawlResponse(
+                html=html,
+                response_headers={},
+                status_code=200,
+                get_delayed_content=None,
+            )
+        elif not url.startswith(("http://", "https://")):
+            raise ValueError(
+                "URL must start with 'http://', 'https://', 'file://', or 'raw:'"
+            )
+
+        browser_option = self._requires_browser(config)
+        if browser_option:
+            return await self._crawl_with_fallback(url, config, browser_option)
+
+        await self.start()
+        config.url = url
+        timeout = aiohttp.ClientTimeout(total=config.page_timeout / 1000)
+
+        # The fallback renders in the browser, so it runs only once the response is closed
+        # and its connection back in the pool, and outside the HTTP error handling
+        fallback_reason = None
+        try:
+            async with self.session.get(
+                url,
+                timeout=timeout,
+                proxy=self._get_proxy(config),
+                allow_redirects=True,
+            ) as response:
+                content_type = response.headers.get("Content-Type", "")
+                if "html" not in content_type and "xml" not in content_type:
+                    fallback_reason = f"content type {content_type or 'unknown'}"
+                else:
+                    html = await response.text(errors="replace")
+                    status_code = response.status
+                    response_headers = dict(response.headers)
+                    redirected_url = str(response.url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            fallback_reason = f"HTTP error {e!r}"
+
+        if fallback_reason:
+            return await self._crawl_with_fallback(url, config, fallback_reason)
+
+        if self.needs_rendering(html):
+            return await self._crawl_with_fallback(url, config, "JS rendering required")
+
+        ssl_cert = None
+        if config.fetch_ssl_certificate:
+            ssl_cert = await self.ssl_certificate_cache.get(url)
+
+        self.stats["http"] += 1
+        return AsyncCrawlResponse(
+            html=html,
+            response_headers=response_headers,
+            status_code=status_code,
+            get_delayed_content=None,
+            ssl_certificate=ssl_cert,
+            redirected_url=redirected_url,
+        )
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, List, Tuple
+from typing import Awaitable, Callable, Dict, Optional, List, Tuple, Union
 from .async_configs import CrawlerRunConfig
 from .models import (
     CrawlResult,
@@ -9,6 +9,10 @@ from .models import (
     DomainState,
 )
 
+from .rate_limit_store import RateLimitStore, MemoryRateLimitStore
+from .memory_sampler import MemorySampler
+from .concurrency_controller import AIMDConcurrencyController
+
 from rich.live import Live
 from rich.table import Table
 from rich.console import Console
@@ -16,6 +20,8 @@ from rich import box
 from datetime import datetime, timedelta
 from collections.abc import AsyncGenerator
 import time
+import heapq
+import inspect
 import psutil
 import asyncio
 import uuid
@@ -33,41 +39,75 @@ class RateLimiter:
         max_delay: float = 60.0,
         max_retries: int = 3,
         rate_limit_codes: List[int] = None,
+        store: Optional[RateLimitStore] = None,
     ):
+        """
+        Args:
+            base_delay: Range of the random delay between two requests to a domain
+            max_delay: Longest delay after repeated rate limiting
+            max_retries: Rate-limited responses in a row before a domain is given up
+            rate_limit_codes: Status codes that mean rate limited. Default: [429, 503]
+            store: Where the state of each domain is kept. Pass a SQLiteRateLimitStore or
+                   RedisRateLimitStore shared by several processes or arun_many calls so they
+                   back off together. Default: self.domains, in this process only.
+        """
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.max_retries = max_retries
         self.rate_limit_codes = rate_limit_codes or [429, 503]
         self.domains: Dict[str, DomainState] = {}
+        self.store = store or MemoryRateLimitStore(self.domains)
 
     def get_domain(self, url: str) -> str:
         return urlparse(url).netloc
 
     async def wait_if_needed(self, url: str) -> None:
-        domain = self.get_domain(url)
-        state = self.domains.get(domain)
+        while (wait_time := await self.areserve(url)) > 0:
+            await asyncio.sleep(wait_time)
+
+    def reserve(self, url: str) -> float:
+        """
+        Claim the next request to the URL's domain without waiting.
 
-        if not state:
-            self.domains[domain] = DomainState()
-            state = self.domains[domain]
+        Returns:
+            float: 0.0 if the request may be sent now, in which case it is recorded as sent;
+            otherwise the seconds until the domain may be requested, and nothing is recorded.
+        """
+        return self.store.update(self.get_domain(url), self._reserve)
 
+    async def areserve(self, url: str) -> float:
+        """Like reserve, without blocking the event loop on a shared store."""
+        return await self.store.aupdate(self.get_domain(url), self._reserve)
+
+    def _reserve(self, state: DomainState) -> float:
         now = time.time()
         if state.last_request_time:
-            wait_time = max(0, state.current_delay - (now - state.last_request_time))
+            wait_time = state.current_delay - (now - state.last_request_time)
             if wait_time > 0:
-                await asyncio.sleep(wait_time)
+                return wait_time
 
         # Random delay within base range if no current delay
         if state.current_delay == 0:
             state.current_delay = random.uniform(*self.base_delay)
 
-        state.last_request_time = time.time()
+        state.last_request_time = now
+        return 0.0
 
     def update_delay(self, url: str, status_code: int) -> bool:
-        domain = self.get_domain(url)
-        state = self.domains[domain]
+        rate_limited = status_code in self.rate_limit_codes
+        return self.store.update(
+            self.get_domain(url), lambda state: self._update_delay(state, rate_limited)
+        )
 
-        if status_code in self.rate_limit_codes:
+    async def aupdate_delay(self, url: str, status_code: int) -> bool:
+        """Like update_delay, without blocking the event loop on a shared store."""
+        rate_limited = status_code in self.rate_limit_codes
+        return await self.store.aupdate(
+            self.get_domain(url), lambda state: self._update_delay(state, rate_limited)
+        )
+
+    def _update_delay(self, state: DomainState, rate_limited: bool) -> bool:
+        if rate_limited:
             state.fail_count += 1
             if state.fail_count > self.max_retries:
                 return False
@@ -86,6 +126,189 @@ class RateLimiter:
         return True
 
 
+class _DomainQueue:
+    __slots__ = ("heap", "turn", "version", "state")
+
+    def __init__(self, turn: int):
+        self.heap: List[Tuple[int, int, str, str]] = []  # (-priority, seq, url, task_id)
+        self.turn = turn
+        self.version = 0
+        self.state = "ready"  # "ready", "sleeping" (politeness delay) or "blocked" (concurrency limit)
+
+
+class DomainScheduler:
+    """
+    Pending URLs of a dispatcher, indexed by domain. Decides which URL starts next so that
+    one domain cannot take every slot, and politeness towards a domain is a scheduling
+    constraint instead of a sleep inside a running task.
+
+    How it works:
+    1. Each domain keeps a heap of its URLs ordered by priority (higher first), then by
+       the order they were added.
+    2. Domains with pending URLs sit in a ready heap ordered by the priority of their best
+       URL, then by turn. A domain that was just served takes a new turn behind every other
+       domain, so domains of equal priority are served round-robin.
+    3. A domain with max_per_domain URLs in flight is blocked until release() is called
+       for one of them.
+    4. Otherwise reserve(url) claims the domain's next request slot, e.g.
+       RateLimiter.reserve. If the domain may not be requested yet, it is parked in a
+       sleeping heap until then and the next domain is tried, so pop() never hands out a
+       URL that would have to wait.
+    5. Heap entries are not updated in place. Each domain carries a version, and entries
+       with an old version are skipped when popped.
+
+    Attributes:
+        reserve (Callable[[str], Union[float, Awaitable[float]]]): Claims a request to the
+            URL's domain and returns 0.0, or returns the seconds until the domain may be
+            requested. None if every domain is always ready. pop() needs a plain function,
+            apop() also takes a coroutine function such as RateLimiter.areserve.
+        get_domain (Callable[[str], str]): Domain of a URL
+        max_per_domain (int): Maximum number of URLs of one domain in flight. None for no limit.
+    """
+
+    def __init__(
+        self,
+        reserve: Optional[Callable[[str], Union[float, Awaitable[float]]]] = None,
+        get_domain: Optional[Callable[[str], str]] = None,
+        max_per_domain: Optional[int] = None,
+    ):
+        self.reserve = reserve
+        self.get_domain = get_domain or (lambda url: urlparse(url).netloc)
+        self.max_per_domain = max_per_domain
+        self._domains: Dict[str, _DomainQueue] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._ready: List[Tuple[int, int, int, str]] = []  # (-priority, turn, version, domain)
+        self._sleeping: List[Tuple[float, int, str]] = []  # (ready time, version, domain)
+        self._size = 0
+        self._seq = 0
+        self._turn = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _schedule(self, domain: str, queue: _DomainQueue):
+        queue.version += 1
+        queue.state = "ready"
+        heapq.heappush(self._ready, (queue.heap[0][0], queue.turn, queue.version, domain))
+
+    def push(self, url: str, task_id: str, priority: int = 0):
+        """Add a URL. URLs of higher priority start first, across all domains."""
+        domain = self.get_domain(url)
+        queue = self._domains.get(domain)
+        self._seq += 1
+        self._size += 1
+        if queue is None:
+            queue = self._domains[domain] = _DomainQueue(self._turn)
+            heapq.heappush(queue.heap, (-priority, self._seq, url, task_id))
+            if self.max_per_domain and self._in_flight.get(domain, 0) >= self.max_per_domain:
+                queue.state = "blocked"
+            else:
+                self._schedule(domain, queue)
+            return
+
+        best = queue.heap[0][0]
+        heapq.heappush(queue.heap, (-priority, self._seq, url, task_id))
+        if -priority < best and queue.state == "ready":
+            # New best URL of a ready domain: move the domain up
+            self._schedule(domain, queue)
+
+    def _wake(self, now: float):
+        while self._sleeping and self._sleeping[0][0] <= now:
+            _, version, domain = heapq.heappop(self._sleeping)
+            queue = self._domains.get(domain)
+            if queue is not None and queue.version == version:
+                self._schedule(domain, queue)
+
+    def _next_candidate(self) -> Optional[Tuple[str, _DomainQueue]]:
+        """Pop the best ready domain that is not at max_per_domain."""
+        while self._ready:
+            _, _, version, domain = heapq.heappop(self._ready)
+            queue = self._domains.get(domain)
+            if queue is None or queue.version != version:
+                continue
+
+            if self.max_per_domain and self._in_flight.get(domain, 0) >= self.max_per_domain:
+                queue.version += 1
+                queue.state = "blocked"
+                continue
+            return domain, queue
+        return None
+
+    def _sleep(self, domain: str, queue: _DomainQueue, ready_time: float):
+        queue.version += 1
+        queue.state = "sleeping"
+        heapq.heappush(self._sleeping, (ready_time, queue.version, domain))
+
+    def _take(self, domain: str, queue: _DomainQueue) -> Tuple[str, str]:
+        _, _, url, task_id = heapq.heappop(queue.heap)
+        self._size -= 1
+        self._in_flight[domain] = self._in_flight.get(domain, 0) + 1
+        self._turn += 1
+        queue.turn = self._turn
+        if queue.heap:
+            self._schedule(domain, queue)
+        else:
+            del self._domains[domain]
+        return url, task_id
+
+    def pop(self, now: Optional[float] = None) -> Optional[Tuple[str, str]]:
+        """
+        Take the next URL to start. Its domain counts it as in flight until release().
+
+        Returns:
+            Optional[Tuple[str, str]]: (url, task_id), or None if no pending domain may be
+            requested at now
+        """
+        now = time.time() if now is None else now
+        self._wake(now)
+        while (candidate := self._next_candidate()) is not None:
+            domain, queue = candidate
+            wait_time = self.reserve(queue.heap[0][2]) if self.reserve else 0.0
+            if wait_time > 0:
+                self._sleep(domain, queue, now + wait_time)
+                continue
+            return self._take(domain, queue)
+        return None
+
+    async def apop(self, now: Optional[float] = None) -> Optional[Tuple[str, str]]:
+        """Like pop, awaiting reserve when it is a coroutine function."""
+        now = time.time() if now is None else now
+        self._wake(now)
+        while (candidate := self._next_candidate()) is not None:
+            domain, queue = candidate
+            wait_time = self.reserve(queue.heap[0][2]) if self.reserve else 0.0
+            if inspect.isawaitable(wait_time):
+                wait_time = await wait_time
+            if wait_time > 0:
+                self._sleep(domain, queue, now + wait_time)
+                continue
+            return self._take(domain, queue)
+        return None
+
+    def release(self, url: str):
+        """Mark a URL returned by pop() as finished, unblocking its domain if it was at max_per_domain."""
+        domain = self.get_domain(url)
+        in_flight = self._in_flight.get(domain, 0) - 1
+        if in_flight > 0:
+            self._in_flight[domain] = in_flight
+        else:
+            self._in_flight.pop(domain, None)
+
+        queue = self._domains.get(domain)
+        if queue is not None and queue.state == "blocked":
+            self._schedule(domain, queue)
+
+    def next_ready_time(self) -> Optional[float]:
+        """Earliest time a sleeping domain may be requested again, or None if none is sleeping."""
+        while self._sleeping:
+            _, version, domain = self._sleeping[0]
+            queue = self._domains.get(domain)
+            if queue is not None and queue.version == version:
+                return self._sleeping[0][0]
+            heapq.heappop(self._sleeping)
+        return None
+
+
 class CrawlerMonitor:
     def __init__(
         self,
@@ -97,6 +320,10 @@ class CrawlerMonitor:
         self.display_mode = display_mode
         self.stats: Dict[str, CrawlStats] = {}
         self.process = psutil.Process()
+        # Set by the dispatcher; its snapshot replaces reading memory on every refresh
+        self.memory_sampler: Optional[MemorySampler] = None
+        # Set by the dispatcher when its concurrency limit is adaptive
+        self.concurrency_controller: Optional[AIMDConcurrencyController] = None
         self.start_time = datetime.now()
         self.live = Live(self._create_table(), refresh_per_second=2)
 
@@ -118,6 +345,18 @@ class CrawlerMonitor:
                 setattr(self.stats[task_id], key, value)
             self.live.update(self._create_table())
 
+    def _current_memory(self) -> float:
+        if self.memory_sampler:
+            return self.memory_sampler.snapshot.process_tree_mb
+        return self.process.memory_info().rss / (1024 * 1024)
+
+    def _concurrency_summary(self) -> str:
+        controller = self.concurrency_controller
+        decision = controller.decisions[-1] if controller.decisions else None
+        if decision is None:
+            return f"limit {controller.limit}"
+        return f"limit {controller.limit} ({decision.action}: {decision.reason})"
+
     def _create_aggregated_table(self) -> Table:
         """Creates a compact table showing only aggregated statistics"""
         table = Table(
@@ -144,7 +383,7 @@ class CrawlerMonitor:
         )
 
         # Memory statistics
-        current_memory = self.process.memory_info().rss / (1024 * 1024)
+        current_memory = self._current_memory()
         total_task_memory = sum(stat.memory_usage for stat in self.stats.values())
         peak_memory = max(
             (stat.peak_memory for stat in self.stats.values()), default=0.0
@@ -191,6 +430,22 @@ class CrawlerMonitor:
         table.add_row(
             "[magenta]Peak Task Memory[/magenta]", f"{peak_memory:.1f} MB", ""
         )
+        if self.memory_sampler:
+            snapshot = self.memory_sampler.snapshot
+            table.add_row(
+                "[magenta]System Memory[/magenta]", f"{snapshot.system_percent:.1f}%", ""
+            )
+            table.add_row(
+                "[magenta]Memory / Page[/magenta]", f"{snapshot.page_mb:.1f} MB", ""
+            )
+        if self.concurrency_controller:
+            controller = self.concurrency_controller
+            decision = controller.decisions[-1] if controller.decisions else None
+            table.add_row(
+                "[cyan]Concurrency Limit[/cyan]",
+                str(controller.limit),
+                f"{decision.action}: {decision.reason}" if decision else "",
+            )
         table.add_row(
             "[yellow]Runtime[/yellow]",
             str(timedelta(seconds=int(duration.total_seconds()))),
@@ -206,6 +461,8 @@ class CrawlerMonitor:
             title_style="bold magenta",
             header_style="bold blue",
         )
+        if self.concurrency_controller:
+            table.caption = f"Concurrency {self._concurrency_summary()}"
 
         # Add columns
         table.add_column("Task ID", style="cyan", no_wrap=True)
@@ -233,7 +490,7 @@ class CrawlerMonitor:
             f"Total: {len(self.stats)}",
             f"Active: {active_count}",
             f"{total_memory:.1f}",
-            f"{self.process.memory_info().rss / (1024 * 1024):.1f}",
+            f"{self._current_memory():.1f}",
             str(
                 timedelta(
                     seconds=int((datetime.now() - self.start_time).total_seconds())
@@ -283,16 +540,25 @@ class CrawlerMonitor:
 
 
 class BaseDispatcher(ABC):
+    # Longest sleep of the dispatch loop while nothing can be started
+    check_interval: float = 1.0
+
     def __init__(
         self,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        max_per_domain: Optional[int] = None,
+        memory_sampler: Optional[MemorySampler] = None,
+        concurrency_controller: Optional[AIMDConcurrencyController] = None,
     ):
         self.crawler = None
         self._domain_last_hit: Dict[str, float] = {}
         self.concurrent_sessions = 0
         self.rate_limiter = rate_limiter
         self.monitor = monitor
+        self.max_per_domain = max_per_domain
+        self.memory_sampler = memory_sampler
+        self.concurrency_controller = concurrency_controller
 
     @abstractmethod
     async def crawl_url(
@@ -314,6 +580,156 @@ class BaseDispatcher(ABC):
     ) -> List[CrawlerTaskResult]:
         pass
 
+    def _session_limit(self) -> int:
+        """Maximum number of crawls running at once."""
+        return self.max_session_permit
+
+    def _concurrency_limit(self) -> int:
+        """The adaptive limit when there is a concurrency controller, else _session_limit()."""
+        if self.concurrency_controller:
+            return self.concurrency_controller.limit
+        return self._session_limit()
+
+    def _record_result(self, task_result: CrawlerTaskResult, in_flight: int):
+        """Feed a finished crawl to the concurrency controller."""
+        error_message = task_result.error_message or ""
+        self.concurrency_controller.record(
+            latency=(task_result.end_time - task_result.start_time).total_seconds(),
+            status_code=getattr(task_result.result, "status_code", None),
+            success=not error_message,
+            timed_out="timeout" in error_message.lower(),
+            in_flight=in_flight,
+        )
+
+    async def _admit(self, wait_start_time: float) -> bool:
+        """Whether another crawl may start now. May sleep before answering False."""
+        return True
+
+    def _create_scheduler(
+        self, urls: List[str], priorities: Optional[Dict[str, int]] = None
+    ) -> DomainScheduler:
+        """Queue urls by domain, registering a task for each with the monitor."""
+        scheduler = DomainScheduler(
+            reserve=self.rate_limiter.areserve if self.rate_limiter else None,
+            get_domain=self.rate_limiter.get_domain if self.rate_limiter else None,
+            max_per_domain=self.max_per_domain,
+        )
+        for url in urls:
+            task_id = str(uuid.uuid4())
+            if self.monitor:
+                self.monitor.add_task(task_id, url)
+            scheduler.push(url, task_id, priorities.get(url, 0) if priorities else 0)
+        return scheduler
+
+    def _page_memory(self) -> float:
+        """Memory reported for each crawl: the sampler's learned cost of one page, in MB."""
+        return self.memory_sampler.snapshot.page_mb if self.memory_sampler else 0.0
+
+    async def _start_memory_sampler(self):
+        sampler = self.memory_sampler
+        if sampler.sample_contexts and sampler.context_memory is None:
+            # Per-context JS heap, when the crawler drives a Playwright browser
+            browser_manager = getattr(
+                getattr(self.crawler, "crawler_strategy", None), "browser_manager", None
+            )
+            if browser_manager is not None:
+                sampler.context_memory = browser_manager.get_context_memory
+        await sampler.start()
+        if self.monitor:
+            self.monitor.memory_sampler = sampler
+
+    def _dispatch_wait(self, scheduler: DomainScheduler) -> float:
+        """Seconds to wait before trying to start queued URLs again, at most check_interval."""
+        ready_time = scheduler.next_ready_time()
+        if ready_time is None:
+            return self.check_interval
+        return min(self.check_interval, max(0.0, ready_time - time.time()))
+
+    async def _dispatch(
+        self,
+        urls: List[str],
+        config: CrawlerRunConfig,
+        priorities: Optional[Dict[str, int]] = None,
+    ) -> AsyncGenerator[CrawlerTaskResult, None]:
+        """
+        Crawl urls and yield each result as soon as its crawl finishes.
+
+        How it works:
+        1. URLs are queued in a DomainScheduler, by priority and round-robin between domains.
+        2. While fewer than _concurrency_limit() crawls run and _admit() agrees, the scheduler
+           hands out the next URL whose domain may be requested now. It reserves the
+           request with the rate limiter and counts it against max_per_domain.
+        3. A crawl therefore never waits for politeness while holding a slot. When every
+           queued domain is waiting, the loop sleeps until the first one is ready or a
+           crawl finishes.
+        4. Pages started and finished are reported to the memory sampler, which runs for
+           as long as the generator, and finished crawls to the concurrency controller,
+           which moves the limit of step 2.
+        5. Crawls still running when the generator is closed are cancelled.
+        """
+        scheduler = self._create_scheduler(urls, priorities)
+        active_tasks: Dict[asyncio.Task, str] = {}
+        sampler = self.memory_sampler
+        if sampler:
+            await self._start_memory_sampler()
+        if self.monitor and self.concurrency_controller:
+            self.monitor.concurrency_controller = self.concurrency_controller
+
+        # When admission was first refused; reset once a crawl is admitted
+        wait_start_time: Optional[float] = None
+
+        try:
+            while scheduler or active_tasks:
+                admitted = True
+                while len(active_tasks) < self._concurrency_limit() and scheduler:
+                    if wait_start_time is None:
+                        wait_start_time = time.time()
+                    if not await self._admit(wait_start_time):
+                        # Collect finished crawls before asking again
+                        admitted = False
+                        break
+                    wait_start_time = None
+
+                    next_url = await scheduler.apop()
+                    if next_url is None:
+                        # Every queued domain is waiting for its delay or concurrency limit
+                        break
+                    url, task_id = next_url
+                    task = asyncio.create_task(self.crawl_url(url, config, task_id))
+                    active_tasks[task] = url
+                    if sampler:
+                        sampler.page_started()
+
+                if not active_tasks:
+                    # A refusing _admit() has already slept
+                    if admitted:
+                        await asyncio.sleep(self._dispatch_wait(scheduler))
+                    continue
+
+                # Wake up when a waiting domain becomes ready if a slot is free for it
+                timeout = None
+                if scheduler and len(active_tasks) < self._concurrency_limit():
+                    timeout = self._dispatch_wait(scheduler)
+                done, _ = await asyncio.wait(
+                    active_tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                in_flight = len(active_tasks)
+                for task in done:
+                    scheduler.release(active_tasks.pop(task))
+                    if sampler:
+                        sampler.page_finished()
+                    task_result = task.result()
+                    if self.concurrency_controller:
+                        self._record_result(task_result, in_flight)
+                    yield task_result
+        finally:
+            for task in active_tasks:
+                task.cancel()
+                if sampler:
+                    sampler.page_finished()
+            if sampler:
+                await sampler.stop()
+
 
 class MemoryAdaptiveDispatcher(BaseDispatcher):
     def __init__(
@@ -324,8 +740,17 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         memory_wait_timeout: float = 300.0,  # 5 minutes default timeout
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        max_per_domain: Optional[int] = None,
+        memory_sampler: Optional[MemorySampler] = None,
+        concurrency_controller: Optional[AIMDConcurrencyController] = None,
     ):
-        super().__init__(rate_limiter, monitor)
+        super().__init__(
+            rate_limiter,
+            monitor,
+            max_per_domain,
+            memory_sampler or MemorySampler(interval=min(0.5, check_interval)),
+            concurrency_controller,
+        )
         self.memory_threshold_percent = memory_threshold_percent
         self.check_interval = check_interval
         self.max_session_permit = max_session_permit
@@ -349,18 +774,11 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 )
             self.concurrent_sessions += 1
 
-            if self.rate_limiter:
-                await self.rate_limiter.wait_if_needed(url)
-
-            process = psutil.Process()
-            start_memory = process.memory_info().rss / (1024 * 1024)
             result = await self.crawler.arun(url, config=config, session_id=task_id)
-            end_memory = process.memory_info().rss / (1024 * 1024)
-
-            memory_usage = peak_memory = end_memory - start_memory
+            memory_usage = peak_memory = self._page_memory()
 
             if self.rate_limiter and result.status_code:
-                if not self.rate_limiter.update_delay(url, result.status_code):
+                if not await self.rate_limiter.aupdate_delay(url, result.status_code):
                     error_message = f"Rate limit retry count exceeded for domain {urlparse(url).netloc}"
                     if self.monitor:
                         self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
@@ -415,112 +833,78 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             error_message=error_message,
         )
 
+    async def _admit(self, wait_start_time: float) -> bool:
+        """
+        Admit a page if memory stays below the threshold with one more page of the learned
+        size, counting pages started since the last sample. When nothing runs, a page is
+        admitted as long as memory is below the threshold now.
+        """
+        sampler = self.memory_sampler
+        if sampler.projected_percent() < self.memory_threshold_percent:
+            return True
+        if (
+            sampler.active_pages == 0
+            and sampler.projected_percent(pages=0) < self.memory_threshold_percent
+        ):
+            return True
+        # Check if we've exceeded the timeout
+        if time.time() - wait_start_time > self.memory_wait_timeout:
+            raise MemoryError(
+                f"Memory usage above threshold ({self.memory_threshold_percent}%) for more than {self.memory_wait_timeout} seconds"
+            )
+        await asyncio.sleep(min(self.check_interval, sampler.interval))
+        return False
+
     async def run_urls(
         self,
         urls: List[str],
         crawler: "AsyncWebCrawler",  # noqa: F821
         config: CrawlerRunConfig,
-        ) -> List[CrawlerTaskResult]:
-            self.crawler = crawler
-
-            if self.monitor:
-                self.monitor.start()
-
-            try:
-                pending_tasks = []
-                active_tasks = []
-                task_queue = []
-
-                for url in urls:
-                    task_id = str(uuid.uuid4())
-                    if self.monitor:
-                        self.monitor.add_task(task_id, url)
-                    task_queue.append((url, task_id))
-
-                while task_queue or active_tasks:
-                    wait_start_time = time.time()
-                    while len(active_tasks) < self.max_session_permit and task_queue:
-                        if psutil.virtual_memory().percent >= self.memory_threshold_percent:
-                            # Check if we've exceeded the timeout
-                            if time.time() - wait_start_time > self.memory_wait_timeout:
-                                raise MemoryError(
-                                    f"Memory usage above threshold ({self.memory_threshold_percent}%) for more than {self.memory_wait_timeout} seconds"
-                                )
-                            await asyncio.sleep(self.check_interval)
-                            continue
-
-                        url, task_id = task_queue.pop(0)
-                        task = asyncio.create_task(self.crawl_url(url, config, task_id))
-                        active_tasks.append(task)
-
-                    if not active_tasks:
-                        await asyncio.sleep(self.check_interval)
-                        continue
-
-                    done, pending = await asyncio.wait(
-                        active_tasks, return_when=asyncio.FIRST_COMPLETED
-                    )
+        priorities: Optional[Dict[str, int]] = None,
+    ) -> List[CrawlerTaskResult]:
+        """
+        Crawl urls, at most max_session_permit at a time while memory permits. With a
+        concurrency_controller the limit is its adaptive one instead.
+
+        URLs are started in priority order, round-robin between domains. A domain that the
+        rate limiter holds back, or that has max_per_domain crawls running, is skipped until
+        it may be requested again, so its URLs never occupy slots while waiting.
+
+        Args:
+            urls: URLs to crawl
+            crawler: Crawler running each URL
+            config: Configuration for every crawl
+            priorities: Priority of some URLs; higher starts first. Default: 0 for all URLs
+
+        Returns:
+            List[CrawlerTaskResult]: Results in the order the crawls finished
+        """
+        self.crawler = crawler
 
-                    pending_tasks.extend(done)
-                    active_tasks = list(pending)
+        if self.monitor:
+            self.monitor.start()
 
-                return await asyncio.gather(*pending_tasks)
-            finally:
-                if self.monitor:
-                    self.monitor.stop()
+        try:
+            return [result async for result in self._dispatch(urls, config, priorities)]
+        finally:
+            if self.monitor:
+                self.monitor.stop()
 
     async def run_urls_stream(
         self,
         urls: List[str],
         crawler: "AsyncWebCrawler",
         config: CrawlerRunConfig,
+        priorities: Optional[Dict[str, int]] = None,
     ) -> AsyncGenerator[CrawlerTaskResult, None]:
+        """Like run_urls, yielding each result as soon as its crawl finishes."""
         self.crawler = crawler
         if self.monitor:
             self.monitor.start()
 
         try:
-            active_tasks = []
-            task_queue = []
-            completed_count = 0
-            total_urls = len(urls)
-
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                task_queue.append((url, task_id))
-
-            while completed_count < total_urls:
-                # Start new tasks if memory permits
-                while len(active_tasks) < self.max_session_permit and task_queue:
-                    if psutil.virtual_memory().percent >= self.memory_threshold_percent:
-                        await asyncio.sleep(self.check_interval)
-                        continue
-
-                    url, task_id = task_queue.pop(0)
-                    task = asyncio.create_task(self.crawl_url(url, config, task_id))
-                    active_tasks.append(task)
-
-                if not active_tasks and not task_queue:
-                    break
-
-                # Wait for any task to complete and yield results
-                if active_tasks:
-                    done, pending = await asyncio.wait(
-                        active_tasks,
-                        timeout=0.1,
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
-                    for completed_task in done:
-                        result = await completed_task
-                        completed_count += 1
-                        yield result
-                    active_tasks = list(pending)
-                else:
-                    await asyncio.sleep(self.check_interval)
-
+            async for result in self._dispatch(urls, config, priorities):
+                yield result
         finally:
             if self.monitor:
                 self.monitor.stop()
@@ -532,10 +916,19 @@ class SemaphoreDispatcher(BaseDispatcher):
         max_session_permit: int = 20,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        max_per_domain: Optional[int] = None,
+        memory_sampler: Optional[MemorySampler] = None,
+        concurrency_controller: Optional[AIMDConcurrencyController] = None,
     ):
-        super().__init__(rate_limiter, monitor)
+        super().__init__(
+            rate_limiter, monitor, max_per_domain, memory_sampler, concurrency_controller
+        )
         self.semaphore_count = semaphore_count
         self.max_session_permit = max_session_permit
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _session_limit(self) -> int:
+        return self.semaphore_count
 
     async def crawl_url(
         self,
@@ -554,19 +947,12 @@ class SemaphoreDispatcher(BaseDispatcher):
                     task_id, status=CrawlStatus.IN_PROGRESS, start_time=start_time
                 )
 
-            if self.rate_limiter:
-                await self.rate_limiter.wait_if_needed(url)
-
-            async with semaphore:
-                process = psutil.Process()
-                start_memory = process.memory_info().rss / (1024 * 1024)
+            async with semaphore or self._semaphore:
                 result = await self.crawler.arun(url, config=config, session_id=task_id)
-                end_memory = process.memory_info().rss / (1024 * 1024)
-
-                memory_usage = peak_memory = end_memory - start_memory
+                memory_usage = peak_memory = self._page_memory()
 
                 if self.rate_limiter and result.status_code:
-                    if not self.rate_limiter.update_delay(url, result.status_code):
+                    if not await self.rate_limiter.aupdate_delay(url, result.status_code):
                         error_message = f"Rate limit retry count exceeded for domain {urlparse(url).netloc}"
                         if self.monitor:
                             self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
@@ -623,25 +1009,32 @@ class SemaphoreDispatcher(BaseDispatcher):
         crawler: "AsyncWebCrawler",  # noqa: F821
         urls: List[str],
         config: CrawlerRunConfig,
+        priorities: Optional[Dict[str, int]] = None,
     ) -> List[CrawlerTaskResult]:
+        """
+        Crawl urls, semaphore_count at a time, and return the results in the order of urls.
+        With a concurrency_controller the limit is its adaptive one instead.
+
+        URLs are started in priority order, round-robin between domains, and only once the
+        rate limiter allows a request to their domain, so waiting never holds a slot.
+        """
         self.crawler = crawler
         if self.monitor:
             self.monitor.start()
 
         try:
-            semaphore = asyncio.Semaphore(self.semaphore_count)
-            tasks = []
-
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                task = asyncio.create_task(
-                    self.crawl_url(url, config, task_id, semaphore)
-                )
-                tasks.append(task)
+            # The dispatch loop enforces an adaptive limit; the semaphore only bounds it
+            self._semaphore = asyncio.Semaphore(
+                self.concurrency_controller.max_limit
+                if self.concurrency_controller
+                else self.semaphore_count
+            )
+            results = [result async for result in self._dispatch(urls, config, priorities)]
 
-            return await asyncio.gather(*tasks, return_exceptions=True)
+            position = {}
+            for index, url in enumerate(urls):
+                position.setdefault(url, index)
+            return sorted(results, key=lambda result: position[result.url])
         finally:
             if self.monitor:
                 self.monitor.stop()
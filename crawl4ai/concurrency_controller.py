@@ -0,0 +1,186 @@
+"""Adaptive concurrency limit for the dispatchers, adjusted by additive increase and multiplicative decrease."""
+
+import time
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+
+@dataclass
+class ConcurrencyDecision:
+    """
+    One adjustment, or deliberate non-adjustment, of the concurrency limit.
+
+    Attributes:
+        time (float): When the decision was taken (time.time())
+        old_limit (int): Limit before the decision
+        new_limit (int): Limit after the decision
+        action (str): "increase", "decrease" or "hold"
+        reason (str): Why, in a few words
+        p95_latency (float): 95th percentile crawl latency of the window, in seconds
+        error_rate (float): Share of failed crawls in the window
+        throttle_rate (float): Share of timeouts and throttling responses in the window
+    """
+
+    time: float
+    old_limit: int
+    new_limit: int
+    action: str
+    reason: str
+    p95_latency: float
+    error_rate: float
+    throttle_rate: float
+
+
+class AIMDConcurrencyController:
+    """
+    Finds how many crawls can run at once by probing: grows the limit by a constant while
+    crawls stay fast and healthy, and cuts it by a factor as soon as they do not.
+
+    How it works:
+    1. The dispatcher records every finished crawl: latency, status code, success, whether it
+       timed out, and how many crawls were running.
+    2. Once a window of max(min_samples, limit) crawls has finished, a decision is taken on
+       the window's p95 latency, error rate and throttle rate (timeouts and throttle_codes).
+    3. The limit is multiplied by decrease_factor when the throttle rate exceeds
+       max_throttle_rate, the error rate exceeds max_error_rate, or p95 latency exceeds
+       latency_tolerance times the baseline.
+    4. Otherwise, if the window used the whole limit, it grows by increase. A limit that was
+       not reached says nothing about whether a higher one would hold, so it is kept.
+    5. The baseline is the p95 of healthy windows, following drops at once and rises slowly,
+       so a gradual slowdown caused by the crawler itself still triggers a decrease.
+
+    Attributes:
+        min_limit (int): Lowest limit
+        max_limit (int): Highest limit
+        increase (float): Added to the limit after a healthy, saturated window
+        decrease_factor (float): Limit multiplier after an unhealthy window
+        min_samples (int): Smallest number of crawls in a window
+        latency_tolerance (float): p95 latency, relative to the baseline, that counts as slow
+        max_error_rate (float): Highest acceptable share of failed crawls
+        max_throttle_rate (float): Highest acceptable share of timeouts and throttling
+        throttle_codes (List[int]): Status codes that mean the server is overloaded
+        baseline_latency (Optional[float]): p95 latency of healthy windows, in seconds
+        decisions (Deque[ConcurrencyDecision]): Most recent decisions, oldest first
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        increase: float = 1.0,
+        decrease_factor: float = 0.7,
+        min_samples: int = 10,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.2,
+        max_throttle_rate: float = 0.05,
+        throttle_codes: Optional[List[int]] = None,
+        history_size: int = 100,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.min_samples = min_samples
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+        self.max_throttle_rate = max_throttle_rate
+        self.throttle_codes = throttle_codes or [429, 503]
+        self.baseline_latency: Optional[float] = None
+        self.decisions: Deque[ConcurrencyDecision] = deque(maxlen=history_size)
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._window: List[tuple] = []
+
+    @property
+    def limit(self) -> int:
+        """Number of crawls allowed to run at once."""
+        return int(self._limit)
+
+    def record(
+        self,
+        latency: float,
+        status_code: Optional[int] = None,
+        success: bool = True,
+        timed_out: bool = False,
+        in_flight: int = 0,
+    ) -> Optional[ConcurrencyDecision]:
+        """
+        Record a finished crawl and adjust the limit when a window is complete.
+
+        Args:
+            latency (float): Duration of the crawl in seconds
+            status_code (Optional[int]): HTTP status of the page, if any
+            success (bool): Whether the crawl succeeded
+            timed_out (bool): Whether the crawl failed with a timeout
+            in_flight (int): Crawls running when this one finished, itself included
+
+        Returns:
+            Optional[ConcurrencyDecision]: The decision taken, if the window was complete
+        """
+        throttled = timed_out or status_code in self.throttle_codes
+        self._window.append((latency, success, throttled, in_flight))
+        if len(self._window) < max(self.min_samples, self.limit):
+            return None
+        window, self._window = self._window, []
+        return self._decide(window)
+
+    def _decide(self, window: List[tuple]) -> ConcurrencyDecision:
+        latencies = sorted(latency for latency, _, _, _ in window)
+        p95 = latencies[min(len(latencies) - 1, math.ceil(0.95 * len(latencies)) - 1)]
+        error_rate = sum(not success for _, success, _, _ in window) / len(window)
+        throttle_rate = sum(throttled for _, _, throttled, _ in window) / len(window)
+        saturated = max(in_flight for _, _, _, in_flight in window) >= self.limit
+
+        old_limit = self.limit
+        slow = (
+            self.baseline_latency is not None
+            and p95 > self.baseline_latency * self.latency_tolerance
+        )
+        if throttle_rate > self.max_throttle_rate:
+            action, reason = "decrease", f"throttled {throttle_rate:.0%}"
+        elif error_rate > self.max_error_rate:
+            action, reason = "decrease", f"errors {error_rate:.0%}"
+        elif slow:
+            action, reason = "decrease", f"p95 {p95:.2f}s vs baseline {self.baseline_latency:.2f}s"
+        elif not saturated:
+            action, reason = "hold", "limit not reached"
+        elif self.limit >= self.max_limit:
+            action, reason = "hold", "at max_limit"
+        else:
+            action, reason = "increase", "healthy"
+
+        if action == "decrease":
+            self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        else:
+            if action == "increase":
+                self._limit = min(float(self.max_limit), self._limit + self.increase)
+            if self.baseline_latency is None or p95 < self.baseline_latency:
+                self.baseline_latency = p95
+            else:
+                self.baseline_latency += 0.1 * (p95 - self.baseline_latency)
+
+        decision = ConcurrencyDecision(
+            time=time.time(),
+            old_limit=old_limit,
+            new_limit=self.limit,
+            action=action,
+            reason=reason,
+            p95_latency=p95,
+            error_rate=error_rate,
+            throttle_rate=throttle_rate,
+        )
+        self.decisions.append(decision)
+        return decision
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the limit, the latency baseline and the last decision."""
+        last = self.decisions[-1] if self.decisions else None
+        return {
+            "limit": self.limit,
+            "baseline_latency": self.baseline_latency,
+            "decisions": len(self.decisions),
+            "last_action": last.action if last else None,
+            "last_reason": last.reason if last else None,
+        }
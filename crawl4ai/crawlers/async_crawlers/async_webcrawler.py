@@ -3,10 +3,12 @@ import time
 import warnings
 from colorama import Fore
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union, TypeVar, AsyncGenerator
+from typing import Optional, List, Dict, Any, Union, TypeVar, AsyncGenerator, AsyncIterable, Iterable, Tuple, Callable
 import json
 import asyncio
 from types import TracebackType
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from typing_extensions import Type
 
 from contextlib import asynccontextmanager
@@ -19,6 +21,8 @@ from .async_database import async_db_manager
 from .chunking_strategy import RegexChunking, ChunkingStrategy, IdentityChunking
 from .content_filter_strategy import RelevantContentFilter
 from .extraction_strategy import NoExtractionStrategy, ExtractionStrategy
+from ...strategies.extraction.parsed_document import ParsedDocument
+from ...image_probe import ImageProbe
 from ...async_crawler_strategy import (
     AsyncCrawlerStrategy,
     AsyncPlaywrightCrawlerStrategy,
@@ -102,6 +106,285 @@ class RobotsParser:
         # Simple implementation - could be expanded with actual robots.txt parsing
         return True
 
+def create_document(url: str, html: str, extracted_content: str, config: CrawlerRunConfig) -> ParsedDocument:
+    """
+    Create the ParsedDocument shared by the processing stages of a page. The scraping stage may
+    consume its tree unless extraction will read the raw HTML afterwards.
+    """
+    keep_original = (
+        needs_extraction(extracted_content, config)
+        and config.extraction_strategy.input_format == "html"
+        and getattr(config.extraction_strategy, "accepts_document", False)
+    )
+    return ParsedDocument(html, url=url, keep_original=keep_original)
+
+
+def scrape_html(
+    url: str,
+    document: ParsedDocument,
+    config: CrawlerRunConfig,
+    logger: AsyncLogger,
+    **kwargs: Dict[str, Any],
+) -> Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Scraping stage of process_html: clean the HTML and collect media, links and metadata.
+
+    Returns:
+        Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]: cleaned_html, media, links
+        and metadata
+    """
+    try:
+        # Get scraping strategy and ensure it has a logger
+        scraping_strategy = config.scraping_strategy
+        if not hasattr(scraping_strategy, "logger"):
+            setattr(scraping_strategy, "logger", logger)
+
+        # Process HTML content
+        params = {k: v for k, v in config.dict().items() if k not in ["url"]}
+        # add keys from kwargs to params that doesn't exist in params
+        params.update({k: v for k, v in kwargs.items() if k not in params})
+        params["document"] = document
+
+        result = scraping_strategy.scrap(url, document.html, **params)
+
+        if result is None:
+            raise ValueError(
+                f"Process HTML, Failed to extract content from the website: {url}"
+            )
+
+    except InvalidCSSSelectorError as e:
+        raise ValueError(str(e))
+    except Exception as e:
+        raise ValueError(
+            f"Process HTML, Failed to extract content from the website: {url}, error: {str(e)}"
+        )
+
+    # Extract results - handle both dict and ScrapingResult
+    if isinstance(result, dict):
+        cleaned_html = sanitize_input_encode(result.get("cleaned_html", ""))
+        media = result.get("media", {})
+        links = result.get("links", {})
+        metadata = result.get("metadata", {})
+    else:
+        cleaned_html = sanitize_input_encode(result.cleaned_html)
+        media = result.media.model_dump()
+        links = result.links.model_dump()
+        metadata = result.metadata
+    return cleaned_html, media, links, metadata
+
+
+def generate_markdown(url: str, cleaned_html: str, config: CrawlerRunConfig) -> Any:
+    """Markdown stage of process_html. Returns the MarkdownGenerationResult."""
+    markdown_generator = config.markdown_generator or DefaultMarkdownGenerator()
+    return markdown_generator.generate_markdown(
+        cleaned_html=cleaned_html,
+        base_url=url,
+    )
+
+
+def needs_extraction(extracted_content: str, config: CrawlerRunConfig) -> bool:
+    """Whether the extraction stage has to run for this page."""
+    return (
+        not bool(extracted_content)
+        and config.extraction_strategy is not None
+        and not isinstance(config.extraction_strategy, NoExtractionStrategy)
+    )
+
+
+def extract_content(
+    url: str,
+    document: ParsedDocument,
+    markdown_result: Any,
+    config: CrawlerRunConfig,
+    logger: AsyncLogger,
+    is_raw_html: bool = False,
+) -> str:
+    """Extraction stage of process_html. Returns the extracted content as JSON."""
+    _url = url if not is_raw_html else "Raw HTML"
+    t1 = time.perf_counter()
+    markdown = sanitize_input_encode(markdown_result.raw_markdown)
+
+    # Choose content based on input_format
+    content_format = config.extraction_strategy.input_format
+    if content_format == "fit_markdown" and not markdown_result.fit_markdown:
+        logger.warning(
+            message="Fit markdown requested but not available. Falling back to raw markdown.",
+            tag="EXTRACT",
+            params={"url": _url},
+        )
+        content_format = "markdown"
+
+    content = {
+        "markdown": markdown,
+        "html": document.html,
+        "fit_markdown": markdown_result.raw_markdown,
+    }.get(content_format, markdown)
+
+    # Use IdentityChunking for HTML input, otherwise use provided chunking strategy
+    chunking = (
+        IdentityChunking()
+        if content_format == "html"
+        else config.chunking_strategy or RegexChunking()
+    )
+    sections = chunking.chunk(content)
+    if content_format == "html" and getattr(config.extraction_strategy, "accepts_document", False):
+        # Reuse the tree parsed for scraping instead of parsing the page again
+        extracted_content = config.extraction_strategy.run(url, sections, document=document)
+    else:
+        extracted_content = config.extraction_strategy.run(url, sections)
+    extracted_content = json.dumps(
+        extracted_content, indent=4, default=str, ensure_ascii=False
+    )
+
+    # Log extraction completion
+    logger.info(
+        message="Completed for {url:.50}... | Time: {timing}s",
+        tag="EXTRACT",
+        params={"url": _url, "timing": time.perf_counter() - t1},
+    )
+    return extracted_content
+
+
+def build_crawl_result(
+    url: str,
+    html: str,
+    scraped: Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]],
+    markdown_result: Any,
+    extracted_content: str,
+    config: CrawlerRunConfig,
+    screenshot: Optional[bytes],
+    pdf_data: Optional[bytes],
+    load_time: float,
+) -> CrawlResult:
+    """Assemble the CrawlResult from the outputs of the processing stages."""
+    cleaned_html, media, links, metadata = scraped
+
+    # Apply HTML formatting if requested
+    if config.prettify:
+        cleaned_html = fast_format_html(cleaned_html)
+
+    # Return complete crawl result
+    return CrawlResult(
+        url=url,
+        content=html,
+        status_code=200,
+        load_time=load_time,
+        cleaned_html=cleaned_html,
+        markdown_v2=markdown_result,
+        markdown=sanitize_input_encode(markdown_result.raw_markdown),
+        fit_markdown=markdown_result.fit_markdown,
+        fit_html=markdown_result.fit_html,
+        media=media,
+        links=links,
+        metadata=metadata,
+        screenshot=screenshot,
+        pdf=pdf_data,
+        extracted_content=extracted_content,
+        success=True,
+        error_message="",
+    )
+
+
+def process_html(
+    url: str,
+    html: str,
+    config: CrawlerRunConfig,
+    logger: AsyncLogger,
+    extracted_content: str = "",
+    screenshot: Optional[bytes] = None,
+    pdf_data: Optional[bytes] = None,
+    **kwargs: Dict[str, Any],
+) -> CrawlResult:
+    """
+    Run the CPU-bound part of a crawl on HTML: scraping, markdown generation and extraction.
+
+    This is the synchronous counterpart of AsyncWebCrawler.aprocess_html, which runs the same
+    stages one by one in its processing executor. Being a plain function, it can run in worker
+    processes, see AsyncWebCrawler.aprocess_html_many.
+
+    Args:
+        url: URL the HTML belongs to
+        html: Raw HTML of the page
+        config: Configuration with the scraping, markdown and extraction strategies
+        logger: Logger for timings and warnings
+        extracted_content: Previously extracted content; extraction is skipped if set
+        screenshot: Screenshot data copied into the result
+        pdf_data: PDF data copied into the result
+        **kwargs: Extra parameters passed to the scraping strategy
+
+    Returns:
+        CrawlResult: The processed result
+    """
+    _url = url if not kwargs.get("is_raw_html", False) else "Raw HTML"
+    t1 = time.perf_counter()
+
+    document = create_document(url, html, extracted_content, config)
+    scraped = scrape_html(url, document, config, logger, **kwargs)
+    markdown_result = generate_markdown(url, scraped[0], config)
+
+    # Log processing completion
+    logger.info(
+        message="Processed {url:.50}... | Time: {timing}ms",
+        tag="SCRAPE",
+        params={"url": _url, "timing": int((time.perf_counter() - t1) * 1000)},
+    )
+
+    if needs_extraction(extracted_content, config):
+        extracted_content = extract_content(
+            url, document, markdown_result, config, logger, kwargs.get("is_raw_html", False)
+        )
+
+    return build_crawl_result(
+        url,
+        html,
+        scraped,
+        markdown_result,
+        extracted_content,
+        config,
+        screenshot,
+        pdf_data,
+        time.perf_counter() - t1,
+    )
+
+
+def _timed_stage(fn: Callable, submitted_at: float, *args, **kwargs) -> Tuple[Any, float, float]:
+    """Run a processing stage in an executor, returning its result, queue wait and run time."""
+    started_at = time.time()
+    result = fn(*args, **kwargs)
+    return result, started_at - submitted_at, time.time() - started_at
+
+
+# State of a worker process of aprocess_html_many, set once by the pool initializer
+_worker_config: Optional[CrawlerRunConfig] = None
+_worker_logger: Optional[AsyncLogger] = None
+
+
+def _init_process_worker(config: CrawlerRunConfig, logger: AsyncLogger) -> None:
+    global _worker_config, _worker_logger
+    _worker_config = config
+    _worker_logger = logger
+
+
+def _process_html_in_worker(url: str, html: str) -> CrawlResult:
+    """Process one page in a worker process, turning errors into a failed result."""
+    try:
+        return process_html(
+            url,
+            sanitize_input_encode(html),
+            _worker_config,
+            _worker_logger,
+            is_raw_html=url.startswith("raw:"),
+        )
+    except Exception as e:
+        return CrawlResult(
+            url=url,
+            content="",
+            status_code=500,
+            load_time=0.0,
+            error_message=str(e),
+        )
+
+
 CrawlResultT = TypeVar('CrawlResultT', bound=CrawlResult)
 RunManyReturn = Union[List[CrawlResultT], AsyncGenerator[CrawlResultT, None]]
 
@@ -154,6 +437,7 @@ class AsyncWebCrawler:
         crawl4ai_folder (str): Directory for storing cache.
         base_directory (str): Base directory for storing cache.
         ready (bool): Whether the crawler is ready for use.
+        processing_executor (str or Executor or None): Where aprocess_html runs its CPU-bound stages.
 
         Methods:
             start(): Start the crawler explicitly without using context manager.
@@ -162,6 +446,7 @@ class AsyncWebCrawler:
             awarmup(): Perform warmup sequence.
             arun_many(): Run the crawler for multiple sources.
             aprocess_html(): Process HTML content.
+            aprocess_html_many(): Process many (url, html) pairs in worker processes.
 
     Typical Usage:
         async with AsyncWebCrawler() as crawler:
@@ -188,6 +473,9 @@ class AsyncWebCrawler:
         always_by_pass_cache: Optional[bool] = None,  # Deprecated parameter
         base_directory: str = str(os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home())),
         thread_safe: bool = False,
+        processing_executor: Union[str, Executor, None] = "thread",
+        processing_workers: Optional[int] = None,
+        image_probe: Optional[ImageProbe] = None,
         **kwargs: Dict[str, Any],
     ) -> None:
         """
@@ -200,6 +488,14 @@ class AsyncWebCrawler:
             always_by_pass_cache: Deprecated, use always_bypass_cache instead
             base_directory: Base directory for storing cache
             thread_safe: Whether to use thread-safe operations
+            processing_executor: Where scraping, markdown generation and extraction run, so that
+                                 parsing a large page does not block other crawls on the event loop.
+                                 "thread" (default) or "process" for a pool owned by the crawler,
+                                 an Executor instance to share one, or None to run them inline.
+                                 With "process", the run config and its strategies must be picklable.
+            processing_workers: Number of workers of an owned pool. Default: the executor default
+            image_probe: Prober used when config.probe_images is set. Default: one owned by the
+                         crawler, created on first use
             **kwargs: Additional arguments for backwards compatibility
         """
         # Handle browser configuration
@@ -270,6 +566,21 @@ class AsyncWebCrawler:
         # Thread safety setup
         self._lock = asyncio.Lock() if thread_safe else None
 
+        # Executor for the CPU-bound stages of aprocess_html, created on first use
+        if processing_executor not in ("thread", "process", None) and not isinstance(
+            processing_executor, Executor
+        ):
+            raise ValueError(
+                "processing_executor must be 'thread', 'process', an Executor or None"
+            )
+        self.processing_executor = processing_executor
+        self.processing_workers = processing_workers
+        self._processing_pool: Optional[Executor] = None
+
+        # Image metadata prober, shared by all crawls so its cache and connections are reused
+        self.image_probe = image_probe
+        self._owns_image_probe = image_probe is None
+
         # Initialize directories
         self.crawl4ai_folder = os.path.join(base_directory, ".crawl4ai")
         os.makedirs(self.crawl4ai_folder, exist_ok=True)
@@ -286,7 +597,8 @@ class AsyncWebCrawler:
         This is equivalent to using 'async with' but gives more control over the lifecycle.
 
         This method will:
-        1. Initialize the browser and context
+        1. Initialize the browser and context (deferred to the first crawl that needs
+           a browser when browser_config.lazy_start is set)
         2. Perform warmup sequence
         3. Return the crawler instance for method chaining
 
@@ -307,6 +619,11 @@ class AsyncWebCrawler:
         2. Close any open pages and contexts
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        if self._processing_pool is not None:
+            self._processing_pool.shutdown(wait=False)
+            self._processing_pool = None
+        if self.image_probe is not None and self._owns_image_probe:
+            await self.image_probe.close()
 
     async def __aenter__(self) -> 'AsyncWebCrawler':
         return await self.start()
@@ -525,6 +842,8 @@ class AsyncWebCrawler:
                         crawl_result.response_headers = async_response.response_headers
                         crawl_result.downloaded_files = async_response.downloaded_files
                         crawl_result.ssl_certificate = async_response.ssl_certificate
+                        crawl_result.network_stats = async_response.network_stats
+                        crawl_result.screenshot_path = async_response.screenshot_path
 
                     crawl_result.success = bool(html)
                     crawl_result.session_id = getattr(crawler_config, "session_id", None)
@@ -590,6 +909,59 @@ class AsyncWebCrawler:
                     error_message=error_message
                 )
 
+    def _get_processing_pool(self) -> Optional[Executor]:
+        """Return the executor for processing stages, creating an owned pool on first use."""
+        if isinstance(self.processing_executor, Executor):
+            return self.processing_executor
+        if self._processing_pool is None and self.processing_executor == "thread":
+            self._processing_pool = ThreadPoolExecutor(
+                max_workers=self.processing_workers, thread_name_prefix="crawl4ai-process"
+            )
+        elif self._processing_pool is None and self.processing_executor == "process":
+            self._processing_pool = ProcessPoolExecutor(max_workers=self.processing_workers)
+        return self._processing_pool
+
+    def _get_image_probe(self) -> ImageProbe:
+        """Return the image prober, creating the crawler's own on first use."""
+        if self.image_probe is None:
+            self.image_probe = ImageProbe(logger=self.logger)
+        return self.image_probe
+
+    async def _probe_images(self, media: Dict[str, Any], url: str, stats: Dict[str, Dict[str, float]]) -> None:
+        """Fill file_size and content_type of the scraped images and record the time taken."""
+        started_at = time.perf_counter()
+        await self._get_image_probe().fill_media(media, url)
+        stats["probe_images"] = {"queue_wait": 0.0, "run_time": time.perf_counter() - started_at}
+
+    async def _run_stage(
+        self, name: str, stats: Dict[str, Dict[str, float]], fn: Callable, *args, **kwargs
+    ) -> Any:
+        """
+        Run one processing stage in the processing executor and record how long it waited
+        for a worker and how long it ran.
+
+        Args:
+            name: Stage name used as the key in stats
+            stats: Dict receiving {"queue_wait": seconds, "run_time": seconds} under name
+            fn: The stage function
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Any: The result of fn
+        """
+        pool = self._get_processing_pool()
+        if pool is None:
+            started_at = time.perf_counter()
+            result = fn(*args, **kwargs)
+            stats[name] = {"queue_wait": 0.0, "run_time": time.perf_counter() - started_at}
+            return result
+
+        result, queue_wait, run_time = await asyncio.get_running_loop().run_in_executor(
+            pool, partial(_timed_stage, fn, time.time(), *args, **kwargs)
+        )
+        stats[name] = {"queue_wait": queue_wait, "run_time": run_time}
+        return result
+
     async def aprocess_html(
         self,
         url: str,
@@ -601,56 +973,32 @@ class AsyncWebCrawler:
         verbose: bool,
         **kwargs: Dict[str, Any],
     ) -> CrawlResult:
-        """Process HTML content using the provided configuration."""
-        try:
-            _url = url if not kwargs.get("is_raw_html", False) else "Raw HTML"
-            t1 = time.perf_counter()
-
-            # Get scraping strategy and ensure it has a logger
-            scraping_strategy = config.scraping_strategy
-            if not hasattr(scraping_strategy, "logger"):
-                setattr(scraping_strategy, "logger", self.logger)
-
-            # Process HTML content
-            params = {k: v for k, v in config.dict().items() if k not in ["url"]}
-            # add keys from kwargs to params that doesn't exist in params
-            params.update({k: v for k, v in kwargs.items() if k not in params})
-
-            result = scraping_strategy.scrap(url, html, **params)
-
-            if result is None:
-                raise ValueError(
-                    f"Process HTML, Failed to extract content from the website: {url}"
-                )
+        """
+        Process HTML content using the provided configuration.
 
-        except InvalidCSSSelectorError as e:
-            raise ValueError(str(e))
-        except Exception as e:
-            raise ValueError(
-                f"Process HTML, Failed to extract content from the website: {url}, error: {str(e)}"
-            )
+        Scraping, markdown generation and extraction each run as a separate job in the
+        processing executor, so the event loop keeps serving other crawls meanwhile. How long
+        each stage waited for a worker and ran is reported in result.processing_stats.
 
-        # Extract results - handle both dict and ScrapingResult
-        if isinstance(result, dict):
-            cleaned_html = sanitize_input_encode(result.get("cleaned_html", ""))
-            media = result.get("media", {})
-            links = result.get("links", {})
-            metadata = result.get("metadata", {})
-        else:
-            cleaned_html = sanitize_input_encode(result.cleaned_html)
-            media = result.media.model_dump()
-            links = result.links.model_dump()
-            metadata = result.metadata
+        With config.probe_images, image sizes and types are probed over the network while
+        markdown generation and extraction run, and are awaited just before the result is built.
+        """
+        _url = url if not kwargs.get("is_raw_html", False) else "Raw HTML"
+        t1 = time.perf_counter()
+        stats: Dict[str, Dict[str, float]] = {}
 
-        # Markdown Generation
-        markdown_generator = config.markdown_generator or DefaultMarkdownGenerator()
+        # Parsed at most once and shared by the stages when they run in the same process
+        document = create_document(url, html, extracted_content, config)
 
-        markdown_result = markdown_generator.generate_markdown(
-            cleaned_html=cleaned_html,
-            base_url=url,
+        scraped = await self._run_stage(
+            "scrape", stats, scrape_html, url, document, config, self.logger, **kwargs
+        )
+        probe_task = None
+        if getattr(config, "probe_images", False) and not kwargs.get("is_raw_html", False):
+            probe_task = asyncio.ensure_future(self._probe_images(scraped[1], url, stats))
+        markdown_result = await self._run_stage(
+            "markdown", stats, generate_markdown, url, scraped[0], config
         )
-        markdown_v2 = markdown_result
-        markdown = sanitize_input_encode(markdown_result.raw_markdown)
 
         # Log processing completion
         self.logger.info(
@@ -659,77 +1007,35 @@ class AsyncWebCrawler:
             params={"url": _url, "timing": int((time.perf_counter() - t1) * 1000)},
         )
 
-        # Handle content extraction if needed
-        if (
-            not bool(extracted_content)
-            and config.extraction_strategy
-            and not isinstance(config.extraction_strategy, NoExtractionStrategy)
-        ):
-            t1 = time.perf_counter()
-
-            # Choose content based on input_format
-            content_format = config.extraction_strategy.input_format
-            if content_format == "fit_markdown" and not markdown_result.fit_markdown:
-                self.logger.warning(
-                    message="Fit markdown requested but not available. Falling back to raw markdown.",
-                    tag="EXTRACT",
-                    params={"url": _url},
-                )
-                content_format = "markdown"
-
-            content = {
-                "markdown": markdown,
-                "html": html,
-                "fit_markdown": markdown_result.raw_markdown,
-            }.get(content_format, markdown)
-
-            # Use IdentityChunking for HTML input, otherwise use provided chunking strategy
-            chunking = (
-                IdentityChunking()
-                if content_format == "html"
-                else config.chunking_strategy or RegexChunking()
-            )
-            sections = chunking.chunk(content)
-            extracted_content = config.extraction_strategy.run(url, sections)
-            extracted_content = json.dumps(
-                extracted_content, indent=4, default=str, ensure_ascii=False
-            )
-
-            # Log extraction completion
-            self.logger.info(
-                message="Completed for {url:.50}... | Time: {timing}s",
-                tag="EXTRACT",
-                params={"url": _url, "timing": time.perf_counter() - t1},
+        if needs_extraction(extracted_content, config):
+            extracted_content = await self._run_stage(
+                "extract",
+                stats,
+                extract_content,
+                url,
+                document,
+                markdown_result,
+                config,
+                self.logger,
+                kwargs.get("is_raw_html", False),
             )
 
-        # Handle screenshot and PDF data
-        screenshot_data = screenshot
-        pdf_data = pdf_data
-
-        # Apply HTML formatting if requested
-        if config.prettify:
-            cleaned_html = fast_format_html(cleaned_html)
-
-        # Return complete crawl result
-        return CrawlResult(
-            url=url,
-            content=html,
-            status_code=200,
-            load_time=time.perf_counter() - t1,
-            cleaned_html=cleaned_html,
-            markdown_v2=markdown_v2,
-            markdown=markdown,
-            fit_markdown=markdown_result.fit_markdown,
-            fit_html=markdown_result.fit_html,
-            media=media,
-            links=links,
-            metadata=metadata,
-            screenshot=screenshot_data,
-            pdf=pdf_data,
-            extracted_content=extracted_content,
-            success=True,
-            error_message="",
+        if probe_task is not None:
+            await probe_task
+
+        result = build_crawl_result(
+            url,
+            html,
+            scraped,
+            markdown_result,
+            extracted_content,
+            config,
+            screenshot,
+            pdf_data,
+            time.perf_counter() - t1,
         )
+        result.processing_stats = stats
+        return result
 
     async def arun_many(
         self,
@@ -802,6 +1108,85 @@ class AsyncWebCrawler:
             results = await dispatcher.run_urls(crawler=self, urls=urls, config=config)
             return [transform_result(res) for res in results]
 
+    async def aprocess_html_many(
+        self,
+        pages: Union[Iterable[Tuple[str, str]], AsyncIterable[Tuple[str, str]]],
+        config: Optional[CrawlerRunConfig] = None,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Process HTML that was already fetched, fanning scraping, markdown generation and
+        extraction out over a pool of worker processes. No browser is involved.
+
+        How it works:
+        1. A ProcessPoolExecutor is started; config is sent to each worker once, not per page.
+        2. At most max_in_flight pages are submitted at a time. The next pairs are read from
+           pages only after finished results are yielded, so memory stays bounded however
+           long the input is.
+        3. Results are yielded in completion order. A page that fails yields an empty result
+           with status code 500 instead of stopping the batch.
+        4. The pool is shut down when the generator finishes or is closed early.
+
+        Args:
+            pages: Iterable or async iterable of (url, html) pairs
+            config: Configuration for processing. Its strategies must be picklable.
+            max_workers: Number of worker processes. Default: os.cpu_count()
+            max_in_flight: Maximum number of pages submitted but not yet yielded.
+                           Default: 2 * max_workers
+
+        Yields:
+            CrawlResult: One result per (url, html) pair, in completion order
+        """
+        config = config or CrawlerRunConfig()
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or 2 * max_workers
+
+        if isinstance(pages, AsyncIterable):
+            source = pages.__aiter__()
+
+            async def next_page() -> Optional[Tuple[str, str]]:
+                try:
+                    return await source.__anext__()
+                except StopAsyncIteration:
+                    return None
+        else:
+            source = iter(pages)
+
+            async def next_page() -> Optional[Tuple[str, str]]:
+                return next(source, None)
+
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_process_worker,
+            initargs=(config, self.logger),
+        )
+        pending = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_in_flight:
+                    page = await next_page()
+                    if page is None:
+                        exhausted = True
+                        break
+                    url, html = page
+                    pending.add(
+                        loop.run_in_executor(executor, _process_html_in_worker, url, html)
+                    )
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     async def aclear_cache(self) -> None:
         """Clear the cache database."""
         await async_db_manager.cleanup()
@@ -15,6 +15,7 @@ class CrawlResult(CrawlResponse):
     load_time: float
     screenshot: Optional[bytes] = None
     dom: Optional[str] = None
+    processing_stats: Optional[Dict[str, Dict[str, float]]] = None
 
 class MarkdownGenerationResult(BaseModel):
     markdown: str
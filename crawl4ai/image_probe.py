@@ -0,0 +1,219 @@
+"""Asynchronous probing of image size and type with HEAD requests, shared by every crawl of a crawler."""
+
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Tuple
+from urllib.parse import urljoin
+
+import aiohttp
+
+
+# Statuses of servers that do not answer HEAD; the probe retries with a one-byte ranged GET
+HEAD_UNSUPPORTED_STATUSES = {403, 405, 501}
+
+ImageInfo = Tuple[Optional[int], Optional[str]]  # (size in bytes, content type)
+
+
+def parse_image_headers(headers) -> ImageInfo:
+    """
+    Return the size and content type of an image from the headers of a HEAD response or of a
+    ranged GET response.
+    """
+    size = None
+    content_range = headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        size = int(total) if total.isdigit() else None
+    elif (length := headers.get("Content-Length", "")).isdigit():
+        size = int(length)
+    content_type = headers.get("Content-Type")
+    if content_type:
+        content_type = content_type.split(";", 1)[0].strip().lower() or None
+    return size, content_type
+
+
+class ImageProbe:
+    """
+    Fetches the size and type of images without downloading them, for MediaItem.file_size and
+    MediaItem.content_type.
+
+    How it works:
+    1. All requests go through one pooled aiohttp session, opened on first use.
+    2. At most max_concurrency requests are in flight, whatever the number of pages probing.
+    3. Each URL is sent a HEAD request; servers that refuse HEAD get a GET for one byte and
+       the size is read from Content-Range.
+    4. Results are kept in an LRU cache for ttl seconds, failures for negative_ttl seconds.
+       Concurrent probes of the same URL share one request.
+
+    Attributes:
+        max_concurrency (int): Maximum number of requests in flight
+        timeout (float): Timeout of one request in seconds
+        cache_size (int): Maximum number of URLs kept in the cache
+        ttl (float): Seconds a probed size and type is reused
+        negative_ttl (float): Seconds a failed probe is remembered
+        stats (dict): hits, misses, failures and requests counters
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        timeout: float = 5.0,
+        cache_size: int = 10000,
+        ttl: float = 3600,
+        negative_ttl: float = 300,
+        headers: Optional[Dict[str, str]] = None,
+        logger=None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.headers = headers or {}
+        self.logger = logger
+        self.stats = {"hits": 0, "misses": 0, "failures": 0, "requests": 0}
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._cache: "OrderedDict[str, Tuple[float, ImageInfo]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        """Open the pooled HTTP session."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self):
+        """Close the HTTP session and cancel probes in flight. The cache is kept."""
+        for task in list(self._pending.values()):
+            task.cancel()
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _cached(self, url: str) -> Optional[ImageInfo]:
+        entry = self._cache.get(url)
+        if entry is None:
+            return None
+        expires_at, info = entry
+        if expires_at <= time.monotonic():
+            del self._cache[url]
+            return None
+        self._cache.move_to_end(url)
+        return info
+
+    def _store(self, url: str, info: ImageInfo, ttl: float):
+        self._cache[url] = (time.monotonic() + ttl, info)
+        self._cache.move_to_end(url)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _request(self, url: str) -> Optional[ImageInfo]:
+        async with self._semaphore:
+            self.stats["requests"] += 1
+            async with self.session.head(url, allow_redirects=True) as response:
+                if response.status == 200:
+                    return parse_image_headers(response.headers)
+                if response.status not in HEAD_UNSUPPORTED_STATUSES:
+                    return None
+            self.stats["requests"] += 1
+            async with self.session.get(
+                url, headers={"Range": "bytes=0-0"}, allow_redirects=True
+            ) as response:
+                if response.status in (200, 206):
+                    return parse_image_headers(response.headers)
+                return None
+
+    async def _fetch(self, url: str) -> ImageInfo:
+        try:
+            info = await self._request(url)
+        except Exception as e:
+            info = None
+            if self.logger:
+                self.logger.debug(
+                    message="Image probe failed for {url}: {error}",
+                    tag="IMAGE",
+                    params={"url": url, "error": str(e)},
+                )
+        if info is None:
+            self.stats["failures"] += 1
+            info = (None, None)
+            self._store(url, info, self.negative_ttl)
+        else:
+            self._store(url, info, self.ttl)
+        return info
+
+    async def probe(self, url: str) -> ImageInfo:
+        """
+        Return the size and content type of one image URL.
+
+        Args:
+            url (str): Absolute http(s) URL of the image
+
+        Returns:
+            ImageInfo: (size in bytes, content type), each None when unknown
+        """
+        info = self._cached(url)
+        if info is not None:
+            self.stats["hits"] += 1
+            return info
+
+        task = self._pending.get(url)
+        if task is None:
+            self.stats["misses"] += 1
+            await self.start()
+            # The request is not tied to this caller, so cancelling it leaves other waiters alone
+            task = asyncio.ensure_future(self._fetch(url))
+            self._pending[url] = task
+            task.add_done_callback(lambda _: self._pending.pop(url, None))
+        else:
+            self.stats["hits"] += 1
+        return await asyncio.shield(task)
+
+    async def probe_many(self, urls: Iterable[str]) -> Dict[str, ImageInfo]:
+        """Probe several URLs concurrently, each distinct URL once."""
+        unique = list(dict.fromkeys(urls))
+        infos = await asyncio.gather(*(self.probe(url) for url in unique))
+        return dict(zip(unique, infos))
+
+    async def fill_media(self, media: Dict[str, Any], base_url: str) -> int:
+        """
+        Probe the images of a scraped page and set their file_size and content_type.
+
+        Args:
+            media (Dict[str, Any]): Media dict of the scraping result, updated in place
+            base_url (str): URL of the page, to resolve relative image sources
+
+        Returns:
+            int: Number of images whose size or type is now known
+        """
+        images = [
+            (image, urljoin(base_url, image.get("src") or ""))
+            for image in media.get("images", [])
+        ]
+        images = [(image, url) for image, url in images if url.startswith(("http://", "https://"))]
+        infos = await self.probe_many(url for _, url in images)
+
+        filled = 0
+        for image, url in images:
+            size, content_type = infos[url]
+            image["file_size"] = size
+            image["content_type"] = content_type
+            filled += size is not None or content_type is not None
+        return filled
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return the counters plus the number of cached URLs."""
+        return {**self.stats, "entries": len(self._cache)}
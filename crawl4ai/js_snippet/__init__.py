@@ -1,7 +1,10 @@
 import os
+from functools import lru_cache
 
 
 # Create a function get name of a js script, then load from the CURRENT folder of this script and return its content as string, make sure its error free
+# Scripts are read from disk once per process
+@lru_cache(maxsize=None)
 def load_js_script(script_name):
     # Get the path of the current script
     current_script_path = os.path.dirname(os.path.realpath(__file__))
@@ -16,3 +19,21 @@ def load_js_script(script_name):
     with open(script_path, "r") as f:
         script_content = f.read()
     return script_content
+
+
+def _as_expression(script):
+    """Strip the trailing semicolon so a function script can be embedded as an expression."""
+    return script.strip().rstrip(";")
+
+
+@lru_cache(maxsize=None)
+def load_post_load_script():
+    """
+    Build the combined post-load script: post_load_steps.js with the update_image_dimensions
+    and remove_overlay_elements snippets inlined, so all enabled steps run in one evaluation.
+    """
+    return (
+        load_js_script("post_load_steps")
+        .replace("__UPDATE_IMAGE_DIMENSIONS__", _as_expression(load_js_script("update_image_dimensions")))
+        .replace("__REMOVE_OVERLAY_ELEMENTS__", _as_expression(load_js_script("remove_overlay_elements")))
+    )
@@ -0,0 +1,26 @@
+async ({ quietWindow, timeout }) => {
+    // Resolve true once the DOM has gone quietWindow ms without a mutation, false after timeout ms
+    const start = performance.now();
+    let lastMutation = start;
+    const observer = new MutationObserver(() => {
+        lastMutation = performance.now();
+    });
+    observer.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true,
+    });
+    try {
+        while (true) {
+            const now = performance.now();
+            if (now - lastMutation >= quietWindow) return true;
+            if (now - start >= timeout) return false;
+            await new Promise((resolve) =>
+                setTimeout(resolve, Math.min(50, quietWindow - (now - lastMutation)))
+            );
+        }
+    } finally {
+        observer.disconnect();
+    }
+};
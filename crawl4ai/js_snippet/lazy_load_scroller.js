@@ -0,0 +1,85 @@
+async ({ scrollDelay, timeBudget, settleTime }) => {
+    // Scroll the page one viewport at a time, moving on as soon as lazy content has settled:
+    // no DOM mutations for settleTime ms and no visible image still loading.
+    const startTime = Date.now();
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const nextFrame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+    const outOfTime = () => timeBudget > 0 && Date.now() - startTime > timeBudget;
+    const scrollHeight = () =>
+        Math.max(document.documentElement.scrollHeight, document.body ? document.body.scrollHeight : 0);
+
+    let lastMutation = Date.now();
+    const mutationObserver = new MutationObserver(() => {
+        lastMutation = Date.now();
+    });
+    mutationObserver.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ["src", "srcset", "style", "class"],
+    });
+
+    // Images that scrolled into view but have not finished loading
+    const pending = new Set();
+    const done = (event) => pending.delete(event.target);
+    const intersectionObserver = new IntersectionObserver((entries) => {
+        for (const entry of entries) {
+            const img = entry.target;
+            if (entry.isIntersecting && !img.complete) {
+                pending.add(img);
+                img.addEventListener("load", done, { once: true });
+                img.addEventListener("error", done, { once: true });
+            }
+        }
+    });
+    const observed = new WeakSet();
+    const observeImages = () => {
+        for (const img of document.images) {
+            if (!observed.has(img)) {
+                observed.add(img);
+                intersectionObserver.observe(img);
+            }
+        }
+    };
+
+    const settle = async () => {
+        const stepStart = Date.now();
+        await nextFrame();
+        while (Date.now() - stepStart < scrollDelay && !outOfTime()) {
+            observeImages();
+            for (const img of pending) if (img.complete) pending.delete(img);
+            if (pending.size === 0 && Date.now() - lastMutation >= settleTime) return;
+            await sleep(Math.min(settleTime, 50));
+        }
+    };
+
+    let steps = 0;
+    let position = 0;
+    let height = scrollHeight();
+    try {
+        observeImages();
+        while (!outOfTime()) {
+            position = Math.min(position + window.innerHeight, height);
+            window.scrollTo(0, position);
+            // Give the page at least settleTime to react to the scroll
+            lastMutation = Date.now();
+            steps++;
+            await settle();
+            height = scrollHeight();
+            // Bottom reached and nothing more was appended
+            if (position >= height - 1) break;
+        }
+    } finally {
+        mutationObserver.disconnect();
+        intersectionObserver.disconnect();
+    }
+
+    window.scrollTo(0, height);
+    return {
+        steps,
+        height,
+        pendingImages: pending.size,
+        timedOut: outOfTime(),
+        elapsed: Date.now() - startTime,
+    };
+};
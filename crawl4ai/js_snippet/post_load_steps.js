@@ -0,0 +1,82 @@
+async (steps) => {
+    // Post-load steps run in a single evaluation. Each step is enabled by its key in `steps`
+    // and reports into the returned object.
+    const result = { errors: [] };
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const poll = async (condition, timeout) => {
+        const startTime = Date.now();
+        while (true) {
+            if (condition()) return true;
+            if (Date.now() - startTime > timeout) return false;
+            await sleep(100);
+        }
+    };
+    const bodyIsVisible = () => {
+        const element = document.body;
+        if (!element) return false;
+        const style = window.getComputedStyle(element);
+        return style.display !== "none" && style.visibility !== "hidden" && style.opacity !== "0";
+    };
+
+    if (steps.waitForBody) {
+        result.bodyVisible = await poll(bodyIsVisible, steps.waitForBody);
+        if (!result.bodyVisible) {
+            const body = document.body;
+            const style = body ? window.getComputedStyle(body) : null;
+            result.visibility = body
+                ? {
+                      display: style.display,
+                      visibility: style.visibility,
+                      opacity: style.opacity,
+                      hasContent: body.innerHTML.length,
+                  }
+                : { attached: false };
+        }
+    }
+
+    if (steps.waitForImages) {
+        // Same limit as page.wait_for_load_state("domcontentloaded")
+        await poll(() => document.readyState !== "loading", 30000);
+        result.imagesLoaded = await poll(
+            () => Array.from(document.getElementsByTagName("img")).every((img) => img.complete),
+            steps.waitForImages
+        );
+    }
+
+    if (steps.dimensions) {
+        const { scrollWidth, scrollHeight } = document.documentElement;
+        result.dimensions = { width: scrollWidth, height: scrollHeight };
+    }
+
+    if (steps.needScroll) {
+        result.needScroll = document.documentElement.scrollHeight > window.innerHeight;
+    }
+
+    if (steps.updateImageDimensions) {
+        try {
+            await (__UPDATE_IMAGE_DIMENSIONS__)();
+        } catch (error) {
+            result.errors.push(`update_image_dimensions: ${error}`);
+        }
+    }
+
+    if (steps.removeOverlays) {
+        try {
+            await (__REMOVE_OVERLAY_ELEMENTS__)();
+            // Wait for any animations to complete
+            await sleep(500);
+        } catch (error) {
+            result.errors.push(`remove_overlay_elements: ${error}`);
+        }
+    }
+
+    if (steps.content) {
+        // Same serialization as page.content()
+        let html = "";
+        if (document.doctype) html = new XMLSerializer().serializeToString(document.doctype);
+        if (document.documentElement) html += document.documentElement.outerHTML;
+        result.html = html;
+    }
+
+    return result;
+};
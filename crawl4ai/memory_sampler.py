@@ -0,0 +1,252 @@
+"""Background sampling of system, browser and per-context memory for the dispatchers."""
+
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional
+
+import psutil
+
+MB = 1024 * 1024
+
+ContextMemorySource = Callable[[], Awaitable[Dict[str, float]]]
+
+
+@dataclass
+class MemorySnapshot:
+    """
+    Latest memory figures published by a MemorySampler. Figures are smoothed unless noted.
+
+    Attributes:
+        time (float): When the snapshot was taken (time.time())
+        system_percent (float): Share of system memory in use
+        system_used_mb (float): System memory in use, total minus available
+        system_total_mb (float): Total system memory, not smoothed
+        latest_used_mb (float): System memory in use in the last sample, not smoothed
+        process_tree_mb (float): RSS of this process and its children: the Playwright driver
+                                 and the browsers it launched
+        context_mb (Dict[str, float]): JS heap in use per browser context, from CDP
+                                       Performance.getMetrics
+        page_mb (float): Learned memory cost of one running page
+        active_pages (int): Pages running when the snapshot was taken
+    """
+
+    time: float = 0.0
+    system_percent: float = 0.0
+    system_used_mb: float = 0.0
+    system_total_mb: float = 0.0
+    latest_used_mb: float = 0.0
+    process_tree_mb: float = 0.0
+    context_mb: Dict[str, float] = field(default_factory=dict)
+    page_mb: float = 0.0
+    active_pages: int = 0
+
+
+class MemorySampler:
+    """
+    Samples memory in a background task so the dispatch loop and the crawls never read it
+    themselves, and learns how much memory one page costs.
+
+    How it works:
+    1. Every interval seconds, system memory and the RSS of this process tree are read in a
+       worker thread. Each figure is smoothed with an exponential moving average.
+    2. The dispatcher reports each page it starts and finishes. Samples taken with no page
+       running give the idle memory of the process tree; samples taken with pages running
+       give the memory per page, (process tree - idle) / running pages.
+    3. The per-page estimate follows increases at once and decreases slowly, so a burst of
+       heavy pages is never underestimated.
+    4. projected_percent() adds the estimate for every page started since the last sample,
+       which the sample cannot reflect yet, so admissions in a burst do not overshoot.
+    5. If context_memory is set, the JS heap of each browser context is read in a separate
+       task, bounded by context_timeout, and a new read starts only once the last one is done.
+       A slow page therefore never delays the system memory figures admission depends on;
+       each sample publishes the latest context figures available.
+
+    Attributes:
+        interval (float): Seconds between samples
+        smoothing (float): Weight of a new sample in the moving averages, between 0 and 1
+        min_page_mb (float): Lower bound of the per-page estimate
+        context_memory (ContextMemorySource): Async callable returning the JS heap in MB per
+                                              context, e.g. BrowserManager.get_context_memory
+        sample_contexts (bool): Whether a dispatcher should set context_memory to the JS heap
+                                reader of its crawler's browser. Off by default, since reading
+                                the heap opens a CDP session on every page.
+        context_timeout (float): Seconds a context memory read may take before it is abandoned
+        snapshot (MemorySnapshot): Latest published figures
+        active_pages (int): Pages currently running
+        samples (int): Number of samples taken
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        smoothing: float = 0.3,
+        initial_page_mb: float = 150.0,
+        min_page_mb: float = 20.0,
+        context_memory: Optional[ContextMemorySource] = None,
+        sample_contexts: bool = False,
+        context_timeout: float = 2.0,
+        logger=None,
+    ):
+        self.interval = interval
+        self.smoothing = smoothing
+        self.min_page_mb = min_page_mb
+        self.context_memory = context_memory
+        self.sample_contexts = sample_contexts
+        self.context_timeout = context_timeout
+        self.logger = logger
+        self.snapshot = MemorySnapshot(page_mb=initial_page_mb)
+        self.active_pages = 0
+        self.samples = 0
+        self._started_since_sample = 0
+        self._idle_tree_mb: Optional[float] = None
+        self._process = psutil.Process()
+        self._task: Optional[asyncio.Task] = None
+        self._context_task: Optional[asyncio.Task] = None
+        self._context_mb: Dict[str, float] = {}
+        self._users = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """Take a first sample and start sampling in the background. Calls nest with stop()."""
+        self._users += 1
+        if not self.running:
+            await self.sample()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop sampling once every start() has been matched by a stop()."""
+        self._users = max(0, self._users - 1)
+        if self._users == 0:
+            for task in (self._task, self._context_task):
+                if task is None:
+                    continue
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            self._task = self._context_task = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    def page_started(self):
+        """Record that a page was started."""
+        self.active_pages += 1
+        self._started_since_sample += 1
+
+    def page_finished(self):
+        """Record that a page finished."""
+        self.active_pages = max(0, self.active_pages - 1)
+
+    def projected_percent(self, pages: int = 1) -> float:
+        """
+        Share of system memory expected to be in use once pages more pages run.
+
+        Args:
+            pages (int): Pages about to be started
+
+        Returns:
+            float: Projected percentage of system memory in use
+        """
+        snapshot = self.snapshot
+        if not snapshot.system_total_mb:
+            return snapshot.system_percent
+        # The smoothed figure lags a sudden rise, so never project below the last sample
+        used_mb = max(snapshot.system_used_mb, snapshot.latest_used_mb)
+        used_mb += snapshot.page_mb * (self._started_since_sample + pages)
+        return 100 * used_mb / snapshot.system_total_mb
+
+    def _smooth(self, previous: float, value: float) -> float:
+        if not self.samples:
+            return value
+        return previous + self.smoothing * (value - previous)
+
+    def _read_process_memory(self):
+        memory = psutil.virtual_memory()
+        tree_rss = 0
+        try:
+            processes = [self._process] + self._process.children(recursive=True)
+        except psutil.Error:
+            processes = [self._process]
+        for process in processes:
+            try:
+                tree_rss += process.memory_info().rss
+            except psutil.Error:
+                # Exited between listing and reading, or not ours to read
+                pass
+        return memory, tree_rss / MB
+
+    async def sample(self) -> MemorySnapshot:
+        """Take one sample now and publish the updated snapshot."""
+        active_pages = self.active_pages
+        self._started_since_sample = 0
+        if self.context_memory and (self._context_task is None or self._context_task.done()):
+            self._context_task = asyncio.create_task(self._sample_contexts())
+        memory, tree_mb = await asyncio.to_thread(self._read_process_memory)
+
+        previous = self.snapshot
+        used_mb = (memory.total - memory.available) / MB
+        page_mb = previous.page_mb
+        if active_pages == 0:
+            self._idle_tree_mb = (
+                tree_mb
+                if self._idle_tree_mb is None
+                else self._idle_tree_mb + self.smoothing * (tree_mb - self._idle_tree_mb)
+            )
+        elif self._idle_tree_mb is not None:
+            measured = max(self.min_page_mb, (tree_mb - self._idle_tree_mb) / active_pages)
+            page_mb = measured if measured > page_mb else page_mb + self.smoothing * (measured - page_mb)
+
+        self.snapshot = MemorySnapshot(
+            time=time.time(),
+            system_percent=self._smooth(previous.system_percent, memory.percent),
+            system_used_mb=self._smooth(previous.system_used_mb, used_mb),
+            system_total_mb=memory.total / MB,
+            latest_used_mb=used_mb,
+            process_tree_mb=self._smooth(previous.process_tree_mb, tree_mb),
+            context_mb=self._context_mb,
+            page_mb=page_mb,
+            active_pages=active_pages,
+        )
+        self.samples += 1
+        return self.snapshot
+
+    async def _sample_contexts(self):
+        """Read the JS heap of each context and smooth it into the published figures."""
+        try:
+            context_mb = await asyncio.wait_for(self.context_memory(), self.context_timeout)
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(
+                    message="Context memory sampling failed: {error}",
+                    tag="MEMORY",
+                    params={"error": str(e) or type(e).__name__},
+                )
+            return
+        previous = self._context_mb
+        self._context_mb = {
+            key: previous[key] + self.smoothing * (value - previous[key]) if key in previous else value
+            for key, value in context_mb.items()
+        }
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.sample()
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(
+                        message="Memory sampling failed: {error}",
+                        tag="MEMORY",
+                        params={"error": str(e)},
+                    )
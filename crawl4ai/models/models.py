@@ -104,6 +104,7 @@ class CrawlResult(BaseModel):
     links: Dict[str, List[Dict]] = {}
     downloaded_files: Optional[List[str]] = None
     screenshot: Optional[str] = None
+    screenshot_path: Optional[str] = None
     pdf: Optional[bytes] = None
     markdown: Optional[Union[str, MarkdownGenerationResult]] = None
     markdown_v2: Optional[MarkdownGenerationResult] = None
@@ -118,6 +119,8 @@ class CrawlResult(BaseModel):
     ssl_certificate: Optional[SSLCertificate] = None
     dispatch_result: Optional[DispatchResult] = None
     redirected_url: Optional[str] = None
+    network_stats: Optional[Dict[str, Any]] = None
+    processing_stats: Optional[Dict[str, Dict[str, float]]] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -128,11 +131,13 @@ class AsyncCrawlResponse(BaseModel):
     response_headers: Dict[str, str]
     status_code: int
     screenshot: Optional[str] = None
+    screenshot_path: Optional[str] = None
     pdf_data: Optional[bytes] = None
     get_delayed_content: Optional[Callable[[Optional[float]], Awaitable[str]]] = None
     downloaded_files: Optional[List[str]] = None
     ssl_certificate: Optional[SSLCertificate] = None
     redirected_url: Optional[str] = None
+    network_stats: Optional[Dict[str, Any]] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -150,6 +155,8 @@ class MediaItem(BaseModel):
     group_id: Optional[int] = 0
     format: Optional[str] = None
     width: Optional[int] = None
+    file_size: Optional[int] = None
+    content_type: Optional[str] = None
 
 
 class Link(BaseModel):
@@ -0,0 +1,209 @@
+"""Stores for the per-domain state of a RateLimiter, in process or shared between processes."""
+
+import os
+import time
+import asyncio
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from .models import DomainState
+
+T = TypeVar("T")
+
+
+class RateLimitStore(ABC):
+    """
+    Where a RateLimiter keeps the delay, fail count and last request time of each domain.
+
+    Every change goes through update(), which applies a function to the state of one domain
+    atomically. Reserving the next request slot is a read-check-write, so with a shared store
+    two processes can never both claim the same slot.
+    """
+
+    @abstractmethod
+    def update(self, domain: str, fn: Callable[[DomainState], T]) -> T:
+        """
+        Atomically read the state of domain, let fn modify it in place, store it and return
+        what fn returned. A domain without state starts from DomainState().
+
+        fn may be called more than once if the store retries a conflicting update, so it must
+        not have side effects other than modifying the state.
+        """
+
+    async def aupdate(self, domain: str, fn: Callable[[DomainState], T]) -> T:
+        """
+        update() for the event loop. Stores that do I/O run it in a worker thread, so waiting
+        for another process never stalls the crawls of this one.
+        """
+        return self.update(domain, fn)
+
+    @abstractmethod
+    def get(self, domain: str) -> Optional[DomainState]:
+        """Return a copy of the state of domain, or None if it was never requested."""
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    State in a dict of this process. The default; updates are atomic because they run on the
+    event loop without awaiting.
+    """
+
+    def __init__(self, domains: Optional[Dict[str, DomainState]] = None):
+        self.domains = domains if domains is not None else {}
+
+    def update(self, domain: str, fn: Callable[[DomainState], T]) -> T:
+        state = self.domains.get(domain)
+        if state is None:
+            state = self.domains[domain] = DomainState()
+        return fn(state)
+
+    def get(self, domain: str) -> Optional[DomainState]:
+        state = self.domains.get(domain)
+        return DomainState(**vars(state)) if state else None
+
+
+class SQLiteRateLimitStore(RateLimitStore):
+    """
+    State in a SQLite database shared by every process on the machine that opens the same file.
+
+    How it works:
+    1. The database runs in WAL mode, so reads never wait for writers.
+    2. update() runs in a BEGIN IMMEDIATE transaction, which takes the write lock before the
+       state is read. Concurrent updates of any domain are serialized; each takes tens of
+       microseconds.
+    3. Each thread of each process uses its own connection, opened on first use.
+    4. aupdate() runs update() in a worker thread. The thread waits at most busy_timeout
+       for the lock; the attempt is then retried after a non-blocking sleep until timeout.
+
+    Attributes:
+        path (str): Database file
+        timeout (float): Seconds aupdate() keeps retrying a locked database before raising
+        busy_timeout (float): Seconds one attempt waits for the write lock before raising
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0, busy_timeout: float = 0.1):
+        self.path = path
+        self.timeout = timeout
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        # A forked child must not reuse its parent's connection
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=self.busy_timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS domain_state (
+                    domain TEXT PRIMARY KEY,
+                    last_request_time REAL NOT NULL,
+                    current_delay REAL NOT NULL,
+                    fail_count INTEGER NOT NULL
+                )
+                """
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def update(self, domain: str, fn: Callable[[DomainState], T]) -> T:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT last_request_time, current_delay, fail_count FROM domain_state WHERE domain = ?",
+                (domain,),
+            ).fetchone()
+            state = DomainState(*row) if row else DomainState()
+            result = fn(state)
+            connection.execute(
+                "INSERT OR REPLACE INTO domain_state VALUES (?, ?, ?, ?)",
+                (domain, state.last_request_time, state.current_delay, state.fail_count),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return result
+
+    async def aupdate(self, domain: str, fn: Callable[[DomainState], T]) -> T:
+        deadline = time.monotonic() + self.timeout
+        delay = 0.01
+        while True:
+            try:
+                return await asyncio.to_thread(self.update, domain, fn)
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) or time.monotonic() >= deadline:
+                    raise
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    def get(self, domain: str) -> Optional[DomainState]:
+        row = self._connection().execute(
+            "SELECT last_request_time, current_delay, fail_count FROM domain_state WHERE domain = ?",
+            (domain,),
+        ).fetchone()
+        return DomainState(*row) if row else None
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    State in Redis, shared by processes on any number of machines. Each domain is a hash
+    under key_prefix + domain.
+
+    update() is an optimistic WATCH/MULTI transaction, retried when another client changed
+    the domain in between. Takes a synchronous redis-py client, or any client with the same
+    transaction(), hgetall(), multi() and hset() methods.
+
+    Attributes:
+        client: Redis client
+        key_prefix (str): Prefix of the hash keys
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "crawl4ai:rate_limit:"):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @staticmethod
+    def _decode(values: Dict[Any, Any]) -> Optional[DomainState]:
+        if not values:
+            return None
+        values = {
+            (k.decode() if isinstance(k, bytes) else k): float(v) for k, v in values.items()
+        }
+        return DomainState(
+            last_request_time=values.get("last_request_time", 0),
+            current_delay=values.get("current_delay", 0),
+            fail_count=int(values.get("fail_count", 0)),
+        )
+
+    def update(self, domain: str, fn: Callable[[DomainState], T]) -> T:
+        key = self.key_prefix + domain
+
+        def transaction(pipe) -> T:
+            state = self._decode(pipe.hgetall(key)) or DomainState()
+            result = fn(state)
+            pipe.multi()
+            pipe.hset(
+                key,
+                mapping={
+                    "last_request_time": state.last_request_time,
+                    "current_delay": state.current_delay,
+                    "fail_count": state.fail_count,
+                },
+            )
+            return result
+
+        return self.client.transaction(transaction, key, value_from_callable=True)
+
+    async def aupdate(self, domain: str, fn: Callable[[DomainState], T]) -> T:
+        return await asyncio.to_thread(self.update, domain, fn)
+
+    def get(self, domain: str) -> Optional[DomainState]:
+        return self._decode(self.client.hgetall(self.key_prefix + domain))
@@ -4,7 +4,10 @@ import ssl
 import socket
 import base64
 import json
-from typing import Dict, Any, Optional
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 import OpenSSL.crypto
 from pathlib import Path
@@ -19,6 +22,7 @@ class SSLCertificate:
 
         Methods:
             from_url(url: str, timeout: int = 10) -> Optional['SSLCertificate']: Create SSLCertificate instance from a URL.
+            afrom_url(url: str, timeout: int = 10) -> Optional['SSLCertificate']: Async version of from_url.
             from_file(file_path: str) -> Optional['SSLCertificate']: Create SSLCertificate instance from a file.
             from_binary(binary_data: bytes) -> Optional['SSLCertificate']: Create SSLCertificate instance from binary data.
             export_as_pem() -> str: Export the certificate as PEM format.
@@ -51,32 +55,83 @@ class SSLCertificate:
             with socket.create_connection((hostname, 443), timeout=timeout) as sock:
                 with context.wrap_socket(sock, server_hostname=hostname) as ssock:
                     cert_binary = ssock.getpeercert(binary_form=True)
-                    x509 = OpenSSL.crypto.load_certificate(
-                        OpenSSL.crypto.FILETYPE_ASN1, cert_binary
-                    )
-
-                    cert_info = {
-                        "subject": dict(x509.get_subject().get_components()),
-                        "issuer": dict(x509.get_issuer().get_components()),
-                        "version": x509.get_version(),
-                        "serial_number": hex(x509.get_serial_number()),
-                        "not_before": x509.get_notBefore(),
-                        "not_after": x509.get_notAfter(),
-                        "fingerprint": x509.digest("sha256").hex(),
-                        "signature_algorithm": x509.get_signature_algorithm(),
-                        "raw_cert": base64.b64encode(cert_binary),
-                    }
-
-                    # Add extensions
-                    extensions = []
-                    for i in range(x509.get_extension_count()):
-                        ext = x509.get_extension(i)
-                        extensions.append(
-                            {"name": ext.get_short_name(), "value": str(ext)}
-                        )
-                    cert_info["extensions"] = extensions
-
-                    return SSLCertificate(cert_info)
+                    return SSLCertificate.from_binary(cert_binary)
+
+        except Exception:
+            return None
+
+    @staticmethod
+    async def afrom_url(url: str, timeout: int = 10) -> Optional["SSLCertificate"]:
+        """
+        Async version of from_url. The connection and TLS handshake run on the event loop
+        without blocking it.
+
+        Args:
+            url (str): URL of the website.
+            timeout (int): Timeout for the connection (default: 10).
+
+        Returns:
+            Optional[SSLCertificate]: SSLCertificate instance if successful, None otherwise.
+        """
+        try:
+            hostname = urlparse(url).netloc
+            if ":" in hostname:
+                hostname = hostname.split(":")[0]
+
+            context = ssl.create_default_context()
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    hostname, 443, ssl=context, server_hostname=hostname
+                ),
+                timeout=timeout,
+            )
+            try:
+                cert_binary = writer.get_extra_info("ssl_object").getpeercert(
+                    binary_form=True
+                )
+            finally:
+                writer.close()
+            return SSLCertificate.from_binary(cert_binary)
+
+        except Exception:
+            return None
+
+    @staticmethod
+    def from_binary(binary_data: bytes) -> Optional["SSLCertificate"]:
+        """
+        Create SSLCertificate instance from a DER encoded certificate.
+
+        Args:
+            binary_data (bytes): The certificate in DER format.
+
+        Returns:
+            Optional[SSLCertificate]: SSLCertificate instance if successful, None otherwise.
+        """
+        try:
+            x509 = OpenSSL.crypto.load_certificate(
+                OpenSSL.crypto.FILETYPE_ASN1, binary_data
+            )
+
+            cert_info = {
+                "subject": dict(x509.get_subject().get_components()),
+                "issuer": dict(x509.get_issuer().get_components()),
+                "version": x509.get_version(),
+                "serial_number": hex(x509.get_serial_number()),
+                "not_before": x509.get_notBefore(),
+                "not_after": x509.get_notAfter(),
+                "fingerprint": x509.digest("sha256").hex(),
+                "signature_algorithm": x509.get_signature_algorithm(),
+                "raw_cert": base64.b64encode(binary_data),
+            }
+
+            # Add extensions
+            extensions = []
+            for i in range(x509.get_extension_count()):
+                ext = x509.get_extension(i)
+                extensions.append({"name": ext.get_short_name(), "value": str(ext)})
+            cert_info["extensions"] = extensions
+
+            return SSLCertificate(cert_info)
 
         except Exception:
             return None
@@ -182,3 +237,84 @@ class SSLCertificate:
     def fingerprint(self) -> str:
         """Get certificate fingerprint."""
         return self._cert_info.get("fingerprint", "")
+
+
+class SSLCertificateCache:
+    """
+    Per-host TTL cache in front of SSLCertificate.afrom_url.
+
+    Concurrent lookups for the same host share a single handshake. Failed lookups are cached
+    for failure_ttl so an unreachable host is not retried for every URL.
+
+    Attributes:
+        ttl (float): Seconds a fetched certificate is reused.
+        failure_ttl (float): Seconds a failed lookup is remembered.
+        max_size (int): Maximum number of hosts kept; least recently used hosts are dropped first.
+        timeout (int): Connection timeout for each handshake.
+        hits (int): Lookups served from the cache or joined to an in-flight handshake.
+        misses (int): Lookups that started a handshake.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600,
+        failure_ttl: float = 60,
+        max_size: int = 1024,
+        timeout: int = 10,
+    ):
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.max_size = max_size
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Optional[SSLCertificate]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def get(self, url: str) -> Optional[SSLCertificate]:
+        """
+        Get the certificate of the host serving url.
+
+        Args:
+            url (str): URL of the website.
+
+        Returns:
+            Optional[SSLCertificate]: The certificate, or None if it could not be fetched.
+        """
+        hostname = urlparse(url).hostname
+        if not hostname:
+            return None
+
+        entry = self._entries.get(hostname)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(hostname)
+            self.hits += 1
+            return entry[1]
+
+        fetch = self._inflight.get(hostname)
+        if fetch is None:
+            self.misses += 1
+            fetch = asyncio.ensure_future(self._fetch(hostname))
+            self._inflight[hostname] = fetch
+        else:
+            self.hits += 1
+        # Shielded so one cancelled crawl does not cancel the handshake others are waiting on
+        return await asyncio.shield(fetch)
+
+    async def _fetch(self, hostname: str) -> Optional[SSLCertificate]:
+        try:
+            cert = await SSLCertificate.afrom_url(
+                f"https://{hostname}", timeout=self.timeout
+            )
+            ttl = self.ttl if cert else self.failure_ttl
+            self._entries[hostname] = (time.monotonic() + ttl, cert)
+            self._entries.move_to_end(hostname)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return cert
+        finally:
+            self._inflight.pop(hostname, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of cached hosts."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
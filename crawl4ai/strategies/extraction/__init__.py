@@ -12,9 +12,14 @@ from .extraction_strategy import (
 
 from .content_scraping_strategy import (
     ContentScrapingStrategy,
-    WebScrapingStrategy
+    WebScrapingStrategy,
+    SinglePassScrapingStrategy
 )
 
+from .parsed_document import ParsedDocument
+from .selector_cache import SelectorCache, selector_cache
+from .bm25_scoring import BM25Index, StemCache, stem_cache
+
 __all__ = [
     'ExtractionStrategy',
     'NoExtractionStrategy',
@@ -24,5 +29,12 @@ __all__ = [
     'JsonCssExtractionStrategy',
     'JsonXPathExtractionStrategy',
     'ContentScrapingStrategy',
-    'WebScrapingStrategy'
+    'WebScrapingStrategy',
+    'SinglePassScrapingStrategy',
+    'ParsedDocument',
+    'SelectorCache',
+    'selector_cache',
+    'BM25Index',
+    'StemCache',
+    'stem_cache'
 ]
@@ -0,0 +1,188 @@
+"""BM25 scoring of text chunks with NumPy, and a process-wide cache of stemmed words."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+from snowballstemmer import stemmer
+
+
+class StemCache:
+    """
+    Size-bounded LRU cache of stemmed words, shared by every BM25 filter in the process.
+
+    Pages of one site, and most pages of one language, use largely the same words, and a
+    Snowball stemmer is pure Python and costs microseconds per word. Each distinct word is
+    stemmed once per process instead of once per occurrence.
+
+    How it works:
+    1. Words are looked up by (language, word), all the distinct words of a page at once.
+    2. Missing words are stemmed outside the lock with a stemmer of the calling thread,
+       since Snowball stemmers keep state between calls and are not thread-safe.
+    3. When max_size entries are stored the least recently used one is dropped.
+
+    Attributes:
+        max_size (int): Maximum number of stemmed words kept
+        hits (int): Words found in the cache
+        misses (int): Words that had to be stemmed
+        evictions (int): Words dropped to stay within max_size
+    """
+
+    def __init__(self, max_size: int = 100000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stemmer(self, language: str):
+        stemmers = self._local.__dict__.setdefault("stemmers", {})
+        if language not in stemmers:
+            stemmers[language] = stemmer(language)
+        return stemmers[language]
+
+    def stem_words(self, words: Iterable[str], language: str = "english") -> Dict[str, str]:
+        """
+        Stem words, each distinct word once.
+
+        Args:
+            words (Iterable[str]): Words to stem, repeats allowed
+            language (str): Snowball stemmer language
+
+        Returns:
+            Dict[str, str]: Stem of each distinct word
+        """
+        stems: Dict[str, str] = {}
+        missing: List[str] = []
+        with self._lock:
+            for word in set(words):
+                key = (language, word)
+                stem = self._entries.get(key)
+                if stem is None:
+                    missing.append(word)
+                else:
+                    self._entries.move_to_end(key)
+                    stems[word] = stem
+            self.hits += len(stems)
+            self.misses += len(missing)
+
+        if missing:
+            stem_word = self._stemmer(language).stemWord
+            new_stems = {word: stem_word(word) for word in missing}
+            stems.update(new_stems)
+            with self._lock:
+                for word, stem in new_stems.items():
+                    self._entries[(language, word)] = stem
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return stems
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hits, misses, the hit rate, evictions and the number of entries."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+    def clear(self):
+        """Drop every stemmed word and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# The cache shared by every BM25 filter in this process
+stem_cache = StemCache()
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a corpus of token lists, scored with NumPy. Gives the same scores as
+    rank_bm25.BM25Okapi.
+
+    How it works:
+    1. Tokens are numbered and the corpus is stored as a sparse term-frequency matrix in
+       coordinate form: one (document, term, count) entry per distinct term of a document.
+    2. Document frequencies and IDF are computed for all terms at once. Terms in more than
+       half of the documents get epsilon times the average IDF, as in BM25Okapi.
+    3. A query only touches the matrix entries of its own terms; their contributions are
+       summed per document with np.bincount.
+
+    Attributes:
+        k1 (float): Term frequency saturation
+        b (float): Document length normalization
+        epsilon (float): Floor of the IDF of very common terms, relative to the average IDF
+        corpus_size (int): Number of documents
+        avgdl (float): Average document length in tokens
+        vocabulary (Dict[str, int]): Term id of each token
+        rows, cols, counts (np.ndarray): Document, term id and frequency of each matrix entry
+        doc_len (np.ndarray): Length of each document in tokens
+        idf (np.ndarray): IDF of each term id
+    """
+
+    def __init__(
+        self,
+        corpus: Sequence[Sequence[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.corpus_size = len(corpus)
+
+        vocabulary: Dict[str, int] = {}
+        term_ids = [vocabulary.setdefault(token, len(vocabulary)) for doc in corpus for token in doc]
+        self.vocabulary = vocabulary
+        vocabulary_size = max(len(vocabulary), 1)
+
+        self.doc_len = np.fromiter(
+            (len(doc) for doc in corpus), dtype=np.int64, count=self.corpus_size
+        )
+        self.avgdl = float(self.doc_len.mean()) if self.corpus_size else 0.0
+
+        doc_ids = np.repeat(np.arange(self.corpus_size, dtype=np.int64), self.doc_len)
+        keys, self.counts = np.unique(
+            doc_ids * vocabulary_size + np.asarray(term_ids, dtype=np.int64), return_counts=True
+        )
+        self.rows = keys // vocabulary_size
+        self.cols = keys % vocabulary_size
+
+        doc_freq = np.bincount(self.cols, minlength=len(vocabulary))
+        self.idf = np.log(self.corpus_size - doc_freq + 0.5) - np.log(doc_freq + 0.5)
+        if len(vocabulary):
+            negative = self.idf < 0
+            self.idf[negative] = self.epsilon * self.idf.mean()
+
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        """
+        Score every document against a tokenized query.
+
+        Args:
+            query (Sequence[str]): Query tokens; a repeated token counts once per occurrence
+
+        Returns:
+            np.ndarray: One score per document, 0 for documents sharing no term with the query
+        """
+        query_ids = [self.vocabulary[token] for token in query if token in self.vocabulary]
+        if not query_ids:
+            return np.zeros(self.corpus_size)
+
+        query_weight = np.bincount(query_ids, minlength=len(self.vocabulary))
+        entries = query_weight[self.cols] > 0
+        rows, cols = self.rows[entries], self.cols[entries]
+        tf = self.counts[entries]
+
+        norm = self.k1 * (1 - self.b + self.b * self.doc_len[rows] / self.avgdl)
+        contributions = query_weight[cols] * self.idf[cols] * (tf * (self.k1 + 1) / (tf + norm))
+        return np.bincount(rows, weights=contributions, minlength=self.corpus_size)
@@ -2,15 +2,19 @@ import re
 import time
 from bs4 import BeautifulSoup, Tag
 from typing import List, Tuple, Dict, Optional
-from rank_bm25 import BM25Okapi
 from collections import deque
-from bs4 import NavigableString, Comment
+from bs4 import NavigableString, Comment, CData
+from bs4.builder import HTMLTreeBuilder
+from bs4.element import AttributeValueWithCharsetSubstitution
 from .utils import clean_tokens, perform_completion_with_backoff, escape_json_string, sanitize_html, get_home_folder, extract_xml_data
 from abc import ABC, abstractmethod
 import math
+import numpy as np
+from itertools import chain
 from snowballstemmer import stemmer
 from .config import DEFAULT_PROVIDER, OVERLAP_RATE, WORD_TOKEN_RATE
 from .models import TokenUsage
+from .bm25_scoring import BM25Index, stem_cache
 from .prompts import PROMPT_FILTER_CONTENT
 import os
 import json
@@ -360,8 +364,10 @@ class BM25ContentFilter(RelevantContentFilter):
     How it works:
     1. Extracts page metadata with fallbacks.
     2. Extracts text chunks from the body element.
-    3. Tokenizes the corpus and query.
-    4. Applies BM25 algorithm to calculate scores for each chunk.
+    3. Tokenizes the corpus and query. Each distinct word is stemmed once, through the
+       stem cache shared by all filters of the process.
+    4. Applies BM25 algorithm to calculate scores for each chunk, with NumPy over a sparse
+       term-frequency matrix.
     5. Filters out chunks below the threshold.
     6. Sorts chunks by score in descending order.
     7. Returns the top N chunks.
@@ -373,6 +379,7 @@ class BM25ContentFilter(RelevantContentFilter):
 
         Methods:
             filter_content(self, html: str, min_word_threshold: int = None)
+            filter_many(self, htmls: List[str], min_word_threshold: int = None, query: str = None)
     """
 
     def __init__(
@@ -407,8 +414,31 @@ class BM25ContentFilter(RelevantContentFilter):
             "pre": 1.5,
             "th": 1.5,  # Table headers
         }
+        self.language = language
         self.stemmer = stemmer(language)
 
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Lowercases, stems and cleans the words of a text, keeping repeats.
+
+        Args:
+            text (str): Text to tokenize, e.g. the query.
+
+        Returns:
+            List[str]: Stemmed tokens without stop words and noise.
+        """
+        words = text.lower().split()
+        stems = stem_cache.stem_words(words, self.language)
+        return clean_tokens([stems[word] for word in words])
+
+    def _tokenize_chunks(self, chunks: List[str]) -> List[List[str]]:
+        """Tokenizes many chunks, stemming and cleaning each distinct word once"""
+        chunk_words = [chunk.lower().split() for chunk in chunks]
+        stems = stem_cache.stem_words(chain.from_iterable(chunk_words), self.language)
+        kept = set(clean_tokens(list(set(stems.values()))))
+        tokens = {word: stem for word, stem in stems.items() if stem in kept}
+        return [[tokens[word] for word in words if word in tokens] for words in chunk_words]
+
     def filter_content(self, html: str, min_word_threshold: int = None) -> List[str]:
         """
         Implements content filtering using BM25 algorithm with priority tag handling.
@@ -424,6 +454,39 @@ class BM25ContentFilter(RelevantContentFilter):
         Returns:
             List[str]: List of filtered text chunks.
         """
+        return self._filter_page(html, min_word_threshold)
+
+    def filter_many(
+        self, htmls: List[str], min_word_threshold: int = None, query: str = None
+    ) -> List[List[str]]:
+        """
+        Filters a batch of pages against one query, tokenized once for the whole batch.
+
+        Each page is scored on its own, so every result equals filter_content() of that page
+        with the same query. Stemmed words are shared between pages through the stem cache.
+
+        Args:
+            htmls (List[str]): HTML content of the pages.
+            min_word_threshold (int): Minimum word threshold for filtering (optional).
+            query (str): Query for all pages. Default: user_query, or else the metadata of
+                         each page.
+
+        Returns:
+            List[List[str]]: Filtered chunks of each page, in the order of htmls.
+        """
+        query = query or self.user_query
+        tokenized_query = self.tokenize(query) if query else None
+        return [
+            self._filter_page(html, min_word_threshold, tokenized_query) for html in htmls
+        ]
+
+    def _filter_page(
+        self,
+        html: str,
+        min_word_threshold: int = None,
+        tokenized_query: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Filters one page; the query is taken from the page when tokenized_query is None"""
         if not html or not isinstance(html, str):
             return []
 
@@ -435,65 +498,35 @@ class BM25ContentFilter(RelevantContentFilter):
             soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
         body = soup.find("body")
 
-        query = self.extract_page_query(soup, body)
+        if tokenized_query is None:
+            query = self.extract_page_query(soup, body)
 
-        if not query:
-            return []
-            # return [self.clean_element(soup)]
+            if not query:
+                return []
+                # return [self.clean_element(soup)]
+
+            tokenized_query = self.tokenize(query)
 
         candidates = self.extract_text_chunks(body, min_word_threshold)
 
         if not candidates:
             return []
 
-        # Tokenize corpus
-        # tokenized_corpus = [chunk.lower().split() for _, chunk, _, _ in candidates]
-        # tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[ps.stem(word) for word in chunk.lower().split()]
-        #                 for _, chunk, _, _ in candidates]
-        # tokenized_query = [ps.stem(word) for word in query.lower().split()]
-
-        tokenized_corpus = [
-            [self.stemmer.stemWord(word) for word in chunk.lower().split()]
-            for _, chunk, _, _ in candidates
-        ]
-        tokenized_query = [
-            self.stemmer.stemWord(word) for word in query.lower().split()
-        ]
-
-        # tokenized_corpus = [[self.stemmer.stemWord(word) for word in tokenize_text(chunk.lower())]
-        #            for _, chunk, _, _ in candidates]
-        # tokenized_query = [self.stemmer.stemWord(word) for word in tokenize_text(query.lower())]
-
-        # Clean from stop words and noise
-        tokenized_corpus = [clean_tokens(tokens) for tokens in tokenized_corpus]
-        tokenized_query = clean_tokens(tokenized_query)
+        # Tokenize corpus; cleaned from stop words and noise
+        tokenized_corpus = self._tokenize_chunks([chunk for _, chunk, _, _ in candidates])
 
-        bm25 = BM25Okapi(tokenized_corpus)
-        scores = bm25.get_scores(tokenized_query)
+        scores = BM25Index(tokenized_corpus).get_scores(tokenized_query)
 
         # Adjust scores with tag weights
-        adjusted_candidates = []
-        for score, (index, chunk, tag_type, tag) in zip(scores, candidates):
-            tag_weight = self.priority_tags.get(tag.name, 1.0)
-            adjusted_score = score * tag_weight
-            adjusted_candidates.append((adjusted_score, index, chunk, tag))
-
-        # Filter candidates by threshold
-        selected_candidates = [
-            (index, chunk, tag)
-            for adjusted_score, index, chunk, tag in adjusted_candidates
-            if adjusted_score >= self.bm25_threshold
-        ]
-
-        if not selected_candidates:
-            return []
-
-        # Sort selected candidates by original document order
-        selected_candidates.sort(key=lambda x: x[0])
+        tag_weights = np.fromiter(
+            (self.priority_tags.get(tag.name, 1.0) for _, _, _, tag in candidates),
+            dtype=float,
+            count=len(candidates),
+        )
+        selected = np.flatnonzero(scores * tag_weights >= self.bm25_threshold)
 
-        return [self.clean_element(tag) for _, _, tag in selected_candidates]
+        # Candidates are in original document order
+        return [self.clean_element(candidates[i][3]) for i in selected]
 
 class PruningContentFilter(RelevantContentFilter):
     """
@@ -643,60 +676,163 @@ class PruningContentFilter(RelevantContentFilter):
         """
         Prunes the tree starting from the given node.
 
+        How it works:
+        1. The text length, markup length and link text length of the node and of every
+           tag below it are computed in one bottom-up pass (see _subtree_metrics). Asking
+           each node for get_text() and encode_contents() would walk its subtree again,
+           which makes pruning quadratic on deep pages.
+        2. Nodes are then scored top-down. A node below the threshold is removed with its
+           subtree; the children of a kept node are scored next.
+
+        A node is scored before anything below it is removed, so the metrics of the
+        original tree are the ones it is judged on.
+
         Args:
             node (Tag): The node from which the pruning starts.
         """
         if not node or not hasattr(node, "name") or node.name is None:
             return
 
-        text_len = len(node.get_text(strip=True))
-        tag_len = len(node.encode_contents().decode("utf-8"))
-        link_text_len = sum(
-            len(s.strip())
-            for s in (a.string for a in node.find_all("a", recursive=False))
-            if s
-        )
-
-        metrics = {
-            "node": node,
-            "tag_name": node.name,
-            "text_len": text_len,
-            "tag_len": tag_len,
-            "link_text_len": link_text_len,
-        }
+        subtree_metrics = self._subtree_metrics(node)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            text_len, tag_len, link_text_len, word_count = subtree_metrics[id(node)]
+            metrics = {
+                "node": node,
+                "tag_name": node.name,
+                "text_len": text_len,
+                "tag_len": tag_len,
+                "link_text_len": link_text_len,
+                "word_count": word_count,
+            }
+
+            if self._should_remove(metrics, text_len, tag_len, link_text_len):
+                node.decompose()
+            else:
+                stack.extend(
+                    reversed([child for child in node.children if isinstance(child, Tag)])
+                )
 
+    def _should_remove(self, metrics, text_len, tag_len, link_text_len) -> bool:
+        """Decides whether a node scores below the fixed or dynamic threshold"""
         score = self._compute_composite_score(metrics, text_len, tag_len, link_text_len)
 
         if self.threshold_type == "fixed":
-            should_remove = score < self.threshold
-        else:  # dynamic
-            tag_importance = self.tag_importance.get(node.name, 0.7)
-            text_ratio = text_len / tag_len if tag_len > 0 else 0
-            link_ratio = link_text_len / text_len if text_len > 0 else 1
-
-            threshold = self.threshold  # base threshold
-            if tag_importance > 1:
-                threshold *= 0.8
-            if text_ratio > 0.4:
-                threshold *= 0.9
-            if link_ratio > 0.6:
-                threshold *= 1.2
-
-            should_remove = score < threshold
-
-        if should_remove:
-            node.decompose()
-        else:
-            children = [child for child in node.children if hasattr(child, "name")]
-            for child in children:
-                self._prune_tree(child)
+            return score < self.threshold
+
+        # dynamic
+        tag_importance = self.tag_importance.get(metrics["tag_name"], 0.7)
+        text_ratio = text_len / tag_len if tag_len > 0 else 0
+        link_ratio = link_text_len / text_len if text_len > 0 else 1
+
+        threshold = self.threshold  # base threshold
+        if tag_importance > 1:
+            threshold *= 0.8
+        if text_ratio > 0.4:
+            threshold *= 0.9
+        if link_ratio > 0.6:
+            threshold *= 1.2
+
+        return score < threshold
+
+    @staticmethod
+    def _tag_markup_len(tag: Tag, formatter, opening: bool) -> int:
+        """
+        Length of the opening or closing tag of tag as encode_contents() writes it in its
+        parent, built from the formatter's public attribute API.
+        """
+        if tag.hidden:
+            return 0
+        name = f"{tag.prefix}:{tag.name}" if tag.prefix else tag.name
+        if not opening:
+            return len(name) + 3
+        length = len(name) + 2
+        for key, value in formatter.attributes(tag):
+            length += 1 + len(str(key))
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = " ".join(value)
+            elif isinstance(value, AttributeValueWithCharsetSubstitution):
+                value = value.substitute_encoding("utf-8")
+            elif not isinstance(value, str):
+                value = str(value)
+            length += 1 + len(formatter.quoted_attribute_value(formatter.attribute_value(value)))
+        if tag.is_empty_element:
+            length += len(formatter.void_element_close_prefix or "")
+        return length
+
+    def _subtree_metrics(self, root: Tag) -> Dict[int, Tuple[int, int, int, int]]:
+        """
+        Computes the pruning metrics of root and of every tag below it in one pass.
+
+        The descendants are visited in reverse document order, so every element comes
+        after all of its own descendants and adds its finished totals to its parent.
+
+        Returns:
+            Dict[int, Tuple[int, int, int, int]]: For id(tag), the tuple
+            (text_len, tag_len, link_text_len, word_count), where
+            text_len is len(tag.get_text(strip=True)),
+            tag_len is len(tag.decode_contents()),
+            link_text_len is the stripped text length of its direct <a> children, and
+            word_count is the number of spaces in get_text(strip=True) plus one.
+        """
+        formatter = root.formatter_for_name("minimal")
+        # String types get_text() reads, except below tags such as <template> or <script>
+        main_types = (NavigableString, CData)
+        string_containers = HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS
+        # id(tag) -> [text_len, contents_len, link_text_len, spaces]
+        totals: Dict[int, List[int]] = {id(root): [0, 0, 0, 0]}
+        metrics: Dict[int, Tuple[int, int, int, int]] = {}
+        elements = list(root.descendants)
+
+        def finish(tag: Tag, text_len: int, contents_len: int, link_text_len: int, spaces: int):
+            if tag.name in string_containers:
+                # Tags such as <template> whose get_text() reads other string types
+                text = tag.get_text(strip=True)
+                text_len, spaces = len(text), text.count(" ")
+            metrics[id(tag)] = (text_len, contents_len, link_text_len, spaces + 1)
+
+        for element in elements:
+            if isinstance(element, Tag):
+                totals[id(element)] = [0, 0, 0, 0]
+
+        for element in reversed(elements):
+            parent_totals = totals[id(element.parent)]
+
+            if not isinstance(element, Tag):
+                parent_totals[1] += len(element.output_ready(formatter))
+                if type(element) in main_types:
+                    text = element.strip()
+                    if text:
+                        parent_totals[0] += len(text)
+                        parent_totals[3] += text.count(" ")
+                continue
+
+            text_len, contents_len, link_text_len, spaces = totals.pop(id(element))
+            finish(element, text_len, contents_len, link_text_len, spaces)
+
+            parent_totals[0] += text_len
+            parent_totals[3] += spaces
+            parent_totals[1] += self._tag_markup_len(element, formatter, opening=True)
+            if not element.is_empty_element:
+                parent_totals[1] += contents_len + self._tag_markup_len(
+                    element, formatter, opening=False
+                )
+            if element.name == "a" and element.string:
+                parent_totals[2] += len(element.string.strip())
+
+        finish(root, *totals[id(root)])
+        return metrics
 
     def _compute_composite_score(self, metrics, text_len, tag_len, link_text_len):
         """Computes the composite score"""
         if self.min_word_threshold:
-            # Get raw text from metrics node - avoid extra processing
-            text = metrics["node"].get_text(strip=True)
-            word_count = text.count(" ") + 1
+            if "word_count" in metrics:
+                word_count = metrics["word_count"]
+            else:
+                word_count = metrics["node"].get_text(strip=True).count(" ") + 1
             if word_count < self.min_word_threshold:
                 return -1.0  # Guaranteed removal
         score = 0.0
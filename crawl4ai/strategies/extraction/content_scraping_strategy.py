@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from bs4 import BeautifulSoup
 import asyncio
-import requests
 from .config import (
     MIN_WORD_THRESHOLD,
     IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
@@ -15,8 +14,7 @@ from .config import (
 )
 from bs4 import NavigableString, Comment
 from bs4 import PageElement, Tag
-from urllib.parse import urljoin
-from requests.exceptions import InvalidSchema
+from urllib.parse import urljoin, urlsplit
 from .utils import (
     extract_metadata,
     normalize_url,
@@ -28,12 +26,30 @@ from lxml import etree
 from lxml import html as lhtml
 from typing import List
 from .models import ScrapingResult, MediaItem, Link, Media, Links
+from .selector_cache import selector_cache
 
 # Pre-compile regular expressions for Open Graph and Twitter metadata
 OG_REGEX = re.compile(r"^og:")
 TWITTER_REGEX = re.compile(r"^twitter:")
 DIMENSION_REGEX = re.compile(r"(\d+)(\D*)")
 
+# Tags LXMLWebScrapingStrategy always drops from the content
+NON_CONTENT_TAGS = {"script", "style", "link", "meta", "noscript"}
+
+# Tags kept by empty-node removal even when they have no text
+EMPTY_ALLOWED_TAGS = {
+    "a",
+    "img",
+    "br",
+    "hr",
+    "input",
+    "meta",
+    "link",
+    "source",
+    "track",
+    "wbr",
+}
+
 
 # Function to parse srcset
 def parse_srcset(s: str) -> List[Dict]:
@@ -68,23 +84,6 @@ def parse_dimension(dimension):
     return None, None
 
 
-# Fetch image file metadata to extract size and extension
-def fetch_image_file_size(img, base_url):
-    # If src is relative path construct full URL, if not it may be CDN URL
-    img_url = urljoin(base_url, img.get("src"))
-    try:
-        response = requests.head(img_url)
-        if response.status_code == 200:
-            return response.headers.get("Content-Length", None)
-        else:
-            print(f"Failed to retrieve file size for {img_url}")
-            return None
-    except InvalidSchema:
-        return None
-    finally:
-        return
-
-
 class ContentScrapingStrategy(ABC):
     @abstractmethod
     def scrap(self, url: str, html: str, **kwargs) -> ScrapingResult:
@@ -732,15 +731,16 @@ class WebScrapingStrategy(ContentScrapingStrategy):
             is_single_selector = (
                 "," not in excluded_selector and " " not in excluded_selector
             )
+            compiled = selector_cache.soup(excluded_selector)
             if is_single_selector:
-                while element := body.select_one(excluded_selector):
+                while element := compiled.select_one(body):
                     element.extract()
             else:
-                for element in body.select(excluded_selector):
+                for element in compiled.select(body):
                     element.extract()
 
         if css_selector:
-            selected_elements = body.select(css_selector)
+            selected_elements = selector_cache.soup(css_selector).select(body)
             if not selected_elements:
                 return {
                     "markdown": "",
@@ -967,7 +967,7 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
 
         if excluded_selector := kwargs.get("excluded_selector", ""):
             try:
-                for elem in element.cssselect(excluded_selector):
+                for elem in selector_cache.css(excluded_selector)(element):
                     elem.getparent().remove(elem)
             except Exception:
                 pass  # Invalid selector
@@ -1116,18 +1116,7 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
         Remove elements that fall below the desired word threshold in a single pass from the bottom up.
         Skips non-element nodes like HtmlComment and bypasses certain tags that are allowed to have no content.
         """
-        bypass_tags = {
-            "a",
-            "img",
-            "br",
-            "hr",
-            "input",
-            "meta",
-            "link",
-            "source",
-            "track",
-            "wbr",
-        }
+        bypass_tags = EMPTY_ALLOWED_TAGS
 
         for el in reversed(list(root.iterdescendants())):
             if not isinstance(el, lhtml.HtmlElement):
@@ -1197,7 +1186,12 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
 
         success = True
         try:
-            doc = lhtml.document_fromstring(html)
+            # Reuse the tree parsed for other stages of the pipeline, if there is one
+            document = kwargs.get("document")
+            if document is not None:
+                doc = document.mutable_tree()
+            else:
+                doc = lhtml.document_fromstring(html)
             # Match BeautifulSoup's behavior of using body or full doc
             # body = doc.xpath('//body')[0] if doc.xpath('//body') else doc
             body = doc
@@ -1222,7 +1216,7 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
             excluded_selector = kwargs.get("excluded_selector", "")
             if excluded_selector:
                 try:
-                    for element in body.cssselect(excluded_selector):
+                    for element in selector_cache.css(excluded_selector)(body):
                         if element.getparent() is not None:
                             element.getparent().remove(element)
                 except Exception as e:
@@ -1242,7 +1236,7 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
             # Handle CSS selector targeting
             if css_selector:
                 try:
-                    selected_elements = body.cssselect(css_selector)
+                    selected_elements = selector_cache.css(css_selector)(body)
                     if not selected_elements:
                         return {
                             "markdown": "",
@@ -1340,11 +1334,15 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
 
         except Exception as e:
             self._log("error", f"Error processing HTML: {str(e)}", "SCRAPE")
-            # Create error message in case of failure
-            error_body = lhtml.Element("div")
-            # Use etree.SubElement rather than lhtml.SubElement
-            error_div = etree.SubElement(error_body, "div", id="crawl4ai_error_message")
-            error_div.text = f"""
+            return self._error_result(e)
+
+    def _error_result(self, e: Exception) -> Dict[str, Any]:
+        """Build the result returned when the page could not be processed."""
+        # Create error message in case of failure
+        error_body = lhtml.Element("div")
+        # Use etree.SubElement rather than lhtml.SubElement
+        error_div = etree.SubElement(error_body, "div", id="crawl4ai_error_message")
+        error_div.text = f"""
             Crawl4AI Error: This page is not fully supported.
             
             Error Message: {str(e)}
@@ -1360,13 +1358,497 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
             
             If the issue persists, please check the page's structure and any potential anti-crawling measures.
             """
-            cleaned_html = lhtml.tostring(
-                error_body, encoding="unicode", pretty_print=True
+        cleaned_html = lhtml.tostring(
+            error_body, encoding="unicode", pretty_print=True
+        )
+        return {
+            "cleaned_html": cleaned_html,
+            "success": False,
+            "media": {"images": [], "videos": [], "audios": []},
+            "links": {"internal": [], "external": []},
+            "metadata": {},
+        }
+
+
+
+# Option sets whose compiled rules a strategy keeps
+MAX_CACHED_RULES = 32
+
+
+class ScrapingRules:
+    """
+    Scraping options compiled once, so that each element is classified with set lookups.
+
+    Attributes:
+        removed_tags (frozenset): Tags whose subtree is dropped (non-content, excluded and forms)
+        excluded_selector (etree.XPath): Compiled `excluded_selector`, or None
+        css_selector (etree.XPath): Compiled `css_selector`, or None
+        excluded_selector_error (str): Error raised while compiling `excluded_selector`, if any
+        css_selector_error (str): Error raised while compiling `css_selector`, if any
+        exclude_domains (set): Domains whose links and images are dropped
+        important_attrs (frozenset): Attributes kept on every element
+    """
+
+    def __init__(self, css_selector: str = None, **kwargs):
+        self.remove_comments = kwargs.get("remove_comments", False)
+        self.remove_forms = kwargs.get("remove_forms", False)
+        self.only_text = kwargs.get("only_text", False)
+        self.exclude_external_links = kwargs.get("exclude_external_links", False)
+        self.exclude_external_images = kwargs.get("exclude_external_images", False)
+        self.keep_data_attributes = kwargs.get("keep_data_attributes", False)
+        self.important_attrs = frozenset(IMPORTANT_ATTRS)
+
+        self.excluded_tags = frozenset(kwargs.get("excluded_tags", []) or [])
+        self.removed_tags = self.excluded_tags | NON_CONTENT_TAGS
+        if self.remove_forms:
+            self.removed_tags |= {"form"}
+
+        self.exclude_domains = set(kwargs.get("exclude_domains", []))
+        if kwargs.get("exclude_social_media_links", False):
+            self.exclude_domains.update(
+                list(kwargs.get("exclude_social_media_domains", []))
+                + SOCIAL_MEDIA_DOMAINS
             )
-            return {
-                "cleaned_html": cleaned_html,
-                "success": False,
-                "media": {"images": [], "videos": [], "audios": []},
-                "links": {"internal": [], "external": []},
-                "metadata": {},
-            }
+
+        self.excluded_selector_error = None
+        self.excluded_selector = None
+        if excluded_selector := kwargs.get("excluded_selector", ""):
+            try:
+                self.excluded_selector = selector_cache.css(excluded_selector)
+            except Exception as e:
+                self.excluded_selector_error = str(e)
+
+        self.css_selector = None
+        self.css_selector_error = None
+        if css_selector:
+            try:
+                self.css_selector = selector_cache.css(css_selector)
+            except Exception as e:
+                self.css_selector_error = str(e)
+
+    @staticmethod
+    def cache_key(css_selector: str = None, **kwargs) -> tuple:
+        def frozen(value):
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return tuple(sorted(value, key=str))
+            return value
+
+        return (css_selector,) + tuple(
+            (name, frozen(kwargs.get(name)))
+            for name in (
+                "remove_comments",
+                "remove_forms",
+                "only_text",
+                "exclude_external_links",
+                "exclude_external_images",
+                "keep_data_attributes",
+                "excluded_tags",
+                "exclude_domains",
+                "exclude_social_media_links",
+                "exclude_social_media_domains",
+                "excluded_selector",
+            )
+        )
+
+
+# hrefs that urljoin resolves by plain concatenation: a fragment, a root-relative path
+# without dot segments, or an absolute http(s) URL, with nothing urlsplit would clean up
+FRAGMENT_HREF = re.compile(r"#[^\x00-\x20]+")
+ROOT_RELATIVE_HREF = re.compile(r"/(?!/)[^\x00-\x20?#]*(?:\?[^\x00-\x20#]+)?(?:#[^\x00-\x20]+)?")
+ABSOLUTE_HREF = re.compile(
+    r"https?://([A-Za-z0-9.\-_~%!$&'()*+,;=:@]+)"
+    r"(?:/[^\x00-\x20?#]*)?(?:\?[^\x00-\x20#]+)?(?:#[^\x00-\x20]+)?"
+)
+
+
+class LinkResolver:
+    """
+    Resolves the links of one page against its URL, with the results of normalize_url and
+    is_external_url but without parsing the page URL again for every link.
+
+    Most hrefs are fragments, root-relative paths or absolute http(s) URLs, which urljoin
+    resolves by concatenation. Anything else goes through normalize_url.
+    """
+
+    def __init__(self, base_url: str, base_domain: str):
+        self.base_url = base_url
+        self.base_domain = base_domain.lower().replace("www.", "")
+        parsed = urlsplit(base_url)
+        self.fast = parsed.scheme in ("http", "https") and bool(parsed.netloc)
+        if self.fast:
+            self.netloc = parsed.netloc
+            self.origin = f"{parsed.scheme}://{parsed.netloc}"
+            self.page = urljoin(base_url, "#")
+
+    def resolve(self, href: str):
+        """
+        Return the normalized href and its netloc, or None for the netloc when it was not
+        computed.
+        """
+        if self.fast:
+            if href[0] == "#" and FRAGMENT_HREF.fullmatch(href):
+                return self.page + href, self.netloc
+            if href[0] == "/":
+                if "/." not in href and ROOT_RELATIVE_HREF.fullmatch(href):
+                    return self.origin + href, self.netloc
+            elif match := ABSOLUTE_HREF.fullmatch(href):
+                return href, match.group(1)
+        return normalize_url(href, self.base_url), None
+
+    def is_external(self, url: str, netloc: Optional[str]) -> bool:
+        if netloc is None:
+            return is_external_url(url, self.base_domain)
+        return not netloc.lower().replace("www.", "").endswith(self.base_domain)
+
+
+class SinglePassScrapingStrategy(LXMLWebScrapingStrategy):
+    """
+    lxml scraping strategy that cleans the page in a single traversal of the tree.
+
+    LXMLWebScrapingStrategy runs one XPath query per removed tag, then separate whole-tree
+    passes for links, media, empty nodes and attributes. This strategy produces the same
+    result from one iterative depth-first walk driven by ScrapingRules compiled once per
+    set of options.
+
+    How it works:
+    1. When an element is entered it is dropped if its tag or `excluded_selector` says so,
+       and links, images, videos and audios are collected. Links to excluded domains are
+       dropped together with their subtree.
+    2. When an element is left, everything below it is final: the link text is read, the
+       attributes are stripped and the element is marked for removal if it ended up empty.
+    3. Images are scored after the walk, in document order, as they depend on the page
+       position and on the text around them.
+    4. `only_text`, base64 cleanup and the removal of the marked empty elements are then
+       applied to the collected elements only.
+
+    Metadata is read from the document before the walk, so `excluded_tags` and
+    `excluded_selector` do not hide head elements from it.
+    """
+
+    def __init__(self, logger=None):
+        super().__init__(logger)
+        self._rules_cache: Dict[tuple, ScrapingRules] = {}
+
+    def get_rules(self, css_selector: str = None, **kwargs) -> ScrapingRules:
+        """Return the compiled rules for these options, compiling them on first use."""
+        key = ScrapingRules.cache_key(css_selector, **kwargs)
+        rules = self._rules_cache.get(key)
+        if rules is None:
+            if len(self._rules_cache) >= MAX_CACHED_RULES:
+                self._rules_cache.clear()
+            rules = self._rules_cache[key] = ScrapingRules(css_selector, **kwargs)
+        return rules
+
+    def _select(self, doc, rules: ScrapingRules, excluded: set):
+        """Return the elements matched by css_selector that are not inside an excluded subtree."""
+        selected = []
+        for element in rules.css_selector(doc):
+            node = element
+            while node is not None and not (
+                node.tag in rules.excluded_tags or node in excluded
+            ):
+                node = node.getparent()
+            if node is None:
+                selected.append(element)
+        return selected
+
+    def _scrap(
+        self,
+        url: str,
+        html: str,
+        word_count_threshold: int = MIN_WORD_THRESHOLD,
+        css_selector: str = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        if not html:
+            return None
+
+        try:
+            document = kwargs.get("document")
+            if document is not None:
+                doc = document.mutable_tree()
+            else:
+                doc = lhtml.document_fromstring(html)
+
+            rules = self.get_rules(css_selector, **kwargs)
+            excluded = set()
+            if rules.excluded_selector is not None:
+                excluded = set(rules.excluded_selector(doc))
+            elif rules.excluded_selector_error:
+                self._log(
+                    "error",
+                    f"Error with excluded CSS selector: {rules.excluded_selector_error}",
+                    "SCRAPE",
+                )
+
+            try:
+                meta = extract_metadata_using_lxml("", doc)
+            except Exception as e:
+                self._log("error", f"Error extracting metadata: {str(e)}", "SCRAPE")
+                meta = {}
+
+            body = doc
+            if css_selector:
+                if rules.css_selector is None:
+                    self._log(
+                        "error",
+                        f"Error with CSS selector: {rules.css_selector_error}",
+                        "SCRAPE",
+                    )
+                    return None
+                selected_elements = self._select(doc, rules, excluded)
+                if not selected_elements:
+                    return {
+                        "markdown": "",
+                        "cleaned_html": "",
+                        "success": True,
+                        "media": {"images": [], "videos": [], "audios": []},
+                        "links": {"internal": [], "external": []},
+                        "metadata": meta,
+                        "message": f"No elements found for CSS selector: {css_selector}",
+                    }
+                body = lhtml.Element("div")
+                body.extend(selected_elements)
+
+            return self._scrap_tree(url, body, rules, excluded, meta, **kwargs)
+
+        except Exception as e:
+            self._log("error", f"Error processing HTML: {str(e)}", "SCRAPE")
+            return self._error_result(e)
+
+    def find_closest_parent_with_useful_text(
+        self, element: lhtml.HtmlElement, **kwargs
+    ) -> Optional[str]:
+        """
+        Same as LXMLWebScrapingStrategy.find_closest_parent_with_useful_text, reusing the text
+        of ancestors already read for an earlier image from `text_cache`.
+        """
+        text_cache = kwargs.get("text_cache")
+        if text_cache is None:
+            return super().find_closest_parent_with_useful_text(element, **kwargs)
+        image_description_min_word_threshold = kwargs.get(
+            "image_description_min_word_threshold", IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD
+        )
+        current = element
+        while current is not None:
+            if current.text:
+                cached = text_cache.get(current)
+                if cached is None:
+                    text = current.text_content()
+                    cached = text_cache[current] = (len(text.split()), text)
+                if cached[0] >= image_description_min_word_threshold:
+                    return cached[1].strip()
+            current = current.getparent()
+        return None
+
+    @staticmethod
+    def _strip_attributes(element: lhtml.HtmlElement, rules: ScrapingRules):
+        """Same as remove_unwanted_attributes_fast, for a single element."""
+        attrib = element.attrib
+        for name in [
+            name
+            for name in attrib
+            if name not in rules.important_attrs
+            and not (rules.keep_data_attributes and name.startswith("data-"))
+        ]:
+            del attrib[name]
+
+    def _scrap_tree(
+        self,
+        url: str,
+        body: lhtml.HtmlElement,
+        rules: ScrapingRules,
+        excluded: set,
+        meta: Dict[str, Any],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        base_domain = get_base_domain(url)
+        resolver = LinkResolver(url, base_domain)
+        removed_tags = rules.removed_tags
+        exclude_domains = rules.exclude_domains
+        mark_empty = not rules.only_text
+
+        internal_links_dict: Dict[str, Dict[str, Any]] = {}
+        external_links_dict: Dict[str, Dict[str, Any]] = {}
+        link_elements: Dict[Any, Dict[str, Any]] = {}  # element -> its link data
+        images = []  # (element, excluded)
+        media_elements = {"video": [], "audio": []}  # (element, info, sources)
+        open_media = []
+        only_text_elements = {tag: [] for tag in ONLY_TEXT_ELIGIBLE_TAGS}
+        # Elements whose attributes image scoring still needs
+        late_strip = set()
+        # Elements that will be removed: excluded images and empty elements
+        gone = set()
+        empty_elements = []
+
+        stack = [(body, False)]
+        while stack:
+            element, leaving = stack.pop()
+            tag = element.tag
+
+            if leaving:
+                if tag == "a" and element in link_elements:
+                    link_data = link_elements[element]
+                    link_data["text"] = element.text_content().strip()
+                    link_data["title"] = element.get("title", "").strip()
+                elif tag == "video" or tag == "audio":
+                    open_media.pop()
+
+                if element not in late_strip:
+                    self._strip_attributes(element, rules)
+
+                if (
+                    mark_empty
+                    and element is not body
+                    and tag not in EMPTY_ALLOWED_TAGS
+                    and not (element.text and element.text.strip())
+                    and all(child in gone for child in element)
+                ):
+                    gone.add(element)
+                    empty_elements.append(element)
+                continue
+
+            if not isinstance(tag, str):
+                # Comments and processing instructions
+                if rules.remove_comments and tag is etree.Comment:
+                    element.getparent().remove(element)
+                continue
+
+            if element is not body:
+                if tag in removed_tags or element in excluded:
+                    element.getparent().remove(element)
+                    continue
+
+                if tag == "a":
+                    href = element.get("href", "").strip()
+                    if href:
+                        try:
+                            normalized_href, netloc = resolver.resolve(href)
+                            link_data = {
+                                "href": normalized_href,
+                                "text": "",
+                                "title": "",
+                                "base_domain": base_domain,
+                            }
+                            links_dict = internal_links_dict
+                            if resolver.is_external(normalized_href, netloc):
+                                link_base_domain = get_base_domain(normalized_href)
+                                link_data["base_domain"] = link_base_domain
+                                if (
+                                    rules.exclude_external_links
+                                    or link_base_domain in exclude_domains
+                                ):
+                                    element.getparent().remove(element)
+                                    continue
+                                links_dict = external_links_dict
+                            if normalized_href not in links_dict:
+                                links_dict[normalized_href] = link_data
+                                link_elements[element] = link_data
+                        except Exception as e:
+                            self._log(
+                                "error", f"Error processing link: {str(e)}", "SCRAPE"
+                            )
+                elif tag == "img":
+                    src = element.get("src") or ""
+                    is_excluded = get_base_domain(src) in exclude_domains or (
+                        rules.exclude_external_images
+                        and is_external_url(src, base_domain)
+                    )
+                    images.append((element, is_excluded))
+                    if is_excluded:
+                        gone.add(element)
+                    late_strip.add(element)
+                    late_strip.add(element.getparent())
+                elif tag == "source":
+                    late_strip.add(element)
+                    if src := element.get("src"):
+                        for sources in open_media:
+                            sources.append(src)
+                elif tag == "video" or tag == "audio":
+                    sources = []
+                    media_info = {
+                        "src": element.get("src"),
+                        "alt": element.get("alt"),
+                        "type": tag,
+                    }
+                    media_elements[tag].append((element, media_info, sources))
+                    open_media.append(sources)
+
+                if rules.only_text and tag in only_text_elements:
+                    only_text_elements[tag].append(element)
+
+            stack.append((element, True))
+            stack.extend((child, False) for child in reversed(element))
+
+        media = {"images": [], "videos": [], "audios": []}
+        # Text of the ancestors searched for image descriptions, valid until the tree changes
+        text_cache = {}
+        total_images = len(images)
+        for idx, (img, is_excluded) in enumerate(images):
+            if is_excluded:
+                parent = img.getparent()
+                if parent is not None:
+                    parent.remove(img)
+                    text_cache.clear()
+                continue
+            try:
+                processed_images = self.process_image(
+                    img, url, idx, total_images, text_cache=text_cache, **kwargs
+                )
+                if processed_images:
+                    media["images"].extend(processed_images)
+            except Exception as e:
+                self._log("error", f"Error processing image: {str(e)}", "SCRAPE")
+
+        for media_type in ["video", "audio"]:
+            for element, media_info, sources in media_elements[media_type]:
+                media_info["description"] = self.find_closest_parent_with_useful_text(
+                    element, text_cache=text_cache, **kwargs
+                )
+                media[f"{media_type}s"].append(media_info)
+                for src in sources:
+                    media[f"{media_type}s"].append({**media_info, "src": src})
+
+        if rules.only_text:
+            for tag in ONLY_TEXT_ELIGIBLE_TAGS:
+                for element in only_text_elements[tag]:
+                    if element.text:
+                        new_text = lhtml.Element("span")
+                        new_text.text = element.text_content()
+                        if element.getparent() is not None:
+                            element.getparent().replace(element, new_text)
+
+        for img, is_excluded in images:
+            src = img.get("src", "")
+            if not is_excluded and self.BASE64_PATTERN.match(src):
+                img.set("src", self.BASE64_PATTERN.sub("", src))
+
+        for element in late_strip:
+            self._strip_attributes(element, rules)
+
+        if mark_empty:
+            for element in empty_elements:
+                parent = element.getparent()
+                if parent is not None:
+                    parent.remove(element)
+        else:
+            # only_text replaced elements after the walk, find the empty ones again
+            self.remove_empty_elements_fast(body, 1)
+
+        cleaned_html = lhtml.tostring(
+            body,
+            encoding="unicode",
+            pretty_print=True,
+            method="html",
+            with_tail=False,
+        ).strip()
+        return {
+            "cleaned_html": cleaned_html,
+            "success": True,
+            "media": media,
+            "links": {
+                "internal": list(internal_links_dict.values()),
+                "external": list(external_links_dict.values()),
+            },
+            "metadata": meta,
+        }
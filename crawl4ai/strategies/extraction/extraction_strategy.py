@@ -39,14 +39,23 @@ import math
 import numpy as np
 import re
 from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
 from lxml import html, etree
+from cssselect import SelectorError
+from .selector_cache import selector_cache
 
 
 class ExtractionStrategy(ABC):
     """
     Abstract base class for all extraction strategies.
+
+    Attributes:
+        accepts_document (bool): Whether run() accepts a `document` keyword argument with the
+                                 ParsedDocument of the page, used instead of parsing the HTML again.
     """
 
+    accepts_document = False
+
     def __init__(self, input_format: str = "markdown", **kwargs):
         """
         Initialize the extraction strategy.
@@ -804,6 +813,9 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         _compute_field(item, field): Computes a field value using an expression or function.
         run(url, sections, *q, **kwargs): Combines HTML sections and runs the extraction strategy.
 
+    When run() is given the ParsedDocument of the page (the crawler does this for HTML input),
+    `_parse_document` may return its shared lxml tree, and the HTML is not parsed again.
+
     Abstract Methods:
         _parse_html(html_content): Parses raw HTML into a structured format (e.g., BeautifulSoup or lxml).
         _get_base_elements(parsed_html, selector): Retrieves base elements using a selector.
@@ -814,6 +826,7 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
     """
 
     DEL = "\n"
+    accepts_document = True
 
     def __init__(self, schema: Dict[str, Any], **kwargs):
         """
@@ -841,13 +854,21 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
             url (str): The URL of the page being processed.
             html_content (str): The raw HTML content to parse and extract.
             *q: Additional positional arguments.
-            **kwargs: Additional keyword arguments for custom extraction.
+            **kwargs: Additional keyword arguments for custom extraction. `document`, the
+                      ParsedDocument of the page, is used when html_content is its HTML.
 
         Returns:
             List[Dict[str, Any]]: A list of extracted items, each represented as a dictionary.
         """
 
-        parsed_html = self._parse_html(html_content)
+        parsed_html = None
+        document = kwargs.get("document")
+        if document is not None and (
+            document.html is html_content or document.html == html_content
+        ):
+            parsed_html = self._parse_document(document)
+        if parsed_html is None:
+            parsed_html = self._parse_html(html_content)
         base_elements = self._get_base_elements(
             parsed_html, self.schema["baseSelector"]
         )
@@ -876,6 +897,10 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         """Parse HTML content into appropriate format"""
         pass
 
+    def _parse_document(self, document):
+        """Return the parsed form of a ParsedDocument, or None to parse its HTML instead"""
+        return None
+
     @abstractmethod
     def _get_base_elements(self, parsed_html, selector: str):
         """Get all base elements using the selector"""
@@ -893,7 +918,7 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
                 nested_element = nested_elements[0] if nested_elements else None
                 return (
                     self._extract_item(nested_element, field["fields"])
-                    if nested_element
+                    if nested_element is not None
                     else {}
                 )
 
@@ -1127,6 +1152,27 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
             raise Exception(f"Failed to generate schema: {str(e)}")
 
 
+# Strings directly inside these tags are left out of BeautifulSoup's get_text()
+BS4_NON_TEXT_TAGS = frozenset(HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS)
+
+# Attributes BeautifulSoup returns as a list of values, by tag ("*" for every tag)
+BS4_LIST_ATTRIBUTES = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES
+
+
+def lxml_get_text(element) -> str:
+    """Equivalent of BeautifulSoup's element.get_text(strip=True) for an lxml element."""
+    parts = []
+    for event, node in etree.iterwalk(element, events=("start", "end")):
+        if event == "start":
+            if isinstance(node.tag, str) and node.tag not in BS4_NON_TEXT_TAGS and node.text:
+                parts.append(node.text)
+        elif node is not element and node.tail:
+            parent = node.getparent()
+            if parent is None or parent.tag not in BS4_NON_TEXT_TAGS:
+                parts.append(node.tail)
+    return "".join(part.strip() for part in parts)
+
+
 class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
     """
     Concrete implementation of `JsonElementExtractionStrategy` using CSS selectors.
@@ -1136,9 +1182,18 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
     2. Selects elements using CSS selectors defined in the schema.
     3. Extracts field data and applies transformations as defined.
 
+    With use_shared_tree, the ParsedDocument of the page is queried instead, with the selectors
+    translated to XPath by cssselect and the same text and attribute semantics as BeautifulSoup.
+    The tree comes from lxml, not html.parser, so the output can differ: "html" fields are
+    serialized by lxml (`<br>` instead of `<br/>`), and malformed markup such as unclosed `<li>`
+    tags is nested differently. If any selector of the schema cannot be translated, it parses
+    the HTML with BeautifulSoup as usual.
+
     Attributes:
         schema (Dict[str, Any]): The schema defining the extraction rules.
         verbose (bool): Enables verbose logging for debugging purposes.
+        use_shared_tree (bool): Whether to query the shared lxml tree of the page when the
+                                crawler provides it. Default: False.
 
     Methods:
         _parse_html(html_content): Parses HTML content into a BeautifulSoup object.
@@ -1152,26 +1207,72 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
     def __init__(self, schema: Dict[str, Any], **kwargs):
         kwargs["input_format"] = "html"  # Force HTML input
         super().__init__(schema, **kwargs)
+        self.use_shared_tree = kwargs.get("use_shared_tree", False)
+        self.accepts_document = self.use_shared_tree
+        self._supports_lxml: Optional[bool] = None
 
     def _parse_html(self, html_content: str):
         return BeautifulSoup(html_content, "html.parser")
 
+    def _parse_document(self, document):
+        if not self.use_shared_tree:
+            return None
+        if self._supports_lxml is None:
+            self._supports_lxml = self._compile_schema()
+        return document.tree if self._supports_lxml else None
+
+    def _compile_schema(self) -> bool:
+        """Translate every selector of the schema, returning False if one is not supported."""
+        try:
+            self._xpath(self.schema["baseSelector"], base=True)
+            fields = list(self.schema.get("baseFields", [])) + list(self.schema["fields"])
+            while fields:
+                field = fields.pop()
+                if "selector" in field:
+                    self._xpath(field["selector"])
+                fields.extend(field.get("fields", []))
+            return True
+        except SelectorError:
+            return False
+
+    def _xpath(self, selector: str, base: bool = False) -> etree.XPath:
+        """
+        Compile a CSS selector for lxml. Like BeautifulSoup's select(), child selections match
+        descendants only, while the base selection may match the root element itself.
+        """
+        prefix = "descendant-or-self::" if base else "descendant::"
+        return selector_cache.css(selector, prefix=prefix, translator="cssselect")
+
     def _get_base_elements(self, parsed_html, selector: str):
-        return parsed_html.select(selector)
+        if isinstance(parsed_html, etree._Element):
+            return self._xpath(selector, base=True)(parsed_html)
+        return selector_cache.soup(selector).select(parsed_html)
 
     def _get_elements(self, element, selector: str):
+        if isinstance(element, etree._Element):
+            return self._xpath(selector)(element)
         # Return all matching elements using select() instead of select_one()
         # This ensures that we get all elements that match the selector, not just the first one
-        return element.select(selector)
+        return selector_cache.soup(selector).select(element)
 
     def _get_element_text(self, element) -> str:
+        if isinstance(element, etree._Element):
+            return lxml_get_text(element)
         return element.get_text(strip=True)
 
     def _get_element_html(self, element) -> str:
+        if isinstance(element, etree._Element):
+            return html.tostring(element, encoding="unicode", with_tail=False)
         return str(element)
 
     def _get_element_attribute(self, element, attribute: str):
-        return element.get(attribute)
+        value = element.get(attribute)
+        if value is not None and isinstance(element, etree._Element):
+            if attribute in BS4_LIST_ATTRIBUTES["*"] or attribute in BS4_LIST_ATTRIBUTES.get(
+                element.tag, ()
+            ):
+                return value.split()
+        return value
 
 
 class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
@@ -1204,8 +1305,11 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
     def _parse_html(self, html_content: str):
         return html.fromstring(html_content)
 
+    def _parse_document(self, document):
+        return document.tree
+
     def _get_base_elements(self, parsed_html, selector: str):
-        return parsed_html.xpath(selector)
+        return selector_cache.xpath(selector)(parsed_html)
 
     def _css_to_xpath(self, css_selector: str) -> str:
         """Convert CSS selector to XPath if needed"""
@@ -1227,7 +1331,7 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
         xpath = self._css_to_xpath(selector)
         if not xpath.startswith("."):
             xpath = "." + xpath
-        return element.xpath(xpath)
+        return selector_cache.xpath(xpath)(element)
 
     def _get_element_text(self, element) -> str:
         return "".join(element.xpath(".//text()")).strip()
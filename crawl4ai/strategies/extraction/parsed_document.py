@@ -0,0 +1,70 @@
+import copy
+from typing import Optional
+
+from lxml import html as lhtml
+from lxml import etree
+
+
+class ParsedDocument:
+    """
+    HTML of one page, parsed once with lxml and handed along the processing pipeline so that
+    scraping and extraction work on the same tree instead of each parsing the page again.
+
+    How it works:
+    1. The tree is parsed lazily, the first time a stage asks for it.
+    2. Stages that only read (extraction, metadata) share `tree`.
+    3. A stage that modifies the tree (scraping) calls `mutable_tree()`. It gets a copy when
+       later stages still need the original, and the parsed tree itself otherwise.
+    4. When pickled for a worker process only the HTML is sent; the worker parses it again.
+
+    Attributes:
+        html (str): The raw HTML
+        url (str): URL of the page
+        keep_original (bool): Whether `tree` must stay unmodified for later stages
+    """
+
+    def __init__(self, html: str, url: str = "", keep_original: bool = True):
+        self.html = html
+        self.url = url
+        self.keep_original = keep_original
+        self._tree: Optional[lhtml.HtmlElement] = None
+
+    @property
+    def tree(self) -> lhtml.HtmlElement:
+        """The parsed document. Must not be modified; use mutable_tree() for that."""
+        if self._tree is None:
+            self._tree = self.parse(self.html)
+        return self._tree
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._tree is not None
+
+    @staticmethod
+    def parse(html: str) -> lhtml.HtmlElement:
+        try:
+            return lhtml.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            # Empty documents, or str input with an XML encoding declaration
+            return lhtml.document_fromstring(
+                html.encode("utf-8") if html.strip() else "<html></html>"
+            )
+
+    def mutable_tree(self) -> lhtml.HtmlElement:
+        """
+        Return a tree the caller may modify. Copying a parsed tree is several times cheaper
+        than parsing the HTML again.
+
+        Returns:
+            lhtml.HtmlElement: A copy of `tree` if keep_original is set, otherwise `tree` itself,
+            which is then dropped from the document.
+        """
+        if self.keep_original:
+            return copy.deepcopy(self.tree)
+        tree, self._tree = self.tree, None
+        return tree
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_tree"] = None
+        return state
@@ -0,0 +1,142 @@
+"""Process-wide cache of compiled CSS and XPath selectors, shared by scraping and extraction strategies."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+import soupsieve as sv
+from cssselect import HTMLTranslator
+from lxml import etree
+from lxml.cssselect import LxmlHTMLTranslator
+
+
+class SelectorCache:
+    """
+    Size-bounded LRU cache of compiled selectors.
+
+    Strategies see the same selectors on every page: `css_selector` and `excluded_selector`
+    of the scraping strategy, and the base and field selectors of an extraction schema, which
+    are looked up again for every base element. Compiling a selector costs far more than
+    matching it against a small subtree, so each one is compiled once per process.
+
+    How it works:
+    1. A selector is looked up by kind ("css", "xpath" or "soup") and its text.
+    2. On a miss it is compiled: CSS to an lxml XPath through cssselect, XPath expressions
+       with etree.XPath, and CSS for BeautifulSoup with soupsieve.
+    3. When max_size entries are stored the least recently used one is dropped.
+    4. Selectors that fail to compile raise as usual and are not stored.
+
+    Compiled lxml XPath objects are safe to share between threads.
+
+    Attributes:
+        max_size (int): Maximum number of compiled selectors kept
+        stats (dict): hits and misses per kind
+    """
+
+    KINDS = ("css", "xpath", "soup")
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.stats = {kind: {"hits": 0, "misses": 0} for kind in self.KINDS}
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._translators = {"lxml": LxmlHTMLTranslator(), "cssselect": HTMLTranslator()}
+
+    def _get(self, kind: str, key: Hashable, compile_fn: Callable[[], Any]):
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.stats[kind]["hits"] += 1
+                return compiled
+            self.stats[kind]["misses"] += 1
+
+        compiled = compile_fn()
+
+        with self._lock:
+            self._entries[key] = compiled
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def css(
+        self,
+        selector: str,
+        prefix: str = "descendant-or-self::",
+        translator: str = "lxml",
+    ) -> etree.XPath:
+        """
+        Return a CSS selector compiled for lxml HTML trees.
+
+        Args:
+            selector (str): The CSS selector
+            prefix (str): XPath axis the selector starts from. The default matches
+                HtmlElement.cssselect(), which includes the element itself.
+            translator (str): "lxml" for the selectors HtmlElement.cssselect() accepts,
+                including lxml's case-insensitive :contains(), or "cssselect" for standard
+                CSS only.
+
+        Returns:
+            etree.XPath: Callable returning the matching elements of an element
+
+        Raises:
+            cssselect.SelectorError: If the selector is invalid or not supported
+        """
+        return self._get(
+            "css",
+            ("css", selector, prefix, translator),
+            lambda: etree.XPath(
+                self._translators[translator].css_to_xpath(selector, prefix=prefix)
+            ),
+        )
+
+    def xpath(self, expression: str) -> etree.XPath:
+        """
+        Return a compiled XPath expression.
+
+        Raises:
+            etree.XPathSyntaxError: If the expression is invalid
+        """
+        return self._get("xpath", ("xpath", expression), lambda: etree.XPath(expression))
+
+    def soup(self, selector: str) -> sv.SoupSieve:
+        """
+        Return a CSS selector compiled for BeautifulSoup trees. Use its select() and
+        select_one() methods with the tag to search.
+
+        Raises:
+            soupsieve.SelectorSyntaxError: If the selector is invalid
+        """
+        return self._get("soup", ("soup", selector), lambda: sv.compile(selector))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the counters per kind, the totals, the hit rate and the number of entries."""
+        with self._lock:
+            by_kind = {kind: dict(counters) for kind, counters in self.stats.items()}
+            entries = len(self._entries)
+        hits = sum(counters["hits"] for counters in by_kind.values())
+        misses = sum(counters["misses"] for counters in by_kind.values())
+        for counters in by_kind.values():
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": entries,
+            "evictions": self.evictions,
+            "by_kind": by_kind,
+        }
+
+    def clear(self):
+        """Drop every compiled selector and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = {kind: {"hits": 0, "misses": 0} for kind in self.KINDS}
+            self.evictions = 0
+
+
+# The cache shared by every strategy in this process
+selector_cache = SelectorCache()
@@ -0,0 +1,306 @@
+"""On-disk cache of page subresources (scripts, styles, fonts, images) shared by browser contexts."""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import uuid
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+# Resource types worth caching; documents and XHR are left to the network
+CACHEABLE_RESOURCE_TYPES = {"script", "stylesheet", "font", "image"}
+
+# Headers that describe the transfer rather than the body, dropped when a cached body is served
+HOP_BY_HOP_HEADERS = {
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "keep-alive",
+    "set-cookie",
+}
+
+# Upper bound for heuristic freshness of responses with only Last-Modified
+MAX_HEURISTIC_TTL = 24 * 3600
+
+
+def default_cache_dir() -> str:
+    """Return the default cache directory under the Crawl4AI home folder."""
+    return os.path.join(
+        os.getenv("CRAWL4_AI_BASE_DIRECTORY", str(Path.home())),
+        ".crawl4ai",
+        "subresource_cache",
+    )
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into a dict of lowercase directives."""
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: Dict[str, str], now: float) -> Optional[float]:
+    """
+    Return how many seconds a response may be served without revalidation, following
+    the rules for a shared cache. None means the response must not be stored.
+
+    Args:
+        headers (Dict[str, str]): Response headers with lowercase names
+        now (float): Current time, used when the response has no Date header
+
+    Returns:
+        Optional[float]: Freshness lifetime in seconds, 0 if it must be revalidated before use
+    """
+    cache_control = parse_cache_control(headers.get("cache-control", ""))
+    if "no-store" in cache_control or "private" in cache_control:
+        return None
+    vary = {v.strip().lower() for v in headers.get("vary", "").split(",") if v.strip()}
+    if vary - {"accept-encoding"}:
+        # The cache is keyed by URL only
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+
+    for directive in ("s-maxage", "max-age"):
+        if cache_control.get(directive):
+            try:
+                return max(0.0, float(cache_control[directive]))
+            except ValueError:
+                return 0.0
+
+    date = _http_date(headers.get("date")) or now
+    expires = headers.get("expires")
+    if expires is not None:
+        expires_at = _http_date(expires)
+        return max(0.0, expires_at - date) if expires_at else 0.0
+
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified:
+        return min(MAX_HEURISTIC_TTL, max(0.0, (date - last_modified) * 0.1))
+    return 0.0
+
+
+class SubresourceCache:
+    """
+    Size-bounded, on-disk LRU cache of subresources, installed as a context route handler.
+
+    Entries are keyed by URL and stored as <key>.body and <key>.json (status, headers, expiry
+    and validators). The directory can be shared by every context, browser restart and process;
+    each process keeps its own LRU index, built from the directory on first use.
+
+    How it works:
+    1. Requests for scripts, styles, fonts and images are looked up by URL.
+    2. A fresh entry is served from disk without touching the network.
+    3. A stale entry with an ETag or Last-Modified is revalidated with a conditional request;
+       on 304 the cached body is served and its expiry refreshed.
+    4. Otherwise the response is fetched and, if Cache-Control allows, stored.
+    5. When the total size exceeds max_size, least recently used entries are removed.
+
+    Attributes:
+        cache_dir (str): Directory holding the entries
+        max_size (int): Maximum total size of cached bodies in bytes
+        stats (dict): hits, revalidated, misses, stored, evicted and bytes_served counters
+    """
+
+    def __init__(self, cache_dir: str = None, max_size: int = 512 * 1024 * 1024, logger=None):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_size = max_size
+        self.logger = logger
+        self.stats = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "stored": 0,
+            "evicted": 0,
+            "bytes_served": 0,
+        }
+        self._index: "OrderedDict[str, int]" = OrderedDict()  # key -> body size
+        self._size = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    @staticmethod
+    def cache_key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".body", base + ".json"
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    def _scan(self):
+        """Build the LRU index from the directory, oldest access first."""
+        entries = []
+        for meta_path in Path(self.cache_dir).glob("*/*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                entries.append((body_path.stat().st_mtime, meta_path.stem, body_path.stat().st_size))
+            except OSError:
+                continue
+        return sorted(entries)
+
+    async def _ensure_loaded(self):
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for _, key, size in await self._run(self._scan):
+                self._index[key] = size
+                self._size += size
+            self._loaded = True
+
+    def _read(self, key: str):
+        body_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+            # Record the access for the LRU order rebuilt on startup
+            os.utime(body_path)
+            return meta, body
+        except (OSError, ValueError):
+            return None, None
+
+    def _write(self, key: str, meta: Dict[str, Any], body: Optional[bytes]):
+        body_path, meta_path = self._paths(key)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        suffix = f".{uuid.uuid4().hex}.tmp"
+        if body is not None:
+            with open(body_path + suffix, "wb") as f:
+                f.write(body)
+            os.replace(body_path + suffix, body_path)
+        with open(meta_path + suffix, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + suffix, meta_path)
+
+    def _delete(self, key: str):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    async def _store(self, key: str, url: str, status: int, headers: Dict[str, str], body: bytes):
+        lifetime = freshness_lifetime(headers, time.time())
+        if lifetime is None:
+            return
+        if lifetime == 0 and not (headers.get("etag") or headers.get("last-modified")):
+            # Could never be served without a full refetch
+            return
+        if len(body) > self.max_size // 10:
+            return
+
+        meta = {
+            "url": url,
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k not in HOP_BY_HOP_HEADERS},
+            "expires_at": time.time() + lifetime,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+        }
+        await self._run(self._write, key, meta, body)
+
+        self._size += len(body) - self._index.pop(key, 0)
+        self._index[key] = len(body)
+        self.stats["stored"] += 1
+        await self._evict()
+
+    async def _evict(self):
+        victims = []
+        while self._size > self.max_size and self._index:
+            key, size = self._index.popitem(last=False)
+            self._size -= size
+            victims.append(key)
+        for key in victims:
+            await self._run(self._delete, key)
+        self.stats["evicted"] += len(victims)
+
+    def _forget(self, key: str):
+        self._size -= self._index.pop(key, 0)
+
+    async def handle(self, route):
+        """Route handler for context.route("**/*", ...)."""
+        request = route.request
+        if request.method != "GET" or request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            await route.fallback()
+            return
+
+        await self._ensure_loaded()
+        url = request.url
+        key = self.cache_key(url)
+
+        meta, body = (None, None)
+        if key in self._index:
+            meta, body = await self._run(self._read, key)
+            if meta is None:
+                # Removed by another process sharing the directory
+                self._forget(key)
+            else:
+                self._index.move_to_end(key)
+
+        if meta and meta["expires_at"] > time.time():
+            self.stats["hits"] += 1
+            self.stats["bytes_served"] += len(body)
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+
+        headers = dict(request.headers)
+        if meta and meta.get("etag"):
+            headers["if-none-match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["if-modified-since"] = meta["last_modified"]
+
+        try:
+            response = await route.fetch(headers=headers)
+        except Exception:
+            await route.fallback()
+            return
+
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+        if meta and response.status == 304:
+            self.stats["revalidated"] += 1
+            self.stats["bytes_served"] += len(body)
+            lifetime = freshness_lifetime({**meta["headers"], **response_headers}, time.time())
+            meta["expires_at"] = time.time() + (lifetime or 0)
+            await self._run(self._write, key, meta, None)
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+
+        self.stats["misses"] += 1
+        response_body = await response.body()
+        if response.status == 200:
+            try:
+                await self._store(key, url, response.status, response_headers, response_body)
+            except OSError as e:
+                if self.logger:
+                    self.logger.warning(
+                        message="Failed to cache {url}: {error}",
+                        tag="CACHE",
+                        params={"url": url, "error": str(e)},
+                    )
+        await route.fulfill(response=response, body=response_body)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return the counters plus the number of entries and their total size."""
+        return {**self.stats, "entries": len(self._index), "size": self._size}
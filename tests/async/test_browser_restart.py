@@ -0,0 +1,39 @@
+import os
+import sys
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+
+
+@pytest.mark.asyncio
+async def test_crawl_after_browser_crash_with_same_config():
+    strategy = AsyncPlaywrightCrawlerStrategy(browser_config=BrowserConfig(verbose=False))
+    config = CrawlerRunConfig(screenshot=True)
+    async with strategy:
+        first = await strategy.crawl("raw:<h1>Before</h1>", config=config)
+        manager = strategy.browser_manager
+        assert len(manager.contexts_by_config) == 1
+
+        # Kill the browser behind the manager's back and wait for the restart
+        crashed = manager.browser
+        await crashed.close()
+        for _ in range(300):
+            if manager.browser is not crashed and not manager._restart_tasks:
+                break
+            await asyncio.sleep(0.1)
+        assert manager.browser is not crashed and manager.browser.is_connected()
+
+        # The context of the dead browser was dropped, not handed out again
+        assert not manager.contexts_by_config
+        assert not manager.context_usage
+        second = await strategy.crawl("raw:<h1>After</h1>", config=config)
+
+    assert first.screenshot
+    assert second.screenshot
+    assert "After" in second.html
@@ -0,0 +1,105 @@
+import os
+import sys
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_dispatcher import CrawlerMonitor, SemaphoreDispatcher
+from crawl4ai.concurrency_controller import AIMDConcurrencyController
+
+
+def record_window(controller, latency=1.0, status_code=200, count=None, in_flight=None, **kwargs):
+    count = count or max(controller.min_samples, controller.limit)
+    decision = None
+    for _ in range(count):
+        decision = controller.record(
+            latency,
+            status_code=status_code,
+            in_flight=controller.limit if in_flight is None else in_flight,
+            **kwargs,
+        )
+    return decision
+
+
+class FakeCrawler:
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def arun(self, url, config=None, session_id=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return SimpleNamespace(url=url, status_code=200, success=True, error_message="")
+
+
+def test_grows_while_healthy_and_saturated():
+    controller = AIMDConcurrencyController(initial_limit=5, min_samples=4)
+    # A window holds max(min_samples, limit) crawls
+    assert controller.record(1.0, in_flight=5) is None
+
+    assert record_window(controller, count=4).action == "increase"
+    assert controller.limit == 6
+    assert record_window(controller).new_limit == 7
+    assert controller.baseline_latency == 1.0
+
+    # A limit that was not reached is not raised
+    decision = record_window(controller, in_flight=3)
+    assert (decision.action, controller.limit) == ("hold", 7)
+
+
+def test_backs_off_on_throttling_errors_and_latency():
+    controller = AIMDConcurrencyController(initial_limit=10, min_samples=10)
+    record_window(controller)
+    assert controller.limit == 11
+
+    for _ in range(9):
+        controller.record(1.0, status_code=200, in_flight=11)
+    controller.record(1.0, status_code=429, in_flight=11)
+    decision = record_window(controller, count=1)
+    assert decision.action == "decrease" and "throttled" in decision.reason
+    assert controller.limit == 7
+
+    decision = record_window(controller, success=False)
+    assert decision.action == "decrease" and "errors" in decision.reason
+
+    decision = record_window(controller, latency=3.0)
+    assert decision.action == "decrease" and "p95" in decision.reason
+    # The baseline does not follow unhealthy windows
+    assert controller.baseline_latency == 1.0
+
+
+def test_limit_bounds():
+    controller = AIMDConcurrencyController(initial_limit=2, min_limit=2, max_limit=3, min_samples=2)
+    record_window(controller, timed_out=True)
+    assert controller.limit == 2
+    record_window(controller)
+    record_window(controller)
+    assert controller.limit == 3
+    assert controller.decisions[-1].reason == "at max_limit"
+    assert controller.get_stats()["limit"] == 3
+
+
+@pytest.mark.asyncio
+async def test_semaphore_dispatcher_follows_controller():
+    controller = AIMDConcurrencyController(initial_limit=1, max_limit=4, min_samples=2)
+    monitor = CrawlerMonitor()
+    monitor.start = monitor.stop = lambda: None
+    dispatcher = SemaphoreDispatcher(
+        semaphore_count=1, concurrency_controller=controller, monitor=monitor
+    )
+    crawler = FakeCrawler()
+    urls = [f"https://site{i}.com/" for i in range(40)]
+
+    results = await dispatcher.run_urls(crawler, urls, config=None)
+
+    assert [r.url for r in results] == urls
+    assert controller.limit == 4
+    assert 1 < crawler.max_running <= 4
+    assert monitor._concurrency_summary().startswith("limit 4 (hold: at max_limit")
@@ -1,12 +1,15 @@
 import os, sys
+import random
 import pytest
 from bs4 import BeautifulSoup
+from rank_bm25 import BM25Okapi
 
 # Add the parent directory to the Python path
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
 
 from crawl4ai.content_filter_strategy import BM25ContentFilter
+from crawl4ai.strategies.extraction.bm25_scoring import BM25Index, StemCache, stem_cache
 
 
 @pytest.fixture
@@ -178,6 +181,72 @@ class TestBM25ContentFilter:
 
         assert duration < 1.0, f"Processing took too long: {duration:.2f} seconds"
 
+    def test_filter_many_matches_filter_content(self, basic_html, wiki_html, no_meta_html):
+        """Batch filtering with one query equals filtering each page with that query"""
+        pages = [basic_html, wiki_html, no_meta_html, ""]
+        results = BM25ContentFilter().filter_many(pages, query="paragraph words content")
+
+        expected = [
+            BM25ContentFilter(user_query="paragraph words content").filter_content(html)
+            for html in pages
+        ]
+        assert results == expected
+        assert results[1] and results[-1] == []
+
+    def test_filter_many_page_queries(self, basic_html, wiki_html):
+        """Without a query each page falls back to its own metadata"""
+        filter = BM25ContentFilter()
+        assert filter.filter_many([basic_html, wiki_html]) == [
+            filter.filter_content(basic_html),
+            filter.filter_content(wiki_html),
+        ]
+
+    def test_stems_are_cached(self, wiki_html):
+        """Words are stemmed once and reused by later pages"""
+        filter = BM25ContentFilter()
+        filter.filter_content(wiki_html)
+        misses = stem_cache.get_stats()["misses"]
+        filter.filter_content(wiki_html)
+        assert stem_cache.get_stats()["misses"] == misses
+
+
+class TestBM25Scoring:
+    def test_scores_match_bm25okapi(self):
+        """Vectorized scores equal rank_bm25's BM25Okapi"""
+        rng = random.Random(7)
+        words = "crawl crawler page pages data fast markdown filter web run".split()
+        for _ in range(30):
+            corpus = [
+                [rng.choice(words) for _ in range(rng.randint(0, 15))]
+                for _ in range(rng.randint(1, 25))
+            ]
+            if not any(corpus):
+                continue
+            query = [rng.choice(words) for _ in range(4)] + ["unknown"]
+            assert BM25Index(corpus).get_scores(query) == pytest.approx(
+                BM25Okapi(corpus).get_scores(query)
+            )
+
+    def test_empty_vocabulary(self):
+        """A corpus without tokens scores zero instead of failing"""
+        assert list(BM25Index([[], []]).get_scores(["crawl"])) == [0.0, 0.0]
+
+    def test_stem_cache_lru(self):
+        """Stems are counted per distinct word and the oldest are evicted"""
+        cache = StemCache(max_size=2)
+        assert cache.stem_words(["running", "running", "pages"]) == {
+            "running": "run",
+            "pages": "page",
+        }
+        cache.stem_words(["running"])
+        cache.stem_words(["crawlers"])
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1)
+        assert stats["entries"] == 2
+        # "pages" was the least recently used
+        cache.stem_words(["pages"])
+        assert cache.get_stats()["misses"] == 4
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,5 +1,7 @@
 import os, sys
+import time
 import pytest
+from bs4 import BeautifulSoup
 
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
@@ -7,6 +9,44 @@ sys.path.append(parent_dir)
 from crawl4ai.content_filter_strategy import PruningContentFilter
 
 
+class PerNodePruningContentFilter(PruningContentFilter):
+    """Reference: measures every node with get_text() and encode_contents() as it is visited."""
+
+    def _subtree_metrics(self, root):
+        metrics = {}
+        for tag in [root] + root.find_all(True):
+            text = tag.get_text(strip=True)
+            link_text_len = sum(
+                len(s.strip())
+                for s in (a.string for a in tag.find_all("a", recursive=False))
+                if s
+            )
+            metrics[id(tag)] = (
+                len(text),
+                len(tag.encode_contents().decode("utf-8")),
+                link_text_len,
+                text.count(" ") + 1,
+            )
+        return metrics
+
+
+def generate_large_html(sections=300, depth=60):
+    """Wide page of sections plus a deeply nested column, with entities, void tags and templates"""
+    parts = ["<html><body><main>"]
+    for i in range(sections):
+        parts.append(
+            f'<section class="{"sidebar" if i % 7 == 0 else "content"}"><h2>Title {i}</h2><ul>'
+            + "".join(f'<li><a href="#{j}">item {j}</a></li>' for j in range(6))
+            + f"</ul><p>Body {i} &amp; " + "lorem ipsum dolor " * (i % 25)
+            + '<br><img src="a.png" alt="a&quot;b"></p><template>tpl</template></section>'
+        )
+    parts.append("</main>")
+    for i in range(depth):
+        parts.append(f'<div id="d{i}"><p>Nested paragraph {i} with <a href="/x">a link</a> and <b>bold</b>.</p>')
+    parts.append("</div>" * depth + "</body></html>")
+    return "".join(parts)
+
+
 @pytest.fixture
 def basic_html():
     return """
@@ -165,6 +205,64 @@ class TestPruningContentFilter:
         second_run = filter.filter_content(basic_html)
         assert first_run == second_run, "Output should be consistent"
 
+    @pytest.mark.parametrize("threshold_type", ["fixed", "dynamic"])
+    @pytest.mark.parametrize("min_word_threshold", [None, 3])
+    def test_matches_per_node_metrics(
+        self, basic_html, link_heavy_html, mixed_content_html, threshold_type, min_word_threshold
+    ):
+        """Metrics from the single bottom-up pass prune exactly like per-node measurement"""
+        large_html = generate_large_html(sections=40, depth=20)
+        for html in (basic_html, link_heavy_html, mixed_content_html, large_html):
+            kwargs = dict(threshold_type=threshold_type, min_word_threshold=min_word_threshold)
+            expected = PerNodePruningContentFilter(**kwargs).filter_content(html)
+            assert PruningContentFilter(**kwargs).filter_content(html) == expected
+
+    def test_subtree_metrics(self):
+        """Metrics equal get_text(), encode_contents() and direct link text of each tag"""
+        html = generate_large_html(sections=5, depth=5)
+        body = BeautifulSoup(html, "lxml").body
+        filter = PruningContentFilter()
+        assert filter._subtree_metrics(body) == PerNodePruningContentFilter()._subtree_metrics(body)
+
+    def test_subtree_metrics_markup_edge_cases(self):
+        """Tag lengths match encode_contents() for attribute and string edge cases"""
+        html = """<html><head><meta charset="latin-1"></head><body>
+            <div class="a  b" id='q"x' data-x="1 &amp; 2 <3>" hidden><p>caf\u00e9 &lt;ok&gt;</p></div>
+            <svg xmlns:xlink="http://www.w3.org/1999/xlink"><use xlink:href="#i"/></svg>
+            <ruby>k<rp>(</rp><rt>kan</rt><rp>)</rp></ruby><br><img src="a.png" alt="">
+            <script>var a = "<b>";</script><style>p > a { color: red }</style>
+            <template><p>tpl text</p></template><!-- note --><![CDATA[cdata]]>
+            <input disabled value="&quot;v&quot;"><a href="/x">link</a></body></html>"""
+        soup = BeautifulSoup(html, "lxml")
+        for root in (soup.body, soup.head):
+            assert PruningContentFilter()._subtree_metrics(root) == (
+                PerNodePruningContentFilter()._subtree_metrics(root)
+            )
+
+    def test_large_page_matches_per_node(self):
+        """Same output as per-node measurement on a large page"""
+        html = generate_large_html()
+        assert PruningContentFilter().filter_content(html) == (
+            PerNodePruningContentFilter().filter_content(html)
+        )
+
+    @pytest.mark.skipif(
+        not os.environ.get("CRAWL4AI_BENCHMARK"), reason="benchmark, set CRAWL4AI_BENCHMARK=1"
+    )
+    def test_large_page_benchmark(self):
+        """Benchmark on a large page against per-node measurement"""
+        html = generate_large_html()
+
+        start = time.perf_counter()
+        PerNodePruningContentFilter().filter_content(html)
+        per_node = time.perf_counter() - start
+
+        start = time.perf_counter()
+        PruningContentFilter().filter_content(html)
+        single_pass = time.perf_counter() - start
+
+        print(f"\nPruning large page: per-node {per_node:.3f}s, single pass {single_pass:.3f}s")
+        assert single_pass < per_node
 
 if __name__ == "__main__":
     pytest.main([__file__])
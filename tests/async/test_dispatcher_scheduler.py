@@ -0,0 +1,193 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_dispatcher import (
+    DomainScheduler,
+    MemoryAdaptiveDispatcher,
+    RateLimiter,
+    SemaphoreDispatcher,
+)
+from crawl4ai.models import DomainState
+
+
+class FakeCrawler:
+    """Records the order URLs are crawled in and answers after a short delay"""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.started = []
+        self.running = {}
+        self.max_running = {}
+
+    async def arun(self, url, config=None, session_id=None):
+        domain = urlparse(url).netloc
+        self.started.append(url)
+        self.running[domain] = self.running.get(domain, 0) + 1
+        self.max_running[domain] = max(self.max_running.get(domain, 0), self.running[domain])
+        await asyncio.sleep(self.delay)
+        self.running[domain] -= 1
+        return SimpleNamespace(url=url, status_code=200, success=True, error_message="")
+
+
+def drain(scheduler, now=None):
+    urls = []
+    while (next_url := scheduler.pop(now)) is not None:
+        urls.append(next_url[0])
+    return urls
+
+
+def test_round_robin_between_domains():
+    scheduler = DomainScheduler()
+    for i in range(4):
+        scheduler.push(f"https://a.com/{i}", f"a{i}")
+    scheduler.push("https://b.com/0", "b0")
+    scheduler.push("https://c.com/0", "c0")
+    scheduler.push("https://b.com/1", "b1")
+
+    assert len(scheduler) == 7
+    assert drain(scheduler) == [
+        "https://a.com/0",
+        "https://b.com/0",
+        "https://c.com/0",
+        "https://a.com/1",
+        "https://b.com/1",
+        "https://a.com/2",
+        "https://a.com/3",
+    ]
+    assert len(scheduler) == 0
+
+
+def test_priorities_across_domains():
+    scheduler = DomainScheduler()
+    scheduler.push("https://a.com/low", "1")
+    scheduler.push("https://b.com/low", "2")
+    scheduler.push("https://a.com/high", "3", priority=5)
+    scheduler.push("https://c.com/mid", "4", priority=1)
+
+    assert drain(scheduler) == [
+        "https://a.com/high",
+        "https://c.com/mid",
+        "https://b.com/low",
+        "https://a.com/low",
+    ]
+
+
+def test_backing_off_domains_are_skipped():
+    now = 1000.0
+    clock = [now]
+    ready = {"a.com": now + 5}
+    scheduler = DomainScheduler(
+        reserve=lambda url: max(0.0, ready.get(urlparse(url).netloc, 0.0) - clock[0])
+    )
+    for url in ("https://a.com/0", "https://a.com/1", "https://b.com/0"):
+        scheduler.push(url, url)
+
+    assert drain(scheduler, now) == ["https://b.com/0"]
+    assert scheduler.next_ready_time() == now + 5
+    # A new URL of a sleeping domain waits with it
+    scheduler.push("https://a.com/2", "a2", priority=3)
+    clock[0] = now + 1
+    assert scheduler.pop(now + 1) is None
+
+    clock[0] = now + 5
+    assert drain(scheduler, now + 5) == ["https://a.com/2", "https://a.com/0", "https://a.com/1"]
+    assert scheduler.next_ready_time() is None
+
+
+def test_max_per_domain():
+    scheduler = DomainScheduler(max_per_domain=2)
+    for i in range(4):
+        scheduler.push(f"https://a.com/{i}", f"a{i}")
+    scheduler.push("https://b.com/0", "b0")
+
+    assert drain(scheduler) == ["https://a.com/0", "https://b.com/0", "https://a.com/1"]
+    scheduler.release("https://a.com/0")
+    assert drain(scheduler) == ["https://a.com/2"]
+    scheduler.release("https://b.com/0")
+    assert scheduler.pop() is None
+    scheduler.release("https://a.com/1")
+    assert drain(scheduler) == ["https://a.com/3"]
+
+
+def test_rate_limiter_reserve_does_not_wait():
+    rate_limiter = RateLimiter(base_delay=(2.0, 2.0))
+    assert rate_limiter.reserve("https://a.com/0") == 0.0
+    # The next request to the domain is refused, not delayed
+    assert 1.9 < rate_limiter.reserve("https://a.com/1") <= 2.0
+    assert rate_limiter.reserve("https://b.com/0") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_does_not_wait_on_backing_off_domain():
+    rate_limiter = RateLimiter(base_delay=(0.0, 0.0))
+    rate_limiter.domains["slow.com"] = DomainState(
+        last_request_time=time.time(), current_delay=0.3
+    )
+    dispatcher = MemoryAdaptiveDispatcher(
+        max_session_permit=1, memory_threshold_percent=100.0, rate_limiter=rate_limiter
+    )
+    crawler = FakeCrawler()
+    urls = ["https://slow.com/0"] + [f"https://fast.com/{i}" for i in range(3)]
+
+    start = time.perf_counter()
+    results = await dispatcher.run_urls(urls, crawler, config=None)
+
+    assert crawler.started == urls[1:] + urls[:1]
+    assert all(not r.error_message for r in results)
+    assert time.perf_counter() - start < 1.0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_max_per_domain():
+    dispatcher = MemoryAdaptiveDispatcher(
+        max_session_permit=6, memory_threshold_percent=100.0, max_per_domain=2
+    )
+    crawler = FakeCrawler(delay=0.02)
+    urls = [f"https://a.com/{i}" for i in range(6)] + [f"https://b.com/{i}" for i in range(3)]
+
+    results = await dispatcher.run_urls(urls, crawler, config=None)
+
+    assert len(results) == len(urls)
+    assert crawler.max_running == {"a.com": 2, "b.com": 2}
+
+
+@pytest.mark.asyncio
+async def test_semaphore_dispatcher_politeness():
+    rate_limiter = RateLimiter(base_delay=(0.0, 0.0))
+    rate_limiter.domains["slow.com"] = DomainState(
+        last_request_time=time.time(), current_delay=0.3
+    )
+    dispatcher = SemaphoreDispatcher(semaphore_count=1, rate_limiter=rate_limiter)
+    crawler = FakeCrawler()
+    urls = ["https://slow.com/0"] + [f"https://fast.com/{i}" for i in range(3)]
+
+    results = await dispatcher.run_urls(crawler, urls, config=None)
+
+    # Fast URLs ran while slow.com was waiting; results keep the order of urls
+    assert crawler.started == urls[1:] + urls[:1]
+    assert [r.url for r in results] == urls
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_stream_priorities():
+    dispatcher = MemoryAdaptiveDispatcher(max_session_permit=1, memory_threshold_percent=100.0)
+    crawler = FakeCrawler(delay=0)
+    urls = [f"https://a.com/{i}" for i in range(3)] + ["https://b.com/urgent"]
+
+    results = [
+        r.url
+        async for r in dispatcher.run_urls_stream(
+            urls, crawler, config=None, priorities={"https://b.com/urgent": 10}
+        )
+    ]
+    assert results[0] == "https://b.com/urgent"
+    assert sorted(results) == sorted(urls)
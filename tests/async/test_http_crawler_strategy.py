@@ -0,0 +1,97 @@
+import os
+import sys
+import asyncio
+import pytest
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+
+@pytest.fixture
+def strategy():
+    return AsyncHTTPCrawlerStrategy(browser_config=BrowserConfig(verbose=False))
+
+
+def test_static_page_does_not_need_rendering(strategy):
+    html = "<html><body><article><p>" + "Static content. " * 30 + "</p></article></body></html>"
+    assert not strategy.needs_rendering(html)
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "",
+        '<html><body><div id="root"></div><script src="/main.js"></script></body></html>',
+        '<html><body><div id="__next"> </div></body></html>',
+        "<html><body><app-root></app-root></body></html>",
+        "<html><body><noscript>You need to enable JavaScript to run this app.</noscript></body></html>",
+        "<html><body><script>" + "var x = 1;" * 100 + "</script></body></html>",
+    ],
+)
+def test_spa_shell_needs_rendering(strategy, html):
+    assert strategy.needs_rendering(html)
+
+
+@pytest.mark.asyncio
+async def test_raw_html_skips_browser(strategy):
+    async with strategy:
+        response = await strategy.crawl("raw:<p>Hello</p>", config=CrawlerRunConfig())
+    assert response.html == "<p>Hello</p>"
+    assert response.status_code == 200
+    assert strategy.fallback_strategy is None
+
+
+@pytest.mark.asyncio
+async def test_browser_only_options_use_fallback(strategy):
+    assert strategy._requires_browser(CrawlerRunConfig(screenshot=True)) == "screenshot"
+    assert strategy._requires_browser(CrawlerRunConfig(js_code="1")) == "js_code"
+    assert strategy._requires_browser(CrawlerRunConfig()) is None
+
+
+class TimingOutFallback:
+    """Fallback strategy whose browser render times out"""
+
+    def __init__(self, http_strategy):
+        self.http_strategy = http_strategy
+        self.connections_in_use = None
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def crawl(self, url, config=None):
+        self.connections_in_use = len(self.http_strategy.session.connector._acquired)
+        raise asyncio.TimeoutError("browser render timed out")
+
+
+@pytest.mark.asyncio
+async def test_fallback_runs_after_response_is_released(strategy):
+    async def image(request):
+        return web.Response(body=b"png", content_type="image/png")
+
+    app = web.Application()
+    app.router.add_get("/image.png", image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    fallback = TimingOutFallback(strategy)
+    strategy.fallback_strategy = fallback
+    try:
+        async with strategy:
+            # A browser timeout is the fallback's error, not an HTTP error to fall back on
+            with pytest.raises(asyncio.TimeoutError, match="browser render"):
+                await strategy.crawl(f"http://127.0.0.1:{port}/image.png", config=CrawlerRunConfig())
+        assert fallback.connections_in_use == 0
+        assert strategy.stats["fallback"] == 1
+    finally:
+        await runner.cleanup()
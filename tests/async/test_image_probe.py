@@ -0,0 +1,130 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.image_probe import ImageProbe, parse_image_headers
+
+
+async def start_image_server(requests_seen, delay=0.0):
+    async def image(request):
+        requests_seen.append((request.method, request.path))
+        await asyncio.sleep(delay)
+        name = request.match_info["name"]
+        if name == "missing.png":
+            return web.Response(status=404)
+        if name == "nohead.jpg" and request.method == "HEAD":
+            return web.Response(status=405)
+        if request.method == "GET" and request.headers.get("Range") == "bytes=0-0":
+            return web.Response(
+                status=206,
+                body=b"x",
+                headers={"Content-Range": "bytes 0-0/2048", "Content-Type": "image/jpeg"},
+            )
+        return web.Response(
+            body=b"x" * 1024, headers={"Content-Type": "image/png; charset=binary"}
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/img/{name}", image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_parse_image_headers():
+    assert parse_image_headers({"Content-Length": "10", "Content-Type": "Image/PNG"}) == (10, "image/png")
+    assert parse_image_headers({"Content-Range": "bytes 0-0/77", "Content-Length": "1"}) == (77, None)
+    assert parse_image_headers({"Content-Range": "bytes 0-0/*"}) == (None, None)
+    assert parse_image_headers({}) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_probe_head_fallback_and_cache():
+    seen = []
+    runner, base = await start_image_server(seen)
+    try:
+        async with ImageProbe() as probe:
+            assert await probe.probe(f"{base}/img/a.png") == (1024, "image/png")
+            assert await probe.probe(f"{base}/img/nohead.jpg") == (2048, "image/jpeg")
+            assert await probe.probe(f"{base}/img/missing.png") == (None, None)
+
+            # Successes and failures are both served from the cache
+            requests_before = len(seen)
+            await probe.probe(f"{base}/img/a.png")
+            await probe.probe(f"{base}/img/missing.png")
+            assert len(seen) == requests_before
+
+            stats = probe.get_stats()
+            assert stats["hits"] == 2 and stats["misses"] == 3 and stats["failures"] == 1
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_probes_share_one_request():
+    seen = []
+    runner, base = await start_image_server(seen, delay=0.05)
+    try:
+        async with ImageProbe(max_concurrency=4) as probe:
+            urls = [f"{base}/img/same.png"] * 10 + [f"{base}/img/{i}.png" for i in range(8)]
+            results = await asyncio.gather(*(probe.probe(url) for url in urls))
+            assert all(result == (1024, "image/png") for result in results)
+            assert seen.count(("HEAD", "/img/same.png")) == 1
+            assert len(seen) == 9
+    finally:
+        await runner.cleanup()
+
+
+def test_cache_ttl_and_size(monkeypatch):
+    probe = ImageProbe(cache_size=2, ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    probe._store("a", (1, "image/png"), probe.ttl)
+    probe._store("b", (2, "image/png"), probe.ttl)
+    assert probe._cached("a") == (1, "image/png")
+    probe._store("c", (3, "image/png"), probe.ttl)
+    # "b" was the least recently used
+    assert probe._cached("b") is None
+    assert probe._cached("a") == (1, "image/png")
+
+    now[0] += 11
+    assert probe._cached("a") is None
+    assert probe.get_stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fill_media():
+    seen = []
+    runner, base = await start_image_server(seen)
+    try:
+        media = {
+            "images": [
+                {"src": "/img/a.png"},
+                {"src": f"{base}/img/a.png"},
+                {"src": "/img/missing.png"},
+                {"src": "data:image/png;base64,AAAA"},
+            ],
+            "videos": [],
+        }
+        async with ImageProbe() as probe:
+            filled = await probe.fill_media(media, f"{base}/page.html")
+
+        assert filled == 2
+        assert media["images"][0]["file_size"] == 1024
+        assert media["images"][1]["content_type"] == "image/png"
+        assert media["images"][2]["file_size"] is None
+        assert "file_size" not in media["images"][3]
+        assert len(seen) == 2
+    finally:
+        await runner.cleanup()
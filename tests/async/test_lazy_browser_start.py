@@ -0,0 +1,35 @@
+import os
+import sys
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+
+
+@pytest.mark.asyncio
+async def test_raw_html_does_not_launch_browser(tmp_path):
+    local_file = tmp_path / "page.html"
+    local_file.write_text("<p>From disk</p>", encoding="utf-8")
+
+    strategy = AsyncPlaywrightCrawlerStrategy(browser_config=BrowserConfig(verbose=False))
+    async with strategy:
+        raw = await strategy.crawl("raw:<p>Hello</p>", config=CrawlerRunConfig())
+        local = await strategy.crawl(f"file://{local_file}", config=CrawlerRunConfig())
+        assert strategy.browser_manager.browser is None
+    assert raw.html == "<p>Hello</p>"
+    assert local.html == "<p>From disk</p>"
+
+
+@pytest.mark.asyncio
+async def test_screenshot_launches_browser_on_demand():
+    strategy = AsyncPlaywrightCrawlerStrategy(browser_config=BrowserConfig(verbose=False))
+    async with strategy:
+        response = await strategy.crawl(
+            "raw:<h1>Shot</h1>", config=CrawlerRunConfig(screenshot=True)
+        )
+        assert strategy.browser_manager.browser is not None
+    assert response.screenshot
@@ -0,0 +1,128 @@
+import os
+import sys
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.memory_sampler import MemorySampler
+
+MB = 1024 * 1024
+
+
+class FakeMachine:
+    """1000 MB of memory, 400 MB used when idle plus page_mb for each running page"""
+
+    def __init__(self, sampler: MemorySampler, page_mb: float = 100.0):
+        self.sampler = sampler
+        self.page_mb = page_mb
+        self.idle_mb = 400.0
+
+    def read(self):
+        used_mb = self.idle_mb + self.page_mb * self.sampler.active_pages
+        memory = SimpleNamespace(
+            total=1000 * MB, available=(1000 - used_mb) * MB, percent=used_mb / 10
+        )
+        # The process tree is the part of used memory that belongs to the crawler
+        return memory, used_mb - 300
+
+
+class FakeCrawler:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def arun(self, url, config=None, session_id=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return SimpleNamespace(url=url, status_code=200, success=True, error_message="")
+
+
+@pytest.mark.asyncio
+async def test_learns_memory_per_page():
+    sampler = MemorySampler(initial_page_mb=50.0, smoothing=0.5)
+    machine = FakeMachine(sampler, page_mb=200.0)
+    sampler._read_process_memory = machine.read
+
+    await sampler.sample()
+    assert sampler.snapshot.process_tree_mb == 100.0
+    sampler.page_started()
+    sampler.page_started()
+    # Pages started since the last sample are projected with the current estimate
+    assert sampler.projected_percent() == pytest.approx(40.0 + 3 * 5.0)
+
+    # Increases are followed at once
+    snapshot = await sampler.sample()
+    assert snapshot.page_mb == pytest.approx(200.0)
+    assert snapshot.active_pages == 2
+    assert snapshot.system_used_mb == pytest.approx(600.0)
+    # Projections start from the last sample when the smoothed figure lags behind
+    assert sampler.projected_percent() == pytest.approx(80.0 + 20.0)
+
+    # Decreases are smoothed
+    machine.page_mb = 100.0
+    snapshot = await sampler.sample()
+    assert snapshot.page_mb == pytest.approx(150.0)
+
+
+@pytest.mark.asyncio
+async def test_context_memory_and_nested_start():
+    async def context_memory():
+        return {"ctx": 12.5}
+
+    sampler = MemorySampler(interval=0.01, context_memory=context_memory)
+    async with sampler:
+        await sampler.start()
+        await sampler.stop()
+        assert sampler.running
+        await asyncio.sleep(0.05)
+        assert sampler.samples > 1
+        assert sampler.snapshot.context_mb == {"ctx": 12.5}
+        assert sampler.snapshot.system_total_mb > 0
+    assert not sampler.running
+
+
+@pytest.mark.asyncio
+async def test_slow_context_memory_does_not_delay_samples():
+    calls = 0
+
+    async def context_memory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(10)
+
+    sampler = MemorySampler(interval=0.01, context_memory=context_memory, context_timeout=0.05)
+    async with sampler:
+        await asyncio.sleep(0.2)
+        assert sampler.samples > 5
+        # A read still running is not started again, an abandoned one is
+        assert 1 < calls < sampler.samples
+        assert sampler.snapshot.context_mb == {}
+    assert not sampler.running
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_admits_by_learned_page_memory():
+    sampler = MemorySampler(interval=0.01, initial_page_mb=100.0)
+    sampler._read_process_memory = FakeMachine(sampler).read
+    dispatcher = MemoryAdaptiveDispatcher(
+        memory_threshold_percent=70.0, max_session_permit=10, memory_sampler=sampler
+    )
+    crawler = FakeCrawler()
+    urls = [f"https://site{i}.com/" for i in range(6)]
+
+    results = await dispatcher.run_urls(urls, crawler, config=None)
+
+    # 400 MB idle + 100 MB per page stays below 700 MB with at most two pages
+    assert crawler.max_running == 2
+    assert len(results) == len(urls)
+    assert all(r.memory_usage == pytest.approx(100.0) for r in results)
+    assert sampler.active_pages == 0
+    assert not sampler.running
@@ -0,0 +1,84 @@
+import os
+import sys
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.strategies.extraction import JsonCssExtractionStrategy, ParsedDocument
+
+SAMPLE_HTML = open(
+    os.path.join(os.path.dirname(__file__), "sample_wikipedia.html"), encoding="utf-8"
+).read()
+
+SCHEMAS = [
+    {
+        "baseSelector": "a",
+        "fields": [
+            {"name": "text", "type": "text"},
+            {"name": "href", "type": "attribute", "attribute": "href"},
+            {"name": "class", "type": "attribute", "attribute": "class"},
+        ],
+    },
+    {
+        "baseSelector": "table.infobox tr",
+        "fields": [
+            {"name": "key", "selector": "th", "type": "text"},
+            {"name": "value", "selector": "td", "type": "text"},
+        ],
+    },
+    {
+        "baseSelector": "ul li",
+        "fields": [
+            {"name": "links", "type": "list", "selector": "a", "fields": [{"name": "t", "type": "text"}]},
+            {"name": "span", "type": "nested", "selector": "span", "fields": [{"name": "s", "type": "text"}]},
+        ],
+    },
+]
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_css_extraction_on_shared_tree_matches_beautifulsoup(schema):
+    strategy = JsonCssExtractionStrategy(schema, use_shared_tree=True)
+    document = ParsedDocument(SAMPLE_HTML)
+    expected = strategy.run("https://en.wikipedia.org", [SAMPLE_HTML])
+    assert strategy.run("https://en.wikipedia.org", [SAMPLE_HTML], document=document) == expected
+    assert document.is_parsed
+
+
+def test_unsupported_selector_falls_back_to_beautifulsoup():
+    schema = {"baseSelector": "p:-soup-contains('the')", "fields": [{"name": "t", "type": "text"}]}
+    strategy = JsonCssExtractionStrategy(schema, use_shared_tree=True)
+    document = ParsedDocument(SAMPLE_HTML)
+    result = strategy.run("https://en.wikipedia.org", [SAMPLE_HTML], document=document)
+    assert result and not document.is_parsed
+
+
+def test_css_extraction_ignores_shared_tree_by_default():
+    # html fields and malformed nesting depend on the parser, so they stay on html.parser
+    html_schema = {"baseSelector": "div", "fields": [{"name": "h", "selector": "p", "type": "html"}]}
+    soup_schema = {"baseSelector": "ul li", "fields": [{"name": "t", "type": "text"}]}
+    for schema, html, expected, lxml_output in [
+        (html_schema, "<div><p>a<br/>b</p></div>", [{"h": "<p>a<br/>b</p>"}], [{"h": "<p>a<br>b</p>"}]),
+        (soup_schema, "<ul><li>1<li>2</ul>", [{"t": "12"}, {"t": "2"}], [{"t": "1"}, {"t": "2"}]),
+    ]:
+        strategy = JsonCssExtractionStrategy(schema)
+        assert not strategy.accepts_document
+        document = ParsedDocument(html)
+        assert strategy.run("https://example.com", [html], document=document) == expected
+        assert not document.is_parsed
+
+        strategy = JsonCssExtractionStrategy(schema, use_shared_tree=True)
+        assert strategy.accepts_document
+        assert strategy.run("https://example.com", [html], document=ParsedDocument(html)) == lxml_output
+
+
+def test_mutable_tree_keeps_original():
+    document = ParsedDocument("<div><p>Hello</p></div>")
+    tree = document.mutable_tree()
+    tree.body.clear()
+    assert document.tree.body.text_content() == "Hello"
+
+    document = ParsedDocument("<div><p>Hello</p></div>", keep_original=False)
+    assert document.mutable_tree() is not None and not document.is_parsed
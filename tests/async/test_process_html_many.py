@@ -0,0 +1,74 @@
+import os
+import sys
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_webcrawler import (
+    AsyncWebCrawler,
+    _init_process_worker,
+    _process_html_in_worker,
+)
+
+
+def make_pages(count):
+    for i in range(count):
+        html = f"<html><body><h1>Page {i}</h1><p>{'Some text. ' * 50}</p></body></html>"
+        yield f"https://example.com/{i}", html
+
+
+@pytest.mark.asyncio
+async def test_process_html_many_returns_every_page():
+    async with AsyncWebCrawler(verbose=False) as crawler:
+        results = [
+            result
+            async for result in crawler.aprocess_html_many(
+                make_pages(20), CrawlerRunConfig(), max_workers=2, max_in_flight=4
+            )
+        ]
+    assert sorted(r.url for r in results) == sorted(url for url, _ in make_pages(20))
+    assert all(r.status_code == 200 and "Page" in r.content for r in results)
+
+
+def test_worker_error_returns_failed_result():
+    # Without a config, processing fails inside the worker
+    _init_process_worker(None, None)
+    url, html = next(make_pages(1))
+    result = _process_html_in_worker(url, html)
+    assert result.url == url
+    assert result.status_code == 500
+    assert result.content == ""
+
+
+@pytest.mark.asyncio
+async def test_process_html_many_accepts_async_iterables():
+    async def pages():
+        for page in make_pages(3):
+            yield page
+
+    async with AsyncWebCrawler(verbose=False) as crawler:
+        results = [r async for r in crawler.aprocess_html_many(pages(), max_workers=1)]
+    assert len(results) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process", None])
+async def test_processing_stages_report_queue_wait(executor):
+    url, html = next(make_pages(1))
+    async with AsyncWebCrawler(verbose=False, processing_executor=executor) as crawler:
+        result = await crawler.aprocess_html(
+            url=url,
+            html=html,
+            extracted_content="",
+            config=CrawlerRunConfig(),
+            screenshot=None,
+            pdf_data=None,
+            verbose=False,
+        )
+    assert result.status_code == 200
+    assert set(result.processing_stats) == {"scrape", "markdown"}
+    for stage in result.processing_stats.values():
+        assert stage["queue_wait"] >= 0 and stage["run_time"] >= 0
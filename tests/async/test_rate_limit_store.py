@@ -0,0 +1,106 @@
+import os
+import sys
+import time
+import asyncio
+import sqlite3
+import multiprocessing
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_dispatcher import RateLimiter
+from crawl4ai.rate_limit_store import MemoryRateLimitStore, SQLiteRateLimitStore
+
+
+def reserve_in_child(path, url, results):
+    rate_limiter = RateLimiter(base_delay=(60.0, 60.0), store=SQLiteRateLimitStore(path))
+    results.put(rate_limiter.reserve(url))
+
+
+def test_memory_store_is_the_default():
+    rate_limiter = RateLimiter(base_delay=(2.0, 2.0))
+    assert isinstance(rate_limiter.store, MemoryRateLimitStore)
+    assert rate_limiter.reserve("https://a.com/0") == 0.0
+    # The state stays visible through rate_limiter.domains
+    assert rate_limiter.domains["a.com"].current_delay == 2.0
+    assert rate_limiter.store.get("a.com").current_delay == 2.0
+    assert rate_limiter.store.get("b.com") is None
+
+
+def test_sqlite_store_is_shared(tmp_path):
+    path = str(tmp_path / "rate_limit.db")
+    first = RateLimiter(base_delay=(2.0, 2.0), store=SQLiteRateLimitStore(path))
+    second = RateLimiter(base_delay=(2.0, 2.0), store=SQLiteRateLimitStore(path))
+
+    assert first.reserve("https://a.com/0") == 0.0
+    # The slot was taken by the other rate limiter
+    assert 1.9 < second.reserve("https://a.com/1") <= 2.0
+    assert second.reserve("https://b.com/0") == 0.0
+
+    # A 429 seen by one rate limiter slows the domain down for both
+    assert second.update_delay("https://a.com/0", 429)
+    state = first.store.get("a.com")
+    assert state.fail_count == 1
+    assert state.current_delay >= 2.0 * 2 * 0.75
+    assert first.store.get("b.com").fail_count == 0
+
+
+def test_sqlite_store_gives_up_after_max_retries(tmp_path):
+    store = SQLiteRateLimitStore(str(tmp_path / "rate_limit.db"))
+    rate_limiter = RateLimiter(base_delay=(1.0, 1.0), max_retries=1, store=store)
+    rate_limiter.reserve("https://a.com/0")
+    assert rate_limiter.update_delay("https://a.com/0", 503)
+    assert not rate_limiter.update_delay("https://a.com/0", 503)
+    assert rate_limiter.update_delay("https://a.com/0", 200)
+    assert store.get("a.com").fail_count == 0
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_does_not_block_event_loop(tmp_path):
+    path = str(tmp_path / "rate_limit.db")
+    rate_limiter = RateLimiter(base_delay=(1.0, 1.0), store=SQLiteRateLimitStore(path))
+    await rate_limiter.areserve("https://b.com/0")
+
+    # Another process holds the write lock for 0.3 s
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    reserve = asyncio.ensure_future(rate_limiter.areserve("https://a.com/0"))
+    ticks = 0
+    start = time.monotonic()
+    while time.monotonic() - start < 0.3:
+        await asyncio.sleep(0.01)
+        ticks += 1
+    assert not reserve.done()
+    other.execute("COMMIT")
+    other.close()
+
+    assert await reserve == 0.0
+    # The loop kept running while the reservation waited for the lock
+    assert ticks > 10
+    assert await rate_limiter.aupdate_delay("https://a.com/0", 429)
+    assert rate_limiter.store.get("a.com").fail_count == 1
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_sqlite_store_one_slot_across_processes(tmp_path):
+    path = str(tmp_path / "rate_limit.db")
+    SQLiteRateLimitStore(path).get("a.com")  # Create the database before forking
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    processes = [
+        context.Process(target=reserve_in_child, args=(path, f"https://a.com/{i}", results))
+        for i in range(8)
+    ]
+    for process in processes:
+        process.start()
+    waits = [results.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join(timeout=30)
+
+    # Exactly one process got the slot, the others were told to wait
+    assert sorted(waits)[0] == 0.0
+    assert all(wait > 50 for wait in sorted(waits)[1:])
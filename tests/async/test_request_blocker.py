@@ -0,0 +1,70 @@
+import os
+import sys
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import RequestBlocker
+
+
+class FakeFrame:
+    def __init__(self, parent_frame=None):
+        self.parent_frame = parent_frame
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", navigation=False, frame=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.frame = frame or FakeFrame()
+        self._navigation = navigation
+
+    def is_navigation_request(self):
+        return self._navigation
+
+
+@pytest.fixture
+def blocker():
+    return RequestBlocker.from_config(
+        BrowserConfig(),
+        CrawlerRunConfig(
+            blocked_resource_types=["font"],
+            blocked_domains=["doubleclick.net"],
+        ),
+    )
+
+
+def test_no_policy_installs_no_blocker():
+    assert RequestBlocker.from_config(BrowserConfig(), CrawlerRunConfig()) is None
+
+
+@pytest.mark.parametrize(
+    "request_,blocked",
+    [
+        (FakeRequest("https://ad.doubleclick.net/tag.js"), True),
+        (FakeRequest("https://doubleclick.net/pixel"), True),
+        (FakeRequest("https://notdoubleclick.net/app.js"), False),
+        (FakeRequest("https://example.com/font.woff2", "font"), True),
+        (FakeRequest("https://example.com/logo.png", "image"), False),
+        # The crawled page itself is not blocked by domain, its iframes are
+        (FakeRequest("https://doubleclick.net/", "document", navigation=True), False),
+        (
+            FakeRequest(
+                "https://doubleclick.net/", "document", navigation=True, frame=FakeFrame(FakeFrame())
+            ),
+            True,
+        ),
+    ],
+)
+def test_should_block(blocker, request_, blocked):
+    assert blocker.should_block(request_) is blocked
+
+
+def test_text_mode_blocks_by_type_and_extension():
+    blocker = RequestBlocker.from_config(BrowserConfig(text_mode=True), CrawlerRunConfig())
+    assert blocker.should_block(FakeRequest("https://example.com/photo", "image"))
+    assert blocker.should_block(FakeRequest("https://example.com/report.PDF?x=1", "other"))
+    assert not blocker.should_block(FakeRequest("https://example.com/page.html", "document"))
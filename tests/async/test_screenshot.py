@@ -9,7 +9,56 @@ import io
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
 
+import hashlib
 from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import (
+    SCREENSHOT_EXTENSIONS,
+    error_screenshot,
+    stitch_screenshots,
+    write_content_addressed,
+)
+
+
+@pytest.mark.parametrize("image_format", ["png", "jpeg", "webp"])
+def test_error_screenshot_uses_requested_format(image_format):
+    image = Image.open(io.BytesIO(error_screenshot("Boom", image_format)))
+    assert image.format == image_format.upper()
+
+
+def png_segment(color, height):
+    buffered = io.BytesIO()
+    Image.new("RGB", (20, height), color=color).save(buffered, format="PNG")
+    return buffered.getvalue()
+
+
+@pytest.mark.parametrize("image_format", ["png", "jpeg", "webp"])
+def test_stitch_screenshots_uses_requested_format(image_format):
+    segments = [png_segment("red", 30), png_segment("blue", 20)]
+    image = Image.open(io.BytesIO(stitch_screenshots(segments, image_format)))
+    assert image.format == image_format.upper()
+    assert image.size == (20, 50)
+
+
+def test_screenshot_format_is_validated():
+    assert CrawlerRunConfig(screenshot_format="JPG").screenshot_format == "jpeg"
+    with pytest.raises(ValueError):
+        CrawlerRunConfig(screenshot_format="gif")
+
+
+def test_screenshot_dir_write_is_content_addressed(tmp_path):
+    data = stitch_screenshots([png_segment("red", 10)], "jpeg")
+    directory = str(tmp_path / "screenshots")
+    path = write_content_addressed(data, directory, SCREENSHOT_EXTENSIONS["jpeg"])
+    assert os.path.basename(path) == f"{hashlib.sha256(data).hexdigest()}.jpg"
+    with open(path, "rb") as f:
+        assert f.read() == data
+
+    # The same screenshot is not written twice, another one gets its own file
+    assert write_content_addressed(data, directory, "jpg") == path
+    other = write_content_addressed(png_segment("blue", 10), directory, "png")
+    assert other != path
+    assert sorted(os.listdir(directory)) == sorted([os.path.basename(path), os.path.basename(other)])
 
 
 @pytest.mark.asyncio
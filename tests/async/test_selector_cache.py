@@ -0,0 +1,88 @@
+import os
+import sys
+import pytest
+from cssselect import SelectorError
+from lxml import html as lhtml
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.strategies.extraction import (
+    JsonCssExtractionStrategy,
+    SelectorCache,
+    selector_cache,
+)
+from crawl4ai.strategies.extraction.content_scraping_strategy import (
+    LXMLWebScrapingStrategy,
+)
+
+CARDS_HTML = "<html><body>{}</body></html>".format(
+    "".join(
+        f'<div class="card"><h2>Item {i}</h2><span class="price">{i}.99</span></div>'
+        for i in range(20)
+    )
+)
+
+
+def test_selector_compiled_once():
+    cache = SelectorCache()
+    first = cache.css("div.card > h2")
+    assert cache.css("div.card > h2") is first
+    assert cache.css("div.card > h2", prefix="descendant::") is not first
+    cache.soup("div.card")
+    cache.soup("div.card")
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 2 and stats["misses"] == 3
+    assert stats["by_kind"]["soup"]["hit_rate"] == 0.5
+    assert stats["entries"] == 3
+
+
+def test_least_recently_used_evicted():
+    cache = SelectorCache(max_size=2)
+    a = cache.xpath("//a")
+    cache.xpath("//b")
+    cache.xpath("//a")
+    cache.xpath("//c")
+    assert cache.xpath("//a") is a
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["by_kind"]["xpath"]["misses"] == 3
+
+
+def test_invalid_selector_not_cached():
+    cache = SelectorCache()
+    with pytest.raises(SelectorError):
+        cache.css("div[")
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_translators_kept_apart():
+    cache = SelectorCache()
+    doc = lhtml.fromstring("<div><p>Hello World</p></div>")
+    # lxml's :contains() ignores case, the standard one does not
+    assert len(cache.css("p:contains('hello')")(doc)) == 1
+    assert len(cache.css("p:contains('hello')", translator="cssselect")(doc)) == 0
+
+
+def test_strategies_share_process_cache():
+    selector_cache.clear()
+    schema = {
+        "baseSelector": "div.card",
+        "fields": [
+            {"name": "title", "selector": "h2", "type": "text"},
+            {"name": "price", "selector": "span.price", "type": "text"},
+        ],
+    }
+    items = JsonCssExtractionStrategy(schema).run("https://example.com", [CARDS_HTML])
+    assert len(items) == 20
+    # One compilation per selector, every other lookup for a card and field hits
+    soup_stats = selector_cache.get_stats()["by_kind"]["soup"]
+    assert soup_stats["misses"] == 3
+    assert soup_stats["hits"] == 38
+
+    scraper = LXMLWebScrapingStrategy()
+    for _ in range(2):
+        scraper.scrap("https://example.com", CARDS_HTML, css_selector="div.card")
+    css_stats = selector_cache.get_stats()["by_kind"]["css"]
+    assert css_stats["misses"] == 1 and css_stats["hits"] == 1
@@ -0,0 +1,116 @@
+import os
+import sys
+import time
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.utils.utils import normalize_url, is_external_url, get_base_domain
+from crawl4ai.strategies.extraction.content_scraping_strategy import (
+    LXMLWebScrapingStrategy,
+    SinglePassScrapingStrategy,
+    LinkResolver,
+)
+
+URL = "https://en.wikipedia.org/wiki/Test"
+SAMPLE_HTML = open(
+    os.path.join(os.path.dirname(__file__), "sample_wikipedia.html"), encoding="utf-8"
+).read()
+
+SMALL_HTML = """
+<html><head><title>Page</title><meta name="description" content="A page"></head>
+<body>
+  <!-- comment -->
+  <nav><a href="/home">Home</a> <a href="https://facebook.com/brand">Facebook</a></nav>
+  <form><input name="q"><button>Go</button></form>
+  <article data-id="1" class="post">
+    <h1>Title</h1>
+    <p>Some text with <b>bold</b> and <a href="#section">an anchor</a>.<span></span></p>
+    <picture><source srcset="https://cdn.example.com/a.webp 800w">
+      <img src="https://cdn.example.com/a.jpg" alt="A picture with a caption" width="400"></picture>
+    <img src="data:image/png;base64,iVBORw0KGgo=" alt="inline">
+    <video src="movie.mp4"><source src="movie.webm"></video>
+    <div class="social-widget"><p>Follow us</p></div>
+  </article>
+  <script>var x = 1;</script>
+</body></html>
+"""
+
+SCENARIOS = [
+    {},
+    {"remove_comments": True, "remove_forms": True},
+    {"excluded_tags": ["nav", "table"], "excluded_selector": ".social-widget, .navbox"},
+    {"exclude_external_links": True, "exclude_external_images": True},
+    {"exclude_social_media_links": True, "exclude_domains": ["example.com"]},
+    {"keep_data_attributes": True, "only_text": True},
+    {"css_selector": "article, #mw-content-text"},
+    {"css_selector": "#does-not-exist"},
+]
+
+
+@pytest.mark.parametrize("html", [SMALL_HTML, SAMPLE_HTML], ids=["small", "wikipedia"])
+@pytest.mark.parametrize("kwargs", SCENARIOS)
+def test_same_result_as_lxml_strategy(html, kwargs):
+    expected = LXMLWebScrapingStrategy()._scrap(URL, html, **kwargs)
+    result = SinglePassScrapingStrategy()._scrap(URL, html, **kwargs)
+    assert result == expected
+
+
+def test_link_resolver_matches_normalize_url():
+    hrefs = [
+        "#cite_note-1",
+        "#",
+        "/wiki/Main_Page",
+        "/wiki/A?",
+        "/w/index.php?title=Test&action=edit#top",
+        "/a/./b",
+        "/a/../b",
+        "//upload.wikimedia.org/x.png",
+        "https://www.wikipedia.org",
+        "http://example.com/a;p?q=1#f",
+        "https://[::1]/a",
+        "mailto:someone@example.com",
+        "javascript:void(0)",
+        "Special:Random",
+        "../up",
+    ]
+    for base in [URL, "https://example.co.uk/a/b/?x=1#frag", "http://www.example.com"]:
+        base_domain = get_base_domain(base)
+        resolver = LinkResolver(base, base_domain)
+        for href in hrefs:
+            normalized, netloc = resolver.resolve(href)
+            assert normalized == normalize_url(href, base)
+            assert resolver.is_external(normalized, netloc) == is_external_url(
+                normalized, base_domain
+            )
+
+
+def best_time(fn, runs=5):
+    fn()
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.skipif(
+    not os.environ.get("CRAWL4AI_BENCHMARK"), reason="benchmark, set CRAWL4AI_BENCHMARK=1"
+)
+def test_single_pass_is_faster():
+    lxml_strategy, single_pass = LXMLWebScrapingStrategy(), SinglePassScrapingStrategy()
+    lxml_time = best_time(lambda: lxml_strategy._scrap(URL, SAMPLE_HTML))
+    single_pass_time = best_time(lambda: single_pass._scrap(URL, SAMPLE_HTML))
+    print(
+        f"\nLXMLWebScrapingStrategy:    {lxml_time * 1000:.1f} ms"
+        f"\nSinglePassScrapingStrategy: {single_pass_time * 1000:.1f} ms"
+        f"\nSpeedup: {lxml_time / single_pass_time:.2f}x"
+    )
+    assert single_pass_time < lxml_time
+
+
+if __name__ == "__main__":
+    test_single_pass_is_faster()
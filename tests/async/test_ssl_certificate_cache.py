@@ -0,0 +1,46 @@
+import os
+import sys
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.ssl_certificate import SSLCertificate, SSLCertificateCache
+
+
+@pytest.fixture
+def handshakes(monkeypatch):
+    calls = []
+
+    async def fake_afrom_url(url, timeout=10):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return None if "unreachable" in url else SSLCertificate({"subject": {"CN": url}})
+
+    monkeypatch.setattr(SSLCertificate, "afrom_url", staticmethod(fake_afrom_url))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_one_handshake_per_host(handshakes):
+    cache = SSLCertificateCache()
+    certs = await asyncio.gather(
+        *[cache.get(f"https://example.com/page{i}") for i in range(50)]
+    )
+    assert handshakes == ["https://example.com"]
+    assert all(cert is certs[0] for cert in certs)
+    assert cache.stats() == {"hits": 49, "misses": 1, "size": 1}
+
+
+@pytest.mark.asyncio
+async def test_expired_and_failed_entries(handshakes):
+    cache = SSLCertificateCache(ttl=0, failure_ttl=60)
+    await cache.get("https://example.com/a")
+    await cache.get("https://example.com/b")
+    assert len(handshakes) == 2
+
+    assert await cache.get("https://unreachable.test/") is None
+    assert await cache.get("https://unreachable.test/other") is None
+    assert len(handshakes) == 3
@@ -0,0 +1,108 @@
+import os
+import sys
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.subresource_cache import SubresourceCache, freshness_lifetime
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", method="GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.headers = {}
+
+
+class FakeResponse:
+    def __init__(self, status=200, headers=None, body=b""):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, request, response=None):
+        self.request = request
+        self.response = response
+        self.fetched_with = None
+        self.fulfilled = None
+        self.fell_back = False
+
+    async def fetch(self, headers=None):
+        self.fetched_with = headers
+        return self.response
+
+    async def fulfill(self, status=None, headers=None, body=None, response=None):
+        self.fulfilled = {"status": status or response.status, "body": body}
+
+    async def fallback(self):
+        self.fell_back = True
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SubresourceCache(cache_dir=str(tmp_path), max_size=1000)
+
+
+def test_freshness_lifetime():
+    assert freshness_lifetime({"cache-control": "max-age=60"}, 0) == 60
+    assert freshness_lifetime({"cache-control": "no-store"}, 0) is None
+    assert freshness_lifetime({"cache-control": "max-age=60", "vary": "Cookie"}, 0) is None
+    assert freshness_lifetime({"cache-control": "no-cache"}, 0) == 0
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_served_from_disk(cache, tmp_path):
+    url = "https://example.com/app.js"
+    response = FakeResponse(headers={"Cache-Control": "max-age=600"}, body=b"console.log(1)")
+    await cache.handle(FakeRoute(FakeRequest(url), response))
+
+    # A new instance sharing the directory sees the entry without the network
+    other = SubresourceCache(cache_dir=str(tmp_path), max_size=1000)
+    route = FakeRoute(FakeRequest(url))
+    await other.handle(route)
+    assert route.fetched_with is None
+    assert route.fulfilled["body"] == b"console.log(1)"
+    assert other.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_revalidated(cache):
+    url = "https://example.com/style.css"
+    response = FakeResponse(headers={"cache-control": "no-cache", "etag": '"v1"'}, body=b"body{}")
+    await cache.handle(FakeRoute(FakeRequest(url, "stylesheet"), response))
+
+    route = FakeRoute(FakeRequest(url, "stylesheet"), FakeResponse(status=304))
+    await cache.handle(route)
+    assert route.fetched_with["if-none-match"] == '"v1"'
+    assert route.fulfilled == {"status": 200, "body": b"body{}"}
+    assert cache.stats["revalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_requests_pass_through(cache):
+    route = FakeRoute(FakeRequest("https://example.com/", "document"))
+    await cache.handle(route)
+    assert route.fell_back
+
+    response = FakeResponse(headers={"cache-control": "no-store"}, body=b"x")
+    await cache.handle(FakeRoute(FakeRequest("https://example.com/a.js"), response))
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_evicted(cache):
+    for i in range(12):
+        response = FakeResponse(headers={"cache-control": "max-age=600"}, body=b"x" * 100)
+        await cache.handle(FakeRoute(FakeRequest(f"https://example.com/{i}.png", "image"), response))
+    stats = cache.get_stats()
+    assert stats["size"] <= 1000
+    assert stats["evicted"] == 2
+    assert cache.cache_key("https://example.com/0.png") not in cache._index